@@ -0,0 +1,37 @@
+"""Add composite (user_id, created_at, id) index to bonus_transactions
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-01-28 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema - index bonus history by user and date."""
+
+    # История бонусов читается по пользователю от новых к старым:
+    # индекс отдаёт строки уже упорядоченными, без сортировки
+    op.create_index(
+        "ix_bonus_transactions_user_id_created_at",
+        "bonus_transactions",
+        ["user_id", "created_at", "id"],
+    )
+
+    # Одиночный индекс по user_id покрывается новым составным индексом
+    op.drop_index("ix_bonus_transactions_user_id", table_name="bonus_transactions")
+
+
+def downgrade() -> None:
+    """Downgrade database schema - restore single user_id index."""
+    op.create_index("ix_bonus_transactions_user_id", "bonus_transactions", ["user_id"])
+    op.drop_index("ix_bonus_transactions_user_id_created_at", table_name="bonus_transactions")
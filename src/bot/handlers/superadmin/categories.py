@@ -17,6 +17,7 @@ from src.core.config import settings
 from src.core.logging import get_logger
 from src.database.models.user import User
 from src.database.repositories.category import CategoryRepository
+from src.services.catalog_cache import ProductCardCache
 from src.services.forum_service import ForumService
 from src.utils.cancel_handler import cancel_action_and_return_to_menu, get_cancel_keyboard
 from src.utils.navigation import edit_message_with_navigation
@@ -379,6 +380,8 @@ async def rename_category_name(
 
     if category:
         await session.commit()
+        # Название категории выводится в карточках товаров каталога
+        ProductCardCache.invalidate()
         text = f"✅ Категория переименована: {name}"
 
         keyboard = get_category_actions_keyboard(category.id)
@@ -22,6 +22,7 @@ from src.bot.states.settings import SettingsStates
 from src.core.logging import get_logger
 from src.database.models.bot_settings import BotSettings
 from src.database.models.user import User
+from src.services.settings_cache import SettingsCache
 
 logger = get_logger(__name__)
 
@@ -182,6 +183,7 @@ async def process_settings_callback(
             success_msg = "✅ Сообщение о большом заказе обновлено"
 
         await session.commit()
+        SettingsCache.invalidate()
         await state.clear()
 
         # Показываем меню уведомлений
@@ -229,6 +231,7 @@ async def process_settings_callback(
             # Переключаем состояние
             settings.bonus_enabled = not settings.bonus_enabled
             await session.commit()
+            SettingsCache.invalidate()
 
             status = "включена" if settings.bonus_enabled else "выключена"
             await callback.answer(f"✅ Бонусная система {status}")
@@ -358,6 +361,7 @@ async def process_settings_callback(
             # Переключаем состояние
             settings.show_products_without_photos = not settings.show_products_without_photos
             await session.commit()
+            SettingsCache.invalidate()
 
             status = "показывать" if settings.show_products_without_photos else "скрывать"
             await callback.answer(f"✅ Товары без фото: {status}")
@@ -412,6 +416,7 @@ async def process_bonus_purchase_percent(
         settings = await BotSettings.get_settings(session)
         settings.bonus_purchase_percent = value
         await session.commit()
+        SettingsCache.invalidate()
 
         await message.answer(
             f"✅ Процент начисления бонусов изменён на {value}%",
@@ -439,6 +444,7 @@ async def process_bonus_max_payment_percent(
         settings = await BotSettings.get_settings(session)
         settings.bonus_max_payment_percent = value
         await session.commit()
+        SettingsCache.invalidate()
 
         await message.answer(
             f"✅ Макс. процент оплаты бонусами изменён на {value}%",
@@ -466,6 +472,7 @@ async def process_bonus_min_order_amount(
         settings = await BotSettings.get_settings(session)
         settings.bonus_min_order_amount = value
         await session.commit()
+        SettingsCache.invalidate()
 
         await message.answer(
             f"✅ Мин. сумма для начисления бонусов изменена на {value} ₽",
@@ -489,6 +496,7 @@ async def process_payment_details(
     settings = await BotSettings.get_settings(session)
     settings.payment_details = value
     await session.commit()
+    SettingsCache.invalidate()
 
     await message.answer(
         "✅ Реквизиты для оплаты обновлены",
@@ -509,6 +517,7 @@ async def process_payment_instructions(
     settings = await BotSettings.get_settings(session)
     settings.payment_instructions = value
     await session.commit()
+    SettingsCache.invalidate()
 
     await message.answer(
         "✅ Инструкции по оплате обновлены",
@@ -533,6 +542,7 @@ async def process_alternative_contact(
     settings = await BotSettings.get_settings(session)
     settings.alternative_contact_username = value
     await session.commit()
+    SettingsCache.invalidate()
 
     await message.answer(
         f"✅ Альтернативный контакт обновлён: {value}",
@@ -557,6 +567,7 @@ async def process_min_order_amount(
         settings = await BotSettings.get_settings(session)
         settings.min_order_amount = value
         await session.commit()
+        SettingsCache.invalidate()
 
         await message.answer(
             f"✅ Мин. сумма заказа изменена на {value} ₽",
@@ -584,6 +595,7 @@ async def process_max_items_per_order(
         settings = await BotSettings.get_settings(session)
         settings.max_items_per_order = value
         await session.commit()
+        SettingsCache.invalidate()
 
         await message.answer(
             f"✅ Макс. товаров в заказе изменено на {value}",
@@ -611,6 +623,7 @@ async def process_max_quantity_per_item(
         settings = await BotSettings.get_settings(session)
         settings.max_quantity_per_item = value
         await session.commit()
+        SettingsCache.invalidate()
 
         await message.answer(
             f"✅ Макс. количество одного товара изменено на {value}",
@@ -773,6 +786,7 @@ async def process_products_per_page(
         settings = await BotSettings.get_settings(session)
         settings.products_per_page = value
         await session.commit()
+        SettingsCache.invalidate()
 
         await message.answer(
             f"✅ Количество товаров на странице изменено на {value}",
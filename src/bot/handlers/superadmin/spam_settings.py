@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.bot.filters.role import IsSuperAdmin
 from src.bot.keyboards.moderation import (
+    SpamPatternCallback,
     get_confirm_delete_keyboard,
     get_spam_pattern_keyboard,
     get_spam_patterns_list_keyboard,
@@ -23,6 +24,20 @@ logger = get_logger(__name__)
 
 router = Router(name="spam_settings")
 
+# Названия типов паттернов для карточки паттерна
+PATTERN_TYPE_NAMES = {
+    "keyword": "🔤 Ключевое слово",
+    "regex": "🔧 Регулярное выражение",
+    "url": "🔗 URL паттерн",
+}
+
+# Названия типов паттернов для приглашения к вводу
+PATTERN_TYPE_INPUT_NAMES = {
+    "keyword": "ключевое слово",
+    "regex": "регулярное выражение",
+    "url": "URL паттерн",
+}
+
 
 class SpamPatternStates(StatesGroup):
     """Состояния для добавления спам-паттерна."""
@@ -46,10 +61,20 @@ async def cmd_spam_patterns(
     """
     logger.info("Spam patterns list requested", admin_id=user.id)
 
-    spam_repo = SpamPatternRepository(session)
-    patterns = await spam_repo.get_active_patterns()
+    await show_spam_patterns(message, session)
+
+
+async def show_spam_patterns(message: Message, session: AsyncSession) -> None:
+    """Отправить список активных спам-паттернов.
+
+    Args:
+        message: Сообщение, в чат которого отправляется список
+        session: Сессия БД
+    """
+    spam_repo = SpamPatternRepository.for_session(session)
+    pattern_list = await spam_repo.stream_active_patterns()
 
-    if not patterns:
+    if not pattern_list:
         text = (
             "📋 <b>Спам-паттерны</b>\n\n"
             "Список паттернов пуст.\n"
@@ -60,35 +85,45 @@ async def cmd_spam_patterns(
     else:
         text = (
             f"📋 <b>Спам-паттерны</b>\n\n"
-            f"Активных паттернов: <b>{len(patterns)}</b>\n\n"
+            f"Активных паттернов: <b>{len(pattern_list)}</b>\n\n"
             f"Нажмите на паттерн для просмотра и редактирования."
         )
 
-        # Формируем список для клавиатуры
-        pattern_list = [
-            (p.id, p.pattern, p.pattern_type, p.is_active) for p in patterns
-        ]
         keyboard = get_spam_patterns_list_keyboard(pattern_list)
 
     await message.answer(text, reply_markup=keyboard, parse_mode="HTML")
 
 
-@router.callback_query(F.data.startswith("spam_view:"), IsSuperAdmin())
+@router.callback_query(SpamPatternCallback.filter(F.action == "view"), IsSuperAdmin())
 async def callback_view_pattern(
     callback: CallbackQuery,
-    user: User,
+    callback_data: SpamPatternCallback,
     session: AsyncSession,
 ) -> None:
     """Просмотр конкретного паттерна.
 
     Args:
         callback: Callback query
-        user: Супер-админ
+        callback_data: Данные callback
         session: Сессия БД
     """
-    pattern_id = int(callback.data.split(":")[1])
+    pattern_id = callback_data.pattern_id
+    await show_pattern(callback, session, pattern_id)
+
+
+async def show_pattern(
+    callback: CallbackQuery,
+    session: AsyncSession,
+    pattern_id: int,
+) -> None:
+    """Показать карточку паттерна.
 
-    spam_repo = SpamPatternRepository(session)
+    Args:
+        callback: Callback query
+        session: Сессия БД
+        pattern_id: ID паттерна
+    """
+    spam_repo = SpamPatternRepository.for_session(session)
     pattern = await spam_repo.get(pattern_id)
 
     if not pattern:
@@ -96,11 +131,7 @@ async def callback_view_pattern(
         return
 
     status = "🟢 Активен" if pattern.is_active else "🔴 Отключен"
-    type_name = {
-        "keyword": "🔤 Ключевое слово",
-        "regex": "🔧 Регулярное выражение",
-        "url": "🔗 URL паттерн",
-    }.get(pattern.pattern_type, "❓ Неизвестный тип")
+    type_name = PATTERN_TYPE_NAMES.get(pattern.pattern_type, "❓ Неизвестный тип")
 
     text = (
         f"📋 <b>Спам-паттерн #{pattern.id}</b>\n\n"
@@ -117,22 +148,22 @@ async def callback_view_pattern(
     await callback.message.edit_text(text, reply_markup=keyboard, parse_mode="HTML")
 
 
-@router.callback_query(F.data.startswith("spam_toggle:"), IsSuperAdmin())
+@router.callback_query(SpamPatternCallback.filter(F.action == "toggle"), IsSuperAdmin())
 async def callback_toggle_pattern(
     callback: CallbackQuery,
-    user: User,
+    callback_data: SpamPatternCallback,
     session: AsyncSession,
 ) -> None:
     """Включить/выключить паттерн.
 
     Args:
         callback: Callback query
-        user: Супер-админ
+        callback_data: Данные callback
         session: Сессия БД
     """
-    pattern_id = int(callback.data.split(":")[1])
+    pattern_id = callback_data.pattern_id
 
-    spam_repo = SpamPatternRepository(session)
+    spam_repo = SpamPatternRepository.for_session(session)
     pattern = await spam_repo.toggle_active(pattern_id)
 
     if not pattern:
@@ -140,30 +171,29 @@ async def callback_toggle_pattern(
         return
 
     # Сбрасываем кеш паттернов в сервисе модерации
-    moderation_service = ModerationService(session)
-    moderation_service.invalidate_patterns_cache()
+    ModerationService.invalidate_patterns_cache()
 
     status_text = "включен" if pattern.is_active else "отключен"
     await callback.answer(f"✅ Паттерн {status_text}", show_alert=True)
 
     # Обновляем сообщение
-    await callback_view_pattern(callback, user, session)
+    await show_pattern(callback, session, pattern_id)
 
 
-@router.callback_query(F.data.startswith("spam_delete:"), IsSuperAdmin())
+@router.callback_query(SpamPatternCallback.filter(F.action == "delete"), IsSuperAdmin())
 async def callback_delete_pattern(
     callback: CallbackQuery,
-    user: User,
+    callback_data: SpamPatternCallback,
     session: AsyncSession,
 ) -> None:
     """Подтверждение удаления паттерна.
 
     Args:
         callback: Callback query
-        user: Супер-админ
+        callback_data: Данные callback
         session: Сессия БД
     """
-    pattern_id = int(callback.data.split(":")[1])
+    pattern_id = callback_data.pattern_id
 
     text = "⚠️ <b>Подтверждение удаления</b>\n\nВы уверены, что хотите удалить этот паттерн?"
 
@@ -173,28 +203,33 @@ async def callback_delete_pattern(
     await callback.message.edit_text(text, reply_markup=keyboard, parse_mode="HTML")
 
 
-@router.callback_query(F.data.startswith("spam_delete_confirm:"), IsSuperAdmin())
+@router.callback_query(SpamPatternCallback.filter(F.action == "delete_confirm"), IsSuperAdmin())
 async def callback_delete_pattern_confirm(
     callback: CallbackQuery,
-    user: User,
+    callback_data: SpamPatternCallback,
     session: AsyncSession,
 ) -> None:
     """Удалить паттерн (подтверждено).
 
     Args:
         callback: Callback query
-        user: Супер-админ
+        callback_data: Данные callback
         session: Сессия БД
     """
-    pattern_id = int(callback.data.split(":")[1])
+    pattern_id = callback_data.pattern_id
 
-    spam_repo = SpamPatternRepository(session)
+    spam_repo = SpamPatternRepository.for_session(session)
     success = await spam_repo.delete(pattern_id)
 
     if success:
+        logger.info(
+            "Spam pattern deleted",
+            pattern_id=pattern_id,
+            admin_telegram_id=callback.from_user.id,
+        )
+
         # Сбрасываем кеш
-        moderation_service = ModerationService(session)
-        moderation_service.invalidate_patterns_cache()
+        ModerationService.invalidate_patterns_cache()
 
         await callback.answer("✅ Паттерн удалён", show_alert=True)
 
@@ -202,12 +237,12 @@ async def callback_delete_pattern_confirm(
         if callback.message:
             await callback.message.delete()
             # Показываем обновлённый список
-            await cmd_spam_patterns(callback.message, user, session)
+            await show_spam_patterns(callback.message, session)
     else:
         await callback.answer("❌ Ошибка при удалении", show_alert=True)
 
 
-@router.callback_query(F.data == "spam_add", IsSuperAdmin())
+@router.callback_query(SpamPatternCallback.filter(F.action == "add"), IsSuperAdmin())
 async def callback_add_pattern(
     callback: CallbackQuery,
     state: FSMContext,
@@ -230,29 +265,27 @@ async def callback_add_pattern(
 
 
 @router.callback_query(
-    F.data.startswith("spam_type:"),
+    SpamPatternCallback.filter(F.action == "type"),
     IsSuperAdmin(),
     SpamPatternStates.waiting_for_type,
 )
 async def callback_pattern_type_selected(
     callback: CallbackQuery,
+    callback_data: SpamPatternCallback,
     state: FSMContext,
 ) -> None:
     """Тип паттерна выбран.
 
     Args:
         callback: Callback query
+        callback_data: Данные callback
         state: FSM состояние
     """
-    pattern_type = callback.data.split(":")[1]
+    pattern_type = callback_data.pattern_type
 
     await state.update_data(pattern_type=pattern_type)
 
-    type_name = {
-        "keyword": "ключевое слово",
-        "regex": "регулярное выражение",
-        "url": "URL паттерн",
-    }.get(pattern_type, "паттерн")
+    type_name = PATTERN_TYPE_INPUT_NAMES.get(pattern_type, "паттерн")
 
     text = (
         f"📝 <b>Введите {type_name}</b>\n\n"
@@ -302,7 +335,7 @@ async def process_pattern_input(
             return
 
     # Сохраняем паттерн
-    spam_repo = SpamPatternRepository(session)
+    spam_repo = SpamPatternRepository.for_session(session)
 
     try:
         pattern = await spam_repo.create(
@@ -312,8 +345,7 @@ async def process_pattern_input(
         )
 
         # Сбрасываем кеш
-        moderation_service = ModerationService(session)
-        moderation_service.invalidate_patterns_cache()
+        ModerationService.invalidate_patterns_cache()
 
         await message.answer(
             f"✅ <b>Паттерн добавлен</b>\n\n"
@@ -333,21 +365,20 @@ async def process_pattern_input(
         )
 
 
-@router.callback_query(F.data == "spam_list", IsSuperAdmin())
-@router.callback_query(F.data.startswith("spam_page:"), IsSuperAdmin())
+@router.callback_query(
+    SpamPatternCallback.filter(F.action.in_({"list", "page"})), IsSuperAdmin()
+)
 async def callback_spam_list(
     callback: CallbackQuery,
-    user: User,
     session: AsyncSession,
 ) -> None:
     """Вернуться к списку паттернов или перейти на другую страницу.
 
     Args:
         callback: Callback query
-        user: Супер-админ
         session: Сессия БД
     """
     await callback.answer()
     if callback.message:
         await callback.message.delete()
-        await cmd_spam_patterns(callback.message, user, session)
+        await show_spam_patterns(callback.message, session)
@@ -9,14 +9,18 @@ from aiogram.utils.keyboard import InlineKeyboardBuilder
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.bot.filters.role import IsSuperAdmin
+from src.bot.middlewares.concurrency import HeavyTaskMiddleware
 from src.core.logging import get_logger
-from src.services.monitoring_service import MonitoringService
+from src.services.monitoring_service import MonitoringService, PeriodStats, SystemStats
 from src.utils.navigation import edit_message_with_navigation
 
 logger = get_logger(__name__)
 
 router = Router(name="superadmin_stats")
 
+# Агрегации статистики выполняются с ограниченной параллельностью
+router.callback_query.middleware(HeavyTaskMiddleware(limit=2))
+
 
 def get_stats_menu_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура меню статистики."""
@@ -61,49 +65,49 @@ def get_stats_menu_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
-def format_general_stats(stats: dict) -> str:
+def format_general_stats(stats: SystemStats) -> str:
     """Форматировать общую статистику.
 
     Args:
-        stats: Словарь со статистикой
+        stats: Общая статистика системы
 
     Returns:
         Отформатированная строка
     """
-    users = stats.get("users", {})
-    orders = stats.get("orders", {})
-    products = stats.get("products", {})
-    broadcasts = stats.get("broadcasts", {})
-    reviews = stats.get("reviews", {})
+    users = stats.users
+    orders = stats.orders
+    products = stats.products
+    broadcasts = stats.broadcasts
+    reviews = stats.reviews
 
     text = "📊 <b>Общая статистика системы</b>\n\n"
 
     # Пользователи
     text += "👥 <b>Пользователи:</b>\n"
-    text += f"• Всего: {users.get('total', 0)}\n"
-    text += f"• Активны (24ч): {users.get('active_24h', 0)}\n"
-    text += f"• Активны (7д): {users.get('active_7d', 0)}\n"
-    text += f"• Новых (24ч): {users.get('new_24h', 0)}\n"
-    text += f"• Новых (7д): {users.get('new_7d', 0)}\n"
+    text += f"• Всего: {users.total}\n"
+    text += f"• Активны (24ч): {users.active_24h}\n"
+    text += f"• Активны (7д): {users.active_7d}\n"
+    text += f"• Новых (24ч): {users.new_24h}\n"
+    text += f"• Новых (7д): {users.new_7d}\n"
 
     # Роли
-    by_role = users.get("by_role", {})
+    by_role = users.by_role
     if by_role:
         text += f"\nПо ролям:\n"
         for role, count in by_role.items():
             text += f"  - {role}: {count}\n"
 
-    text += f"\n• Заблокировано: {users.get('banned', 0)}\n"
+    text += f"\n• Заблокировано: {users.banned}\n"
 
     # Заказы
     text += "\n📦 <b>Заказы:</b>\n"
-    text += f"• Всего: {orders.get('total', 0)}\n"
-    text += f"• Новых (24ч): {orders.get('new_24h', 0)}\n"
-    text += f"• Новых (7д): {orders.get('new_7d', 0)}\n"
-    text += f"• Конверсия: {orders.get('conversion_rate', 0)}%\n"
+    text += f"• Всего: {orders.total}\n"
+    text += f"• Новых (24ч): {orders.new_24h}\n"
+    text += f"• Новых (7д): {orders.new_7d}\n"
+    text += f"• Конверсия: {orders.conversion_rate}%\n"
 
     # По статусам
-    by_status = orders.get("by_status", {})
+    by_status = orders.by_status
     if by_status:
         text += f"\nПо статусам:\n"
         status_names = {
@@ -120,25 +124,25 @@ def format_general_stats(stats: dict) -> str:
 
     # Товары
     text += "\n🛍 <b>Товары:</b>\n"
-    text += f"• Всего: {products.get('total', 0)}\n"
-    text += f"• Активных: {products.get('active', 0)}\n"
-    text += f"• Неактивных: {products.get('inactive', 0)}\n"
-    text += f"• Без категории: {products.get('no_category', 0)}\n"
+    text += f"• Всего: {products.total}\n"
+    text += f"• Активных: {products.active}\n"
+    text += f"• Неактивных: {products.inactive}\n"
+    text += f"• Без категории: {products.no_category}\n"
 
     # Рассылки
     text += "\n📢 <b>Рассылки:</b>\n"
-    text += f"• Всего: {broadcasts.get('total', 0)}\n"
-    text += f"• Отправлено сообщений: {broadcasts.get('total_sent', 0)}\n"
-    text += f"• Доставлено: {broadcasts.get('total_success', 0)}\n"
-    text += f"• Ошибок: {broadcasts.get('total_failed', 0)}\n"
-    text += f"• Success rate: {broadcasts.get('success_rate', 0)}%\n"
+    text += f"• Всего: {broadcasts.total}\n"
+    text += f"• Отправлено сообщений: {broadcasts.total_sent}\n"
+    text += f"• Доставлено: {broadcasts.total_success}\n"
+    text += f"• Ошибок: {broadcasts.total_failed}\n"
+    text += f"• Success rate: {broadcasts.success_rate}%\n"
 
     # Отзывы
     text += "\n⭐ <b>Отзывы:</b>\n"
-    text += f"• Всего: {reviews.get('total', 0)}\n"
-    text += f"• Одобрено: {reviews.get('approved', 0)}\n"
-    text += f"• Отклонено: {reviews.get('rejected', 0)}\n"
-    text += f"• На модерации: {reviews.get('pending', 0)}\n"
+    text += f"• Всего: {reviews.total}\n"
+    text += f"• Одобрено: {reviews.approved}\n"
+    text += f"• Отклонено: {reviews.rejected}\n"
+    text += f"• На модерации: {reviews.pending}\n"
 
     # Timestamp
     text += f"\n🕒 Обновлено: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC"
@@ -146,38 +150,38 @@ def format_general_stats(stats: dict) -> str:
     return text
 
 
-def format_period_stats(stats: dict, period_name: str) -> str:
+def format_period_stats(stats: PeriodStats, period_name: str) -> str:
     """Форматировать статистику за период.
 
     Args:
-        stats: Словарь со статистикой
+        stats: Статистика за период
         period_name: Название периода
 
     Returns:
         Отформатированная строка
     """
-    period = stats.get("period", {})
-    users = stats.get("users", {})
-    orders = stats.get("orders", {})
-    products = stats.get("products", {})
-    broadcasts = stats.get("broadcasts", {})
+    period = stats.period
+    users = stats.users
+    orders = stats.orders
+    products = stats.products
+    broadcasts = stats.broadcasts
 
     text = f"📅 <b>Статистика за {period_name}</b>\n\n"
-    text += f"Период: {period.get('start', '')} - {period.get('end', '')}\n"
-    text += f"Дней: {period.get('days', 0)}\n\n"
+    text += f"Период: {period.start} - {period.end}\n"
+    text += f"Дней: {period.days}\n\n"
 
     # Пользователи
     text += "👥 <b>Пользователи:</b>\n"
-    text += f"• Новых: {users.get('new', 0)}\n"
-    text += f"• Активных: {users.get('active', 0)}\n\n"
+    text += f"• Новых: {users.new}\n"
+    text += f"• Активных: {users.active}\n\n"
 
     # Заказы
     text += "📦 <b>Заказы:</b>\n"
-    text += f"• Новых: {orders.get('new', 0)}\n"
-    text += f"• Выполнено: {orders.get('completed', 0)}\n"
+    text += f"• Новых: {orders.new}\n"
+    text += f"• Выполнено: {orders.completed}\n"
 
     # По статусам
-    by_status = orders.get("by_status", {})
+    by_status = orders.by_status
     if by_status:
         text += f"\nПо статусам:\n"
         status_names = {
@@ -194,13 +198,13 @@ def format_period_stats(stats: dict, period_name: str) -> str:
 
     # Товары
     text += "\n🛍 <b>Товары:</b>\n"
-    text += f"• Новых: {products.get('new', 0)}\n\n"
+    text += f"• Новых: {products.new}\n\n"
 
     # Рассылки
     text += "📢 <b>Рассылки:</b>\n"
-    text += f"• Новых: {broadcasts.get('new', 0)}\n"
-    text += f"• Отправлено: {broadcasts.get('sent', 0)}\n"
-    text += f"• Доставлено: {broadcasts.get('success', 0)}\n"
+    text += f"• Новых: {broadcasts.new}\n"
+    text += f"• Отправлено: {broadcasts.sent}\n"
+    text += f"• Доставлено: {broadcasts.success}\n"
 
     return text
 
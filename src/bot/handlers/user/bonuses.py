@@ -1,128 +1,163 @@
 """Хендлеры для работы с бонусной системой пользователя."""
 
+import asyncio
+
 from aiogram import F, Router
 from aiogram.fsm.context import FSMContext
-from aiogram.types import CallbackQuery, InlineKeyboardButton, Message
-from aiogram.utils.keyboard import InlineKeyboardBuilder
+from aiogram.fsm.state import State, StatesGroup
+from aiogram.types import CallbackQuery, InlineKeyboardButton, InlineKeyboardMarkup, Message
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.logging import get_logger
-from src.database.models.bot_settings import BotSettings
 from src.database.models.user import User
 from src.services.bonus_service import BonusService
+from src.services.settings_cache import SettingsCache
 
 logger = get_logger(__name__)
 
 router = Router(name="user_bonuses")
 
+# Обозначения типов бонусных операций
+TRANSACTION_TYPE_EMOJI = {
+    "purchase": "🛍",
+    "promocode": "🎟",
+    "admin_grant": "👨‍💼",
+    "payment": "💳",
+    "refund": "↩️",
+}
+
+TRANSACTION_TYPE_NAMES = {
+    "purchase": "Покупка",
+    "promocode": "Промокод",
+    "admin_grant": "Начисление",
+    "payment": "Оплата",
+    "refund": "Возврат",
+}
+
+# Статические клавиатуры раздела бонусов (собираются один раз при импорте)
+BONUSES_KEYBOARD = InlineKeyboardMarkup(
+    inline_keyboard=[
+        [
+            InlineKeyboardButton(
+                text="🎟 Активировать промокод",
+                callback_data="user:bonuses:activate_promocode",
+            )
+        ],
+        [InlineKeyboardButton(text="📜 История операций", callback_data="user:bonuses:history")],
+        [InlineKeyboardButton(text="◀️ Назад", callback_data="back_to_menu")],
+    ]
+)
 
-@router.callback_query(F.data == "user:bonuses")
-async def show_bonuses(
-    callback: CallbackQuery,
-    user: User,
+PROMOCODE_CANCEL_KEYBOARD = InlineKeyboardMarkup(
+    inline_keyboard=[[InlineKeyboardButton(text="❌ Отмена", callback_data="user:bonuses")]]
+)
+
+BONUS_HISTORY_KEYBOARD = InlineKeyboardMarkup(
+    inline_keyboard=[[InlineKeyboardButton(text="◀️ Назад", callback_data="user:bonuses")]]
+)
+
+
+class BonusStates(StatesGroup):
+    """Состояния для работы с бонусами."""
+
+    ENTER_PROMOCODE = State()
+
+
+async def render_bonuses_view(
     session: AsyncSession,
-    state: FSMContext,
-) -> None:
-    """Показать информацию о бонусах пользователя.
+    user: User,
+) -> tuple[str, InlineKeyboardMarkup]:
+    """Сформировать экран бонусов пользователя.
 
     Args:
-        callback: Callback query
-        user: Пользователь из БД
         session: Сессия БД
-        state: FSM контекст
-    """
-    logger.info("User bonuses view", user_id=user.id)
-
-    # Очищаем состояние
-    await state.clear()
-
-    # Получаем настройки
-    settings = await BotSettings.get_settings(session)
+        user: Пользователь из БД
 
-    # Проверяем, включена ли бонусная система
-    if not settings.bonus_enabled:
-        await callback.answer(
-            "⚠️ Бонусная система временно недоступна",
-            show_alert=True,
-        )
-        return
+    Returns:
+        Кортеж (текст сообщения, клавиатура)
+    """
+    settings = await SettingsCache.get_bot_settings(session)
 
-    # Получаем информацию о бонусах
+    # Получаем баланс и последние транзакции одним запросом
     bonus_service = BonusService(session)
-    balance = await bonus_service.get_user_bonus_balance(user.id)
-
-    # Получаем последние транзакции
-    transactions = await bonus_service.get_user_transactions(user.id, limit=5)
+    balance, transactions = await bonus_service.get_balance_and_recent(user.id, limit=5)
 
     # Формируем сообщение
-    text = (
+    parts = [
         "🎁 <b>Ваши бонусы</b>\n\n"
         f"💰 Баланс: <b>{balance} бонусов</b>\n\n"
         "━━━━━━━━━━━━━━━━━━━━\n\n"
         f"📊 Начисление: <b>{settings.bonus_purchase_percent}%</b> от суммы заказа\n"
         f"💳 Можно оплатить до <b>{settings.bonus_max_payment_percent}%</b> заказа\n"
         f"🛒 Минимальная сумма: <b>{settings.bonus_min_order_amount} ₽</b>\n\n"
-    )
+    ]
 
     if transactions:
-        text += "📜 <b>Последние операции:</b>\n\n"
+        parts.append("📜 <b>Последние операции:</b>\n\n")
         for tx in transactions:
-            # Форматируем тип операции
-            type_emoji = {
-                "purchase": "🛍",
-                "promocode": "🎟",
-                "admin_grant": "👨‍💼",
-                "payment": "💳",
-                "refund": "↩️",
-            }.get(tx.transaction_type, "•")
+            type_emoji = TRANSACTION_TYPE_EMOJI.get(tx.transaction_type, "•")
 
             # Форматируем сумму
             amount_str = f"+{tx.amount}" if tx.amount > 0 else str(tx.amount)
 
-            text += (
+            parts.append(
                 f"{type_emoji} <code>{amount_str}</code> "
                 f"(баланс: {tx.balance_after})\n"
             )
             if tx.description:
-                text += f"   <i>{tx.description}</i>\n"
+                parts.append(f"   <i>{tx.description}</i>\n")
 
-        text += "\n"
+        parts.append("\n")
     else:
-        text += "📜 <i>Пока нет операций с бонусами</i>\n\n"
+        parts.append("📜 <i>Пока нет операций с бонусами</i>\n\n")
 
-    text += "💡 <i>Бонусы начисляются автоматически после оплаты заказа</i>"
+    parts.append("💡 <i>Бонусы начисляются автоматически после оплаты заказа</i>")
+    return "".join(parts), BONUSES_KEYBOARD
 
-    # Создаём клавиатуру
-    builder = InlineKeyboardBuilder()
 
-    builder.row(
-        InlineKeyboardButton(
-            text="🎟 Активировать промокод",
-            callback_data="user:bonuses:activate_promocode",
-        )
-    )
+@router.callback_query(F.data == "user:bonuses")
+async def show_bonuses(
+    callback: CallbackQuery,
+    user: User,
+    session: AsyncSession,
+    state: FSMContext,
+) -> None:
+    """Показать информацию о бонусах пользователя.
 
-    builder.row(
-        InlineKeyboardButton(
-            text="📜 История операций",
-            callback_data="user:bonuses:history",
-        )
-    )
+    Args:
+        callback: Callback query
+        user: Пользователь из БД
+        session: Сессия БД
+        state: FSM контекст
+    """
+    logger.info("User bonuses view", user_id=user.id)
+
+    # Очищаем состояние
+    await state.clear()
 
-    builder.row(
-        InlineKeyboardButton(
-            text="◀️ Назад",
-            callback_data="back_to_menu",
+    # Получаем настройки
+    settings = await SettingsCache.get_bot_settings(session)
+
+    # Проверяем, включена ли бонусная система
+    if not settings.bonus_enabled:
+        await callback.answer(
+            "⚠️ Бонусная система временно недоступна",
+            show_alert=True,
         )
-    )
+        return
+
+    text, keyboard = await render_bonuses_view(session, user)
 
     if callback.message:
-        await callback.message.edit_text(
-            text=text,
-            reply_markup=builder.as_markup(),
-            parse_mode="HTML",
+        await asyncio.gather(
+            callback.message.edit_text(
+                text=text,
+                reply_markup=keyboard,
+            ),
+            callback.answer(),
         )
-    await callback.answer()
+    else:
+        await callback.answer()
 
 
 @router.callback_query(F.data == "user:bonuses:activate_promocode")
@@ -136,12 +171,6 @@ async def start_promocode_activation(
         callback: Callback query
         state: FSM контекст
     """
-    from aiogram.fsm.state import State, StatesGroup
-
-    class BonusStates(StatesGroup):
-        """Состояния для работы с бонусами."""
-        ENTER_PROMOCODE = State()
-
     await state.set_state(BonusStates.ENTER_PROMOCODE)
 
     text = (
@@ -149,24 +178,19 @@ async def start_promocode_activation(
         "Введите промокод для активации:"
     )
 
-    builder = InlineKeyboardBuilder()
-    builder.row(
-        InlineKeyboardButton(
-            text="❌ Отмена",
-            callback_data="user:bonuses",
-        )
-    )
-
     if callback.message:
-        await callback.message.edit_text(
-            text=text,
-            reply_markup=builder.as_markup(),
-            parse_mode="HTML",
+        await asyncio.gather(
+            callback.message.edit_text(
+                text=text,
+                reply_markup=PROMOCODE_CANCEL_KEYBOARD,
+            ),
+            callback.answer(),
         )
-    await callback.answer()
+    else:
+        await callback.answer()
 
 
-@router.message(F.text)
+@router.message(BonusStates.ENTER_PROMOCODE, F.text)
 async def process_promocode(
     message: Message,
     user: User,
@@ -181,11 +205,6 @@ async def process_promocode(
         session: Сессия БД
         state: FSM контекст
     """
-    # Проверяем состояние
-    current_state = await state.get_state()
-    if not current_state or "ENTER_PROMOCODE" not in current_state:
-        return
-
     code = message.text.strip().upper()
 
     try:
@@ -194,32 +213,22 @@ async def process_promocode(
 
         await session.commit()
 
-        await message.answer(
-            f"✅ <b>Промокод активирован!</b>\n\n"
-            f"🎁 Начислено: <b>{promocode.bonus_amount} бонусов</b>\n"
-            f"💰 Новый баланс: <b>{transaction.balance_after} бонусов</b>",
-            parse_mode="HTML",
-        )
-
-        # Возвращаемся к просмотру бонусов
+        # Возвращаемся к просмотру бонусов одним сообщением
         await state.clear()
 
-        # Создаем фейковый callback для вызова show_bonuses
-        fake_callback = type('obj', (object,), {
-            'data': 'user:bonuses',
-            'from_user': message.from_user,
-            'message': message,
-            'bot': message.bot,
-            'answer': lambda text="", show_alert=False: message.answer(text) if text else None,
-        })()
+        text, keyboard = await render_bonuses_view(session, user)
 
-        await show_bonuses(fake_callback, user, session, state)
+        await message.answer(
+            f"✅ <b>Промокод активирован!</b>\n"
+            f"🎁 Начислено: <b>{promocode.bonus_amount} бонусов</b>\n\n"
+            f"{text}",
+            reply_markup=keyboard,
+        )
 
     except ValueError as e:
         await message.answer(
             f"❌ <b>Ошибка активации промокода</b>\n\n"
             f"{str(e)}",
-            parse_mode="HTML",
         )
 
 
@@ -247,43 +256,31 @@ async def show_bonus_history(
             "У вас пока нет операций с бонусами"
         )
     else:
-        text = "📜 <b>История бонусов</b>\n\n"
+        parts = ["📜 <b>История бонусов</b>\n\n"]
 
         for tx in transactions:
             # Форматируем дату
             date_str = tx.created_at.strftime("%d.%m.%Y %H:%M")
 
-            # Форматируем тип операции
-            type_names = {
-                "purchase": "Покупка",
-                "promocode": "Промокод",
-                "admin_grant": "Начисление",
-                "payment": "Оплата",
-                "refund": "Возврат",
-            }
-            type_name = type_names.get(tx.transaction_type, tx.transaction_type)
+            type_name = TRANSACTION_TYPE_NAMES.get(tx.transaction_type, tx.transaction_type)
 
             # Форматируем сумму
             amount_str = f"+{tx.amount}" if tx.amount > 0 else str(tx.amount)
 
-            text += f"<b>{date_str}</b>\n"
-            text += f"{type_name}: <code>{amount_str}</code>\n"
+            parts.append(f"<b>{date_str}</b>\n{type_name}: <code>{amount_str}</code>\n")
             if tx.description:
-                text += f"<i>{tx.description}</i>\n"
-            text += f"Баланс после: {tx.balance_after}\n\n"
-
-    builder = InlineKeyboardBuilder()
-    builder.row(
-        InlineKeyboardButton(
-            text="◀️ Назад",
-            callback_data="user:bonuses",
-        )
-    )
+                parts.append(f"<i>{tx.description}</i>\n")
+            parts.append(f"Баланс после: {tx.balance_after}\n\n")
+
+        text = "".join(parts)
 
     if callback.message:
-        await callback.message.edit_text(
-            text=text,
-            reply_markup=builder.as_markup(),
-            parse_mode="HTML",
+        await asyncio.gather(
+            callback.message.edit_text(
+                text=text,
+                reply_markup=BONUS_HISTORY_KEYBOARD,
+            ),
+            callback.answer(),
         )
-    await callback.answer()
+    else:
+        await callback.answer()
@@ -1,29 +1,55 @@
 """Обработчики корзины покупок."""
 
-from decimal import Decimal
+import asyncio
+from decimal import ROUND_DOWN, Decimal
+from typing import Any
 
 from aiogram import F, Router
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
-from aiogram.types import CallbackQuery, Message, ReplyKeyboardRemove
+from aiogram.types import (
+    CallbackQuery,
+    InlineKeyboardButton,
+    InlineKeyboardMarkup,
+    Message,
+    ReplyKeyboardRemove,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.bot.keyboards.cart import (
+    CartAddCb,
+    CartItemCb,
+    CartQtyCb,
+    CartRemoveCb,
+    QuickOrderCb,
+    get_cart_added_keyboard,
     get_cart_clear_confirm_keyboard,
     get_cart_item_keyboard,
     get_cart_view_keyboard,
+    get_use_bonuses_keyboard,
 )
 from src.bot.keyboards.orders import get_contact_request_keyboard, get_order_completed_keyboard
-from src.core.logging import get_logger
+from src.core.logging import TracebackThrottle, get_logger
+from src.database.models.cart import CartItem
 from src.database.models.user import User
-from src.services.cart_service import CartService
+from src.services.cart_service import CartLine, CartService
 from src.services.notification_service import NotificationService
 from src.services.order_service import OrderService
+from src.services.product_service import ProductService
+from src.services.settings_cache import SettingsCache
+from src.utils.formatters import format_price
+from src.utils.validators import validate_contact
 
 logger = get_logger(__name__)
 
 router = Router(name="user_cart")
 
+# Полный traceback ошибок создания заказа - не чаще раза в секунду
+ORDER_TRACEBACK_THROTTLE = TracebackThrottle()
+
+# Пользователи, для которых сейчас создаётся заказ (защита от двойного нажатия)
+ORDERS_IN_PROGRESS: set[int] = set()
+
 
 class CheckoutStates(StatesGroup):
     """Состояния оформления заказа из корзины."""
@@ -43,23 +69,72 @@ class QuickOrderStates(StatesGroup):
     CONFIRM = State()
 
 
-@router.callback_query(F.data == "cart_view")
-async def show_cart(
-    callback: CallbackQuery,
-    session: AsyncSession,
-    user: User,
-) -> None:
-    """Показать содержимое корзины.
+# Статические клавиатуры (собираются один раз при импорте модуля)
+CART_ADDED_KEYBOARD = get_cart_added_keyboard()
+CART_CLEAR_CONFIRM_KEYBOARD = get_cart_clear_confirm_keyboard()
+CONTACT_REQUEST_KEYBOARD = get_contact_request_keyboard()
+ORDER_COMPLETED_KEYBOARD = get_order_completed_keyboard()
+
+CONFIRM_CONTACT_KEYBOARD = InlineKeyboardMarkup(
+    inline_keyboard=[
+        [InlineKeyboardButton(text="✅ Да, всё верно", callback_data="confirm_contact_yes")],
+        [InlineKeyboardButton(text="✏️ Изменить", callback_data="confirm_contact_no")],
+    ]
+)
+
+CHECKOUT_CONFIRM_KEYBOARD = InlineKeyboardMarkup(
+    inline_keyboard=[
+        [InlineKeyboardButton(text="✅ Подтвердить заказ", callback_data="checkout_confirm")],
+        [InlineKeyboardButton(text="❌ Отменить", callback_data="checkout_cancel")],
+    ]
+)
+
+CHECKOUT_CANCELLED_KEYBOARD = InlineKeyboardMarkup(
+    inline_keyboard=[
+        [InlineKeyboardButton(text="🛒 Вернуться в корзину", callback_data="cart_view")],
+        [InlineKeyboardButton(text="📦 Продолжить покупки", callback_data="catalog")],
+    ]
+)
+
+QUICK_ORDER_CONFIRM_KEYBOARD = InlineKeyboardMarkup(
+    inline_keyboard=[
+        [InlineKeyboardButton(text="✅ Подтвердить заказ", callback_data="quick_order_confirm")],
+        [InlineKeyboardButton(text="❌ Отменить", callback_data="quick_order_cancel")],
+    ]
+)
+
+QUICK_ORDER_CANCELLED_KEYBOARD = InlineKeyboardMarkup(
+    inline_keyboard=[
+        [InlineKeyboardButton(text="📦 Вернуться в каталог", callback_data="catalog")],
+        [InlineKeyboardButton(text="🛒 Корзина", callback_data="cart_view")],
+    ]
+)
+
+QUICK_ORDER_CANCELLED_TEXT = (
+    "❌ <b>Заказ отменён</b>\n\n"
+    "Вы можете продолжить покупки."
+)
+
+CONTACT_PROMPT_TEXT = (
+    "✏️ <b>Ввод контакта</b>\n\n"
+    "Введите ваш контакт для связи:\n"
+    "• Телефон: +79001234567\n"
+    "• Username: @username\n"
+    "• Email: email@example.com\n\n"
+    "Или нажмите /cancel для отмены"
+)
+
+
+def render_cart_view(cart_lines: list[CartLine]) -> tuple[str, InlineKeyboardMarkup]:
+    """Сформировать текст и клавиатуру корзины по уже загруженным строкам.
 
     Args:
-        callback: CallbackQuery
-        session: Сессия БД
-        user: Пользователь
-    """
-    cart_service = CartService(session)
-    cart_items = await cart_service.get_cart_items(user.id)
+        cart_lines: Строки корзины
 
-    if not cart_items:
+    Returns:
+        Текст сообщения и клавиатура
+    """
+    if not cart_lines:
         text = (
             "🛒 <b>Корзина пуста</b>\n\n"
             "Добавьте товары из каталога!"
@@ -69,95 +144,133 @@ async def show_cart(
         total_price = Decimal("0")
         total_items = 0
 
-        text = "🛒 <b>Ваша корзина</b>\n\n"
+        parts = ["🛒 <b>Ваша корзина</b>\n\n"]
 
-        for i, item in enumerate(cart_items, 1):
-            product = item.product
-            item_price = product.price * item.quantity if product else Decimal("0")
+        for i, item in enumerate(cart_lines, 1):
+            item_price = item.total_price
             total_price += item_price
             total_items += item.quantity
 
-            text += f"{i}. <b>{item.display_name}</b>\n"
-            if product:
-                text += f"   💰 {product.formatted_price} × {item.quantity} = {item_price:,.2f} ₽\n"
-            text += "\n"
-
-        text += f"━━━━━━━━━━━━━━━━\n"
-        text += f"📦 Всего товаров: {total_items} шт.\n"
-        text += f"💰 <b>Итого: {total_price:,.2f} ₽</b>"
-
-    keyboard = get_cart_view_keyboard(cart_items)
+            parts.append(
+                f"{i}. <b>{item.display_name}</b>\n"
+                f"   💰 {item.formatted_price} × {item.quantity} = {item_price:,.2f} ₽\n\n"
+            )
 
-    await callback.message.edit_text(
-        text=text,
-        reply_markup=keyboard,
-        parse_mode="HTML",
-    )
-    await callback.answer()
+        parts.append(
+            "━━━━━━━━━━━━━━━━\n"
+            f"📦 Всего товаров: {total_items} шт.\n"
+            f"💰 <b>Итого: {total_price:,.2f} ₽</b>"
+        )
+        text = "".join(parts)
 
-    logger.info(
-        "Cart viewed",
-        user_id=user.id,
-        items_count=len(cart_items),
-    )
+    return text, get_cart_view_keyboard(cart_lines)
 
 
-@router.callback_query(F.data.startswith("cart_item:"))
-async def show_cart_item(
+@router.callback_query(F.data == "cart_view")
+async def show_cart(
     callback: CallbackQuery,
     session: AsyncSession,
     user: User,
 ) -> None:
-    """Показать детали товара в корзине.
+    """Показать содержимое корзины.
 
     Args:
         callback: CallbackQuery
         session: Сессия БД
         user: Пользователь
     """
-    cart_item_id = int(callback.data.split(":")[1])
-
+    # Строки корзины берём из кэша: повторные переходы "назад в корзину"
+    # не обращаются к БД, пока корзина не изменилась
     cart_service = CartService(session)
-    cart_items = await cart_service.get_cart_items(user.id)
+    cart_lines = await cart_service.get_cart_lines(user.id)
+    text, keyboard = render_cart_view(cart_lines)
+
+    # Корзина уже показана в этом сообщении (повторное нажатие) - запрос
+    # на редактирование не нужен, Telegram всё равно ответил бы ошибкой
+    # "message is not modified"
+    if (
+        callback.message.html_text == text
+        and callback.message.reply_markup == keyboard
+    ):
+        await callback.answer()
+    else:
+        await asyncio.gather(
+            callback.message.edit_text(
+                text=text,
+                reply_markup=keyboard,
+            ),
+            callback.answer(),
+        )
 
-    # Находим нужный товар
-    cart_item = next((item for item in cart_items if item.id == cart_item_id), None)
+    logger.info(
+        "Cart viewed",
+        user_id=user.id,
+        items_count=len(cart_lines),
+    )
 
-    if not cart_item:
-        await callback.answer("❌ Товар не найден в корзине", show_alert=True)
-        return
 
+def format_cart_item_text(cart_item: CartItem) -> str:
+    """Сформировать описание товара в корзине.
+
+    Args:
+        cart_item: Товар в корзине (с загруженным продуктом)
+
+    Returns:
+        Текст карточки товара
+    """
     product = cart_item.product
-    if not product:
-        await callback.answer("❌ Товар не найден", show_alert=True)
-        return
 
-    # Формируем описание
     text = (
         f"📦 <b>{cart_item.display_name}</b>\n\n"
         f"💰 Цена: {product.formatted_price}\n"
         f"🔢 Количество: {cart_item.quantity} шт.\n"
-        f"💵 Сумма: {(product.price * cart_item.quantity):,.2f} ₽\n\n"
+        f"💵 Сумма: {cart_item.formatted_total_price}\n\n"
     )
 
     if product.description:
         text += f"📝 {product.description}\n\n"
 
-    text += "Выберите действие:"
+    return text + "Выберите действие:"
+
+
+@router.callback_query(CartItemCb.filter())
+async def show_cart_item(
+    callback: CallbackQuery,
+    callback_data: CartItemCb,
+    session: AsyncSession,
+    user: User,
+) -> None:
+    """Показать детали товара в корзине.
+
+    Args:
+        callback: CallbackQuery
+        callback_data: Данные callback
+        session: Сессия БД
+        user: Пользователь
+    """
+    cart_service = CartService(session)
+    cart_item = await cart_service.get_cart_item(user.id, callback_data.item_id)
+
+    if not cart_item:
+        await callback.answer("❌ Товар не найден в корзине", show_alert=True)
+        return
 
+    text = format_cart_item_text(cart_item)
     keyboard = get_cart_item_keyboard(cart_item.id, cart_item.quantity)
 
-    await callback.message.edit_text(
-        text=text,
-        reply_markup=keyboard,
-        parse_mode="HTML",
+    await asyncio.gather(
+        callback.message.edit_text(
+            text=text,
+            reply_markup=keyboard,
+        ),
+        callback.answer(),
     )
-    await callback.answer()
 
 
-@router.callback_query(F.data.startswith("cart_qty:"))
+@router.callback_query(CartQtyCb.filter())
 async def update_cart_item_quantity(
     callback: CallbackQuery,
+    callback_data: CartQtyCb,
     session: AsyncSession,
     user: User,
 ) -> None:
@@ -165,70 +278,61 @@ async def update_cart_item_quantity(
 
     Args:
         callback: CallbackQuery
+        callback_data: Данные callback
         session: Сессия БД
         user: Пользователь
     """
-    parts = callback.data.split(":")
-    cart_item_id = int(parts[1])
-    action = parts[2]  # "plus" или "minus"
+    delta = 1 if callback_data.action == "plus" else -1  # "plus" или "minus"
 
+    # Изменяем количество одним атомарным запросом; снимок корзины из кэша
+    # берём до изменения - изменение сбрасывает кэш
     cart_service = CartService(session)
-    cart_items = await cart_service.get_cart_items(user.id)
-
-    # Находим товар
-    cart_item = next((item for item in cart_items if item.id == cart_item_id), None)
-
-    if not cart_item:
-        await callback.answer("❌ Товар не найден в корзине", show_alert=True)
-        return
-
-    # Изменяем количество
-    new_quantity = cart_item.quantity
-    if action == "plus":
-        new_quantity += 1
-    elif action == "minus":
-        new_quantity -= 1
-
-    # Обновляем количество
-    updated_item = await cart_service.update_quantity(user.id, cart_item_id, new_quantity)
+    lines_before = cart_service.get_cached_lines(user.id)
+    updated_item, removed_id = await cart_service.adjust_quantity(
+        user.id, callback_data.item_id, delta
+    )
+    # Фиксируем до обращений к Telegram: ошибка edit_text не должна откатить
+    # изменение, а соединение и блокировки не держатся на время HTTP-запросов
     await session.commit()
 
     if not updated_item:
-        # Товар был удален (количество стало 0)
-        await callback.answer("🗑 Товар удален из корзины")
-        # Возвращаемся к просмотру корзины
-        callback.data = "cart_view"
-        await show_cart(callback, session, user)
+        # Товар был удален (количество стало 0) или его уже нет в корзине -
+        # возвращаемся к просмотру корзины без повторной загрузки
+        cart_lines = await cart_service.get_lines_after_removal(user.id, lines_before, removed_id)
+        text, keyboard = render_cart_view(cart_lines)
+        await asyncio.gather(
+            callback.message.edit_text(text=text, reply_markup=keyboard),
+            callback.answer("🗑 Товар удален из корзины"),
+        )
         return
 
     # Обновляем отображение
-    product = updated_item.product
-
-    text = (
-        f"📦 <b>{updated_item.display_name}</b>\n\n"
-        f"💰 Цена: {product.formatted_price}\n"
-        f"🔢 Количество: {updated_item.quantity} шт.\n"
-        f"💵 Сумма: {(product.price * updated_item.quantity):,.2f} ₽\n\n"
-    )
-
-    if product.description:
-        text += f"📝 {product.description}\n\n"
-
-    text += "Выберите действие:"
-
+    text = format_cart_item_text(updated_item)
     keyboard = get_cart_item_keyboard(updated_item.id, updated_item.quantity)
+    answer_text = f"✓ Количество: {updated_item.quantity}"
+
+    # При повторных нажатиях сообщение может уже содержать этот текст —
+    # Telegram ответит ошибкой "message is not modified", запрос не нужен
+    if (
+        callback.message.html_text == text
+        and callback.message.reply_markup == keyboard
+    ):
+        await callback.answer(answer_text)
+        return
 
-    await callback.message.edit_text(
-        text=text,
-        reply_markup=keyboard,
-        parse_mode="HTML",
+    await asyncio.gather(
+        callback.message.edit_text(
+            text=text,
+            reply_markup=keyboard,
+        ),
+        callback.answer(answer_text),
     )
-    await callback.answer(f"✓ Количество: {updated_item.quantity}")
 
 
-@router.callback_query(F.data.startswith("cart_remove:"))
+@router.callback_query(CartRemoveCb.filter())
 async def remove_cart_item(
     callback: CallbackQuery,
+    callback_data: CartRemoveCb,
     session: AsyncSession,
     user: User,
 ) -> None:
@@ -236,23 +340,27 @@ async def remove_cart_item(
 
     Args:
         callback: CallbackQuery
+        callback_data: Данные callback
         session: Сессия БД
         user: Пользователь
     """
-    cart_item_id = int(callback.data.split(":")[1])
-
+    # Снимок корзины из кэша берём до удаления - удаление сбрасывает кэш
     cart_service = CartService(session)
-    success = await cart_service.remove_item(user.id, cart_item_id)
+    lines_before = cart_service.get_cached_lines(user.id)
+    removed_id = await cart_service.remove_item(user.id, callback_data.item_id)
     await session.commit()
 
-    if success:
-        await callback.answer("✓ Товар удален из корзины")
-    else:
-        await callback.answer("❌ Товар не найден", show_alert=True)
+    # Показываем корзину без удалённой строки; на callback отвечаем
+    # один раз - вместе с обновлением
+    cart_lines = await cart_service.get_lines_after_removal(user.id, lines_before, removed_id)
+    text, keyboard = render_cart_view(cart_lines)
 
-    # Показываем корзину
-    callback.data = "cart_view"
-    await show_cart(callback, session, user)
+    await asyncio.gather(
+        callback.message.edit_text(text=text, reply_markup=keyboard),
+        callback.answer("✓ Товар удален из корзины")
+        if removed_id
+        else callback.answer("❌ Товар не найден", show_alert=True),
+    )
 
 
 @router.callback_query(F.data == "cart_clear")
@@ -270,14 +378,15 @@ async def confirm_clear_cart(
         "Это действие нельзя отменить."
     )
 
-    keyboard = get_cart_clear_confirm_keyboard()
+    keyboard = CART_CLEAR_CONFIRM_KEYBOARD
 
-    await callback.message.edit_text(
-        text=text,
-        reply_markup=keyboard,
-        parse_mode="HTML",
+    await asyncio.gather(
+        callback.message.edit_text(
+            text=text,
+            reply_markup=keyboard,
+        ),
+        callback.answer(),
     )
-    await callback.answer()
 
 
 @router.callback_query(F.data == "cart_clear_confirm")
@@ -297,16 +406,19 @@ async def clear_cart(
     await cart_service.clear_cart(user.id)
     await session.commit()
 
-    await callback.answer("✓ Корзина очищена")
+    # Корзина теперь пуста - показываем её без повторного запроса
+    text, keyboard = render_cart_view([])
 
-    # Показываем пустую корзину
-    callback.data = "cart_view"
-    await show_cart(callback, session, user)
+    await asyncio.gather(
+        callback.message.edit_text(text=text, reply_markup=keyboard),
+        callback.answer("✓ Корзина очищена"),
+    )
 
 
-@router.callback_query(F.data.startswith("cart_add:"))
+@router.callback_query(CartAddCb.filter())
 async def add_to_cart(
     callback: CallbackQuery,
+    callback_data: CartAddCb,
     session: AsyncSession,
     user: User,
     state: FSMContext,
@@ -315,15 +427,15 @@ async def add_to_cart(
 
     Args:
         callback: CallbackQuery
+        callback_data: Данные callback
         session: Сессия БД
         user: Пользователь
         state: FSM контекст
     """
-    parts = callback.data.split(":")
-    product_id = int(parts[1])
-    size = parts[2]
-    quantity = int(parts[3])
-    color = parts[4] if len(parts) > 4 else None
+    product_id = callback_data.product_id
+    size = callback_data.size
+    quantity = callback_data.quantity
+    color = callback_data.color
 
     cart_service = CartService(session)
     await cart_service.add_item(
@@ -341,23 +453,6 @@ async def add_to_cart(
     await callback.answer(f"✓ Добавлено в корзину: {quantity} шт.")
 
     # Показываем сообщение с кнопками
-    from aiogram.types import InlineKeyboardButton
-    from aiogram.utils.keyboard import InlineKeyboardBuilder
-
-    builder = InlineKeyboardBuilder()
-    builder.row(
-        InlineKeyboardButton(
-            text="🛒 Перейти в корзину",
-            callback_data="cart_view",
-        )
-    )
-    builder.row(
-        InlineKeyboardButton(
-            text="📦 Продолжить покупки",
-            callback_data="catalog",
-        )
-    )
-
     text = (
         f"✅ <b>Товар добавлен в корзину!</b>\n\n"
         f"📏 Размер: {size.upper()}\n"
@@ -368,8 +463,7 @@ async def add_to_cart(
 
     await callback.message.edit_text(
         text=text,
-        reply_markup=builder.as_markup(),
-        parse_mode="HTML",
+        reply_markup=CART_ADDED_KEYBOARD,
     )
 
     logger.info(
@@ -396,24 +490,17 @@ async def start_checkout(
         state: FSM контекст
     """
     cart_service = CartService(session)
-    cart_items = await cart_service.get_cart_items(user.id)
+    cart_items, total_price, total_quantity = await cart_service.get_cart_summary(user.id)
 
     if not cart_items:
         await callback.answer("❌ Корзина пуста", show_alert=True)
         return
 
-    # Подсчитываем общую сумму
-    total_price = Decimal("0")
-    total_quantity = 0
-    for item in cart_items:
-        if item.product:
-            total_price += item.product.price * item.quantity
-            total_quantity += item.quantity
-
     # Сохраняем информацию о корзине в FSM
     await state.update_data(
         checkout_from_cart=True,
-        total_price=float(total_price),
+        # Decimal храним строкой - без потери точности через float
+        total_price=str(total_price),
         total_quantity=total_quantity,
     )
 
@@ -426,13 +513,12 @@ async def start_checkout(
         "• Или введите контакт вручную (телефон, username, email)"
     )
 
-    keyboard = get_contact_request_keyboard()
+    keyboard = CONTACT_REQUEST_KEYBOARD
 
     await callback.message.delete()
     await callback.message.answer(
         text=text,
         reply_markup=keyboard,
-        parse_mode="HTML",
     )
 
     await state.set_state(CheckoutStates.ENTER_CONTACT)
@@ -481,19 +567,9 @@ async def request_manual_contact_checkout(
         message: Message
         state: FSM контекст
     """
-    text = (
-        "✏️ <b>Ввод контакта</b>\n\n"
-        "Введите ваш контакт для связи:\n"
-        "• Телефон: +79001234567\n"
-        "• Username: @username\n"
-        "• Email: email@example.com\n\n"
-        "Или нажмите /cancel для отмены"
-    )
-
     await message.answer(
-        text=text,
+        text=CONTACT_PROMPT_TEXT,
         reply_markup=ReplyKeyboardRemove(),
-        parse_mode="HTML",
     )
 
     # Меняем состояние для ожидания ввода
@@ -513,17 +589,6 @@ async def cancel_checkout(
     """
     await state.clear()
 
-    from aiogram.types import InlineKeyboardButton
-    from aiogram.utils.keyboard import InlineKeyboardBuilder
-
-    builder = InlineKeyboardBuilder()
-    builder.row(
-        InlineKeyboardButton(text="🛒 Вернуться в корзину", callback_data="cart_view")
-    )
-    builder.row(
-        InlineKeyboardButton(text="📦 Продолжить покупки", callback_data="catalog")
-    )
-
     text = (
         "❌ <b>Оформление заказа отменено</b>\n\n"
         "Ваша корзина сохранена."
@@ -531,8 +596,7 @@ async def cancel_checkout(
 
     await message.answer(
         text=text,
-        reply_markup=builder.as_markup(),
-        parse_mode="HTML",
+        reply_markup=CHECKOUT_CANCELLED_KEYBOARD,
     )
 
     logger.info("Checkout cancelled", user_id=message.from_user.id)
@@ -549,55 +613,23 @@ async def validate_manual_contact_checkout(
         message: Message с контактом
         state: FSM контекст
     """
-    import re
-
-    contact = message.text.strip()
-
-    # Валидация контакта
-    is_phone = bool(re.match(r"^\+?\d{10,15}$", contact.replace(" ", "").replace("-", "")))
-    is_username = bool(re.match(r"^@[a-zA-Z0-9_]{5,32}$", contact))
-    is_email = bool(re.match(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$", contact))
-
-    if not (is_phone or is_username or is_email):
-        await message.answer(
-            "❌ <b>Некорректный формат контакта</b>\n\n"
-            "Пожалуйста, введите контакт в одном из форматов:\n"
-            "• Телефон: +79001234567\n"
-            "• Username: @username\n"
-            "• Email: email@example.com",
-            parse_mode="HTML",
-        )
+    # Валидация контакта (длина и формат) - до записи в FSM
+    try:
+        contact, contact_type = validate_contact(message.text)
+    except ValueError as e:
+        await message.answer(str(e))
         return
 
     # Сохраняем контакт временно
     await state.update_data(pending_contact=contact)
 
     # Запрашиваем подтверждение
-    from aiogram.types import InlineKeyboardButton
-    from aiogram.utils.keyboard import InlineKeyboardBuilder
-
-    builder = InlineKeyboardBuilder()
-    builder.row(
-        InlineKeyboardButton(
-            text="✅ Да, всё верно",
-            callback_data="confirm_contact_yes",
-        )
-    )
-    builder.row(
-        InlineKeyboardButton(
-            text="✏️ Изменить",
-            callback_data="confirm_contact_no",
-        )
-    )
-
-    contact_type = "телефон" if is_phone else ("username" if is_username else "email")
 
     await message.answer(
         f"📝 <b>Проверьте контакт</b>\n\n"
         f"Ваш {contact_type}: <code>{contact}</code>\n\n"
         f"Всё верно?",
-        reply_markup=builder.as_markup(),
-        parse_mode="HTML",
+        reply_markup=CONFIRM_CONTACT_KEYBOARD,
     )
 
 
@@ -623,6 +655,9 @@ async def confirm_contact_yes_checkout(
         await callback.answer("❌ Контакт не найден", show_alert=True)
         return
 
+    # Снимаем индикатор загрузки на кнопке до запросов к БД и Telegram
+    await callback.answer()
+
     # Сохраняем подтвержденный контакт
     await state.update_data(customer_contact=contact)
 
@@ -630,7 +665,6 @@ async def confirm_contact_yes_checkout(
 
     # Переходим к вопросу про бонусы
     await show_bonus_question_checkout(callback.message, session, state, user)
-    await callback.answer()
 
 
 @router.callback_query(F.data == "confirm_contact_no", CheckoutStates.CONFIRM_CONTACT)
@@ -644,15 +678,7 @@ async def confirm_contact_no_checkout(
         callback: CallbackQuery
         state: FSM контекст
     """
-    await callback.message.edit_text(
-        "✏️ <b>Ввод контакта</b>\n\n"
-        "Введите ваш контакт для связи:\n"
-        "• Телефон: +79001234567\n"
-        "• Username: @username\n"
-        "• Email: email@example.com\n\n"
-        "Или нажмите /cancel для отмены",
-        parse_mode="HTML",
-    )
+    await callback.message.edit_text(CONTACT_PROMPT_TEXT)
     await callback.answer()
 
 
@@ -673,26 +699,25 @@ async def show_bonus_question_checkout(
     # Проверяем баланс бонусов
     if user.bonus_balance <= 0:
         # Нет бонусов - сразу к подтверждению
-        await show_checkout_confirmation(message, session, state)
+        await show_checkout_confirmation(message, session, state, user)
         return
 
-    # Получаем настройки бонусов
-    from decimal import Decimal
-
-    from src.database.models.bot_settings import BotSettings
-
-    bot_settings = await BotSettings.get_settings(session)
+    # Получаем настройки бонусов (из кэша)
+    bot_settings = await SettingsCache.get_bot_settings(session)
 
     data = await state.get_data()
-    total_price = data.get("total_price", 0)
+    total_price = Decimal(data.get("total_price", "0"))
 
     # Рассчитываем максимальную сумму к оплате бонусами
-    max_bonus_amount = Decimal(str(total_price)) * (bot_settings.bonus_max_payment_percent / Decimal("100"))
-    actual_bonus_amount = min(user.bonus_balance, max_bonus_amount)
+    max_bonus_amount = total_price * (bot_settings.bonus_max_payment_percent / Decimal("100"))
+    # Округляем вниз до копеек: списывается ровно та сумма, что показана
+    actual_bonus_amount = min(user.bonus_balance, max_bonus_amount).quantize(
+        Decimal("0.01"), rounding=ROUND_DOWN
+    )
 
     if actual_bonus_amount <= 0:
         # Не можем использовать бонусы
-        await show_checkout_confirmation(message, session, state)
+        await show_checkout_confirmation(message, session, state, user)
         return
 
     text = (
@@ -702,30 +727,14 @@ async def show_bonus_question_checkout(
         f"Использовать бонусы?"
     )
 
-    # Сохраняем доступную сумму бонусов (конвертируем Decimal в float для JSON)
-    await state.update_data(available_bonus_amount=float(actual_bonus_amount))
-
-    from aiogram.types import InlineKeyboardButton
-    from aiogram.utils.keyboard import InlineKeyboardBuilder
-
-    builder = InlineKeyboardBuilder()
-    builder.row(
-        InlineKeyboardButton(
-            text=f"✅ Да, использовать {actual_bonus_amount:.2f} ₽",
-            callback_data="use_bonuses_yes",
-        )
-    )
-    builder.row(
-        InlineKeyboardButton(
-            text="❌ Нет, оплачу полностью",
-            callback_data="use_bonuses_no",
-        )
-    )
+    # Сохраняем доступную сумму бонусов (Decimal строкой - для JSON без потери точности)
+    await state.update_data(available_bonus_amount=str(actual_bonus_amount))
 
     await message.answer(
         text=text,
-        reply_markup=builder.as_markup(),
-        parse_mode="HTML",
+        reply_markup=get_use_bonuses_keyboard(
+            actual_bonus_amount, "use_bonuses_yes", "use_bonuses_no"
+        ),
     )
 
     await state.set_state(CheckoutStates.USE_BONUSES)
@@ -735,6 +744,7 @@ async def show_checkout_confirmation(
     message: Message,
     session: AsyncSession,
     state: FSMContext,
+    user: User,
 ) -> None:
     """Показать экран подтверждения заказа из корзины.
 
@@ -742,78 +752,53 @@ async def show_checkout_confirmation(
         message: Message
         session: Сессия БД
         state: FSM контекст
+        user: Пользователь
     """
     data = await state.get_data()
     contact = data.get("customer_contact", "—")
-    total_price = data.get("total_price", 0)
-    total_quantity = data.get("total_quantity", 0)
-
-    # Получаем товары из корзины
-    from src.database.models.user import User
-
-    user_id = message.from_user.id
-    result = await session.execute(
-        __import__("sqlalchemy", fromlist=["select"]).select(User).where(
-            User.telegram_id == user_id
-        )
-    )
-    user = result.scalar_one_or_none()
 
+    # Товары всё равно загружаем для списка, итоги считаем по ним же -
+    # так они совпадают с корзиной, даже если её меняли во время оформления
     cart_service = CartService(session)
-    cart_items = await cart_service.get_cart_items(user.id)
+    cart_items, total_price, total_quantity = await cart_service.get_cart_summary(user.id)
 
-    text = (
+    parts = [
         "✅ <b>Подтверждение заказа</b>\n\n"
         "Проверьте данные заказа:\n\n"
-    )
+    ]
 
     # Список товаров
     for i, item in enumerate(cart_items, 1):
-        product = item.product
-        if product:
-            text += f"{i}. {item.display_name} × {item.quantity}\n"
-            text += f"   💰 {(product.price * item.quantity):,.2f} ₽\n\n"
+        parts.append(
+            f"{i}. {item.display_name} × {item.quantity}\n"
+            f"   💰 {item.formatted_total_price}\n\n"
+        )
 
     # Получаем информацию о бонусах
     use_bonuses = data.get("use_bonuses", False)
-    bonus_amount = data.get("bonus_amount", 0)
+    bonus_amount = Decimal(data.get("bonus_amount", "0"))
 
-    text += f"━━━━━━━━━━━━━━━━\n"
-    text += f"📦 Всего: {total_quantity} ед.\n"
-    text += f"💰 Сумма: {total_price:,.2f} ₽\n"
+    parts.append(
+        "━━━━━━━━━━━━━━━━\n"
+        f"📦 Всего: {total_quantity} ед.\n"
+        f"💰 Сумма: {total_price:,.2f} ₽\n"
+    )
 
     if use_bonuses and bonus_amount > 0:
         final_price = total_price - bonus_amount
-        text += f"🎁 Бонусы: -{bonus_amount:.2f} ₽\n"
-        text += f"💳 <b>К оплате: {final_price:.2f} ₽</b>\n"
+        parts.append(
+            f"🎁 Бонусы: -{bonus_amount:.2f} ₽\n"
+            f"💳 <b>К оплате: {final_price:.2f} ₽</b>\n"
+        )
     else:
-        text += f"💳 <b>К оплате: {total_price:,.2f} ₽</b>\n"
-
-    text += f"📞 Контакт: {contact}\n\n"
-    text += "Все верно?"
-
-    # Создаем клавиатуру подтверждения
-    from aiogram.types import InlineKeyboardButton
-    from aiogram.utils.keyboard import InlineKeyboardBuilder
+        parts.append(f"💳 <b>К оплате: {total_price:,.2f} ₽</b>\n")
 
-    builder = InlineKeyboardBuilder()
-    builder.row(
-        InlineKeyboardButton(
-            text="✅ Подтвердить заказ",
-            callback_data="checkout_confirm",
-        )
-    )
-    builder.row(
-        InlineKeyboardButton(
-            text="❌ Отменить",
-            callback_data="checkout_cancel",
-        )
-    )
+    parts.append(f"📞 Контакт: {contact}\n\nВсе верно?")
+    text = "".join(parts)
 
     await message.answer(
         text=text,
-        reply_markup=builder.as_markup(),
-        parse_mode="HTML",
+        reply_markup=CHECKOUT_CONFIRM_KEYBOARD,
     )
 
     await state.set_state(CheckoutStates.CONFIRM)
@@ -824,6 +809,7 @@ async def process_use_bonuses_yes_checkout(
     callback: CallbackQuery,
     session: AsyncSession,
     state: FSMContext,
+    user: User,
 ) -> None:
     """Обработка выбора использования бонусов для checkout.
 
@@ -831,9 +817,13 @@ async def process_use_bonuses_yes_checkout(
         callback: CallbackQuery
         session: Сессия БД
         state: FSM контекст
+        user: Пользователь
     """
+    # Снимаем индикатор загрузки на кнопке до запросов к БД и Telegram
+    await callback.answer()
+
     data = await state.get_data()
-    available_bonus_amount = data.get("available_bonus_amount", 0)
+    available_bonus_amount = data.get("available_bonus_amount", "0")
 
     # Сохраняем решение использовать бонусы
     await state.update_data(use_bonuses=True, bonus_amount=available_bonus_amount)
@@ -842,8 +832,7 @@ async def process_use_bonuses_yes_checkout(
 
     # Создаем Message объект из callback для передачи в show_checkout_confirmation
     message = callback.message
-    await show_checkout_confirmation(message, session, state)
-    await callback.answer()
+    await show_checkout_confirmation(message, session, state, user)
 
 
 @router.callback_query(CheckoutStates.USE_BONUSES, F.data == "use_bonuses_no")
@@ -851,6 +840,7 @@ async def process_use_bonuses_no_checkout(
     callback: CallbackQuery,
     session: AsyncSession,
     state: FSMContext,
+    user: User,
 ) -> None:
     """Обработка отказа от использования бонусов для checkout.
 
@@ -858,15 +848,18 @@ async def process_use_bonuses_no_checkout(
         callback: CallbackQuery
         session: Сессия БД
         state: FSM контекст
+        user: Пользователь
     """
+    # Снимаем индикатор загрузки на кнопке до запросов к БД и Telegram
+    await callback.answer()
+
     # Сохраняем решение НЕ использовать бонусы
-    await state.update_data(use_bonuses=False, bonus_amount=0)
+    await state.update_data(use_bonuses=False, bonus_amount="0")
 
     await callback.message.delete()
 
     message = callback.message
-    await show_checkout_confirmation(message, session, state)
-    await callback.answer()
+    await show_checkout_confirmation(message, session, state, user)
 
 
 @router.callback_query(CheckoutStates.CONFIRM, F.data == "checkout_confirm")
@@ -884,82 +877,93 @@ async def confirm_and_create_orders(
         state: FSM контекст
         user: Пользователь
     """
-    data = await state.get_data()
-    contact = data.get("customer_contact")
-
-    if not contact:
-        await callback.answer("❌ Ошибка данных заказа", show_alert=True)
-        await state.clear()
-        return
-
-    # Получаем товары из корзины
-    cart_service = CartService(session)
-    cart_items = await cart_service.get_cart_items(user.id)
-
-    if not cart_items:
-        await callback.answer("❌ Корзина пуста", show_alert=True)
-        await state.clear()
+    # Повторное нажатие, пока заказ ещё создаётся, не должно создать второй
+    if user.id in ORDERS_IN_PROGRESS:
+        await callback.answer("⏳ Заказ уже обрабатывается…")
         return
 
-    # Создаем ОДИН заказ с несколькими товарами
-    order_service = OrderService(session)
-
+    ORDERS_IN_PROGRESS.add(user.id)
     try:
-        # Подготавливаем данные товаров для заказа
-        items_data = [
-            {
-                "product_id": item.product_id,
-                "size": item.size,
-                "color": item.color,
-                "quantity": item.quantity,
-            }
-            for item in cart_items
-        ]
-
-        # Создаем один заказ со всеми товарами
-        order = await order_service.create_order_with_items(
-            user_id=user.id,
-            customer_contact=contact,
-            items=items_data,
-        )
-
-        # Списываем бонусы если пользователь выбрал их использовать
-        use_bonuses = data.get("use_bonuses", False)
-        bonus_amount = data.get("bonus_amount", 0)
-
-        if use_bonuses and bonus_amount > 0:
-            # Обновляем баланс бонусов
-            user.bonus_balance -= Decimal(str(bonus_amount))
-            # Устанавливаем скидку в заказе
-            order.bonus_discount = Decimal(str(bonus_amount))
-            # Добавляем заметку к заказу о списании бонусов
-            if order.admin_notes:
-                order.admin_notes += f"\n\nСписано бонусов: {bonus_amount:.2f} ₽"
-            else:
-                order.admin_notes = f"Списано бонусов: {bonus_amount:.2f} ₽"
-
-            logger.info(
-                "Bonuses deducted for checkout order",
+        data = await state.get_data()
+        contact = data.get("customer_contact")
+
+        if not contact:
+            await callback.answer("❌ Ошибка данных заказа", show_alert=True)
+            await state.clear()
+            return
+
+        # Получаем товары из корзины
+        cart_service = CartService(session)
+        cart_items = await cart_service.get_cart_items(user.id)
+
+        if not cart_items:
+            await callback.answer("❌ Корзина пуста", show_alert=True)
+            await state.clear()
+            return
+
+        # Создаем ОДИН заказ с несколькими товарами
+        order_service = OrderService(session)
+
+        try:
+            # Подготавливаем данные товаров для заказа
+            items_data = [
+                {
+                    "product_id": item.product_id,
+                    "size": item.size,
+                    "color": item.color,
+                    "quantity": item.quantity,
+                }
+                for item in cart_items
+            ]
+
+            # Скидку и заметку о списании бонусов записываем сразу при
+            # создании заказа, а не отдельным UPDATE после него
+            bonus_amount = Decimal(data.get("bonus_amount", "0"))
+            use_bonuses = data.get("use_bonuses", False) and bonus_amount > 0
+
+            # Создаем один заказ со всеми товарами
+            order = await order_service.create_order_with_items(
                 user_id=user.id,
-                order_id=order.id,
-                bonus_amount=bonus_amount,
+                customer_contact=contact,
+                items=items_data,
+                bonus_discount=bonus_amount if use_bonuses else Decimal("0"),
+                admin_notes=f"Списано бонусов: {bonus_amount:.2f} ₽" if use_bonuses else None,
             )
 
-        await session.commit()
-
-        # Получаем настройки для альтернативного контакта
-        from src.database.models.bot_settings import BotSettings
-        bot_settings = await BotSettings.get_settings(session)
-        alternative_contact = bot_settings.alternative_contact_username
-
-        # Уведомляем пользователя о заказе
-        await NotificationService.notify_user_order_created(callback.bot, order, alternative_contact)
-        # Уведомляем админов
-        await NotificationService.notify_admins_new_order(callback.bot, order)
-
-        # Очищаем корзину после успешного оформления
-        await cart_service.clear_cart(user.id)
-        await session.commit()
+            # Списываем бонусы если пользователь выбрал их использовать
+            if use_bonuses:
+                user.bonus_balance -= bonus_amount
+
+                logger.info(
+                    "Bonuses deducted for checkout order",
+                    user_id=user.id,
+                    order_id=order.id,
+                    bonus_amount=float(bonus_amount),
+                )
+
+            # Очищаем корзину в той же транзакции, что и создание заказа
+            await cart_service.clear_cart(user.id)
+
+            # Настройки для уведомлений читаем до коммита: после него сессия
+            # не должна снова брать соединение из пула на время запросов к Telegram
+            bot_settings = await SettingsCache.get_bot_settings(session)
+            await session.commit()
+
+        except Exception as e:
+            await session.rollback()
+            logger.error(
+                "Failed to create orders from cart",
+                user_id=user.id,
+                error_type=type(e).__name__,
+                error=str(e),
+                exc_info=ORDER_TRACEBACK_THROTTLE.allow(),
+            )
+            await callback.answer(
+                "❌ Ошибка создания заказов. Попробуйте позже.",
+                show_alert=True,
+            )
+            await state.clear()
+            return
 
         text = (
             f"✅ <b>Заказ оформлен!</b>\n\n"
@@ -972,8 +976,7 @@ async def confirm_and_create_orders(
 
         await callback.message.edit_text(
             text=text,
-            reply_markup=get_order_completed_keyboard(),
-            parse_mode="HTML",
+            reply_markup=ORDER_COMPLETED_KEYBOARD,
         )
 
         await state.clear()
@@ -986,18 +989,25 @@ async def confirm_and_create_orders(
             items_count=order.total_items,
         )
 
-    except Exception as e:
-        logger.error(
-            "Failed to create orders from cart",
-            user_id=user.id,
-            error=str(e),
-            exc_info=True,
-        )
-        await callback.answer(
-            "❌ Ошибка создания заказов. Попробуйте позже.",
-            show_alert=True,
+        # Уведомления отправляем после ответа пользователю, вне транзакции
+        alternative_contact = bot_settings.alternative_contact_username
+
+        # Уведомляем пользователя и админов параллельно: сессия БД здесь не используется
+        results = await asyncio.gather(
+            NotificationService.notify_user_order_created(callback.bot, order, alternative_contact),
+            NotificationService.notify_admins_new_order(callback.bot, order),
+            return_exceptions=True,
         )
-        await state.clear()
+        for recipient, result in zip(("user", "admins"), results):
+            if isinstance(result, Exception):
+                logger.error(
+                    "Failed to send order notification",
+                    recipient=recipient,
+                    order_id=order.id,
+                    error=str(result),
+                )
+    finally:
+        ORDERS_IN_PROGRESS.discard(user.id)
 
 
 @router.callback_query(CheckoutStates.CONFIRM, F.data == "checkout_cancel")
@@ -1013,29 +1023,18 @@ async def cancel_from_confirmation_checkout(
     """
     await state.clear()
 
-    from aiogram.types import InlineKeyboardButton
-    from aiogram.utils.keyboard import InlineKeyboardBuilder
-
-    builder = InlineKeyboardBuilder()
-    builder.row(
-        InlineKeyboardButton(text="🛒 Вернуться в корзину", callback_data="cart_view")
-    )
-    builder.row(
-        InlineKeyboardButton(text="📦 Продолжить покупки", callback_data="catalog")
-    )
-
     text = (
         "❌ <b>Заказ отменён</b>\n\n"
         "Ваша корзина сохранена."
     )
 
-    await callback.message.edit_text(
-        text=text,
-        reply_markup=builder.as_markup(),
-        parse_mode="HTML",
+    await asyncio.gather(
+        callback.message.edit_text(
+            text=text,
+            reply_markup=CHECKOUT_CANCELLED_KEYBOARD,
+        ),
+        callback.answer(),
     )
-
-    await callback.answer()
     logger.info("Checkout cancelled at confirmation", user_id=callback.from_user.id)
 
 
@@ -1043,9 +1042,11 @@ async def cancel_from_confirmation_checkout(
 # БЫСТРЫЙ ЗАКАЗ (без добавления в корзину)
 # ==============================================
 
-@router.callback_query(F.data.startswith("quick_order:"))
+
+@router.callback_query(QuickOrderCb.filter())
 async def start_quick_order(
     callback: CallbackQuery,
+    callback_data: QuickOrderCb,
     session: AsyncSession,
     state: FSMContext,
 ) -> None:
@@ -1053,69 +1054,86 @@ async def start_quick_order(
 
     Args:
         callback: CallbackQuery
+        callback_data: Данные callback
         session: Сессия БД
         state: FSM контекст
     """
-    parts = callback.data.split(":")
-    product_id = int(parts[1])
-    size = parts[2]
-    quantity = int(parts[3])
-    color = parts[4] if len(parts) > 4 else None
-
-    # Получаем информацию о товаре
-    from src.services.product_service import ProductService
-
+    product_id = callback_data.product_id
+    # Размер приводим к каноническому виду один раз: дальше он уходит
+    # в FSM, тексты экранов и заказ уже в верхнем регистре
+    size = callback_data.size.upper()
+    quantity = callback_data.quantity
+    color = callback_data.color
+
+    # Получаем название и цену товара (из кэша, без связей товара)
     product_service = ProductService(session)
-    product = await product_service.get_product(product_id)
+    product = await product_service.get_product_snapshot(product_id)
 
     if not product:
         await callback.answer("❌ Товар не найден", show_alert=True)
         return
 
+    total_price = product.price * quantity
+    total_price_str = format_price(total_price)
+
     # Сохраняем данные заказа в FSM
     await state.update_data(
         quick_order=True,
         product_id=product_id,
         product_name=product.name,
         product_price=product.formatted_price,
+        # Цена для расчётов на следующих шагах (Decimal строкой - для JSON в FSM)
+        product_price_raw=str(product.price),
+        total_price_str=total_price_str,
         size=size,
         quantity=quantity,
         color=color,
     )
 
-    total_price = product.price * quantity
-
-    text = (
+    parts = [
         "✅ <b>Быстрый заказ</b>\n\n"
         f"📦 Товар: {product.name}\n"
         f"💰 Цена: {product.formatted_price}\n"
-    )
+    ]
 
     if color:
-        text += f"🎨 Цвет: {color}\n"
+        parts.append(f"🎨 Цвет: {color}\n")
 
-    text += (
-        f"📏 Размер: {size.upper()}\n"
+    parts.append(
+        f"📏 Размер: {size}\n"
         f"🔢 Количество: {quantity} шт.\n"
-        f"💵 Итого: {total_price:,.2f} ₽\n\n"
+        f"💵 Итого: {total_price_str}\n\n"
         "Поделитесь вашим контактом для связи:\n"
         "• Нажмите кнопку ниже чтобы поделиться номером телефона\n"
         "• Или введите контакт вручную (телефон, username, email)"
     )
-
-    keyboard = get_contact_request_keyboard()
-
-    await callback.message.delete()
-    await callback.message.answer(
-        text=text,
-        reply_markup=keyboard,
-        parse_mode="HTML",
-    )
+    text = "".join(parts)
 
     await state.set_state(QuickOrderStates.ENTER_CONTACT)
-    await callback.answer()
 
-    logger.info(
+    # Reply-клавиатуру нельзя прикрепить через edit_text, поэтому старое
+    # сообщение удаляем, а новое отправляем параллельно с удалением.
+    # Неудачное удаление (например, сообщение старше 48 часов) не должно
+    # прерывать заказ - пользователь уже получил экран ввода контакта
+    delete_result, send_result, _ = await asyncio.gather(
+        callback.message.delete(),
+        callback.message.answer(
+            text=text,
+            reply_markup=CONTACT_REQUEST_KEYBOARD,
+        ),
+        callback.answer(),
+        return_exceptions=True,
+    )
+    if isinstance(send_result, Exception):
+        raise send_result
+    if isinstance(delete_result, Exception):
+        logger.warning(
+            "Failed to delete product message",
+            user_id=callback.from_user.id,
+            error=str(delete_result),
+        )
+
+    logger.debug(
         "Quick order started",
         user_id=callback.from_user.id,
         product_id=product_id,
@@ -1142,10 +1160,10 @@ async def process_quick_order_contact_shared(
     phone = contact.phone_number
 
     # Сохраняем контакт
-    await state.update_data(customer_contact=phone)
+    data = await state.update_data(customer_contact=phone)
 
     # Показываем вопрос про бонусы
-    await show_bonus_question_quick_order(message, session, state, user)
+    await show_bonus_question_quick_order(message, session, state, user, data)
 
 
 @router.message(QuickOrderStates.ENTER_CONTACT, F.text == "✏️ Ввести вручную")
@@ -1159,19 +1177,9 @@ async def request_manual_contact_quick_order(
         message: Message
         state: FSM контекст
     """
-    text = (
-        "✏️ <b>Ввод контакта</b>\n\n"
-        "Введите ваш контакт для связи:\n"
-        "• Телефон: +79001234567\n"
-        "• Username: @username\n"
-        "• Email: email@example.com\n\n"
-        "Или нажмите /cancel для отмены"
-    )
-
     await message.answer(
-        text=text,
+        text=CONTACT_PROMPT_TEXT,
         reply_markup=ReplyKeyboardRemove(),
-        parse_mode="HTML",
     )
 
     # Меняем состояние для ожидания ввода
@@ -1191,29 +1199,12 @@ async def cancel_quick_order(
     """
     await state.clear()
 
-    from aiogram.types import InlineKeyboardButton
-    from aiogram.utils.keyboard import InlineKeyboardBuilder
-
-    builder = InlineKeyboardBuilder()
-    builder.row(
-        InlineKeyboardButton(text="📦 Вернуться в каталог", callback_data="catalog")
-    )
-    builder.row(
-        InlineKeyboardButton(text="🛒 Корзина", callback_data="cart_view")
-    )
-
-    text = (
-        "❌ <b>Заказ отменён</b>\n\n"
-        "Вы можете продолжить покупки."
-    )
-
     await message.answer(
-        text=text,
-        reply_markup=builder.as_markup(),
-        parse_mode="HTML",
+        text=QUICK_ORDER_CANCELLED_TEXT,
+        reply_markup=QUICK_ORDER_CANCELLED_KEYBOARD,
     )
 
-    logger.info("Quick order cancelled", user_id=message.from_user.id)
+    logger.debug("Quick order cancelled", user_id=message.from_user.id)
 
 
 @router.message(QuickOrderStates.CONFIRM_CONTACT, F.text)
@@ -1227,55 +1218,23 @@ async def validate_manual_contact_quick_order(
         message: Message с контактом
         state: FSM контекст
     """
-    import re
-
-    contact = message.text.strip()
-
-    # Валидация контакта
-    is_phone = bool(re.match(r"^\+?\d{10,15}$", contact.replace(" ", "").replace("-", "")))
-    is_username = bool(re.match(r"^@[a-zA-Z0-9_]{5,32}$", contact))
-    is_email = bool(re.match(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$", contact))
-
-    if not (is_phone or is_username or is_email):
-        await message.answer(
-            "❌ <b>Некорректный формат контакта</b>\n\n"
-            "Пожалуйста, введите контакт в одном из форматов:\n"
-            "• Телефон: +79001234567\n"
-            "• Username: @username\n"
-            "• Email: email@example.com",
-            parse_mode="HTML",
-        )
+    # Валидация контакта (длина и формат) - до записи в FSM
+    try:
+        contact, contact_type = validate_contact(message.text)
+    except ValueError as e:
+        await message.answer(str(e))
         return
 
     # Сохраняем контакт временно
     await state.update_data(pending_contact=contact)
 
     # Запрашиваем подтверждение
-    from aiogram.types import InlineKeyboardButton
-    from aiogram.utils.keyboard import InlineKeyboardBuilder
-
-    builder = InlineKeyboardBuilder()
-    builder.row(
-        InlineKeyboardButton(
-            text="✅ Да, всё верно",
-            callback_data="confirm_contact_yes",
-        )
-    )
-    builder.row(
-        InlineKeyboardButton(
-            text="✏️ Изменить",
-            callback_data="confirm_contact_no",
-        )
-    )
-
-    contact_type = "телефон" if is_phone else ("username" if is_username else "email")
 
     await message.answer(
         f"📝 <b>Проверьте контакт</b>\n\n"
         f"Ваш {contact_type}: <code>{contact}</code>\n\n"
         f"Всё верно?",
-        reply_markup=builder.as_markup(),
-        parse_mode="HTML",
+        reply_markup=CONFIRM_CONTACT_KEYBOARD,
     )
 
 
@@ -1301,14 +1260,14 @@ async def confirm_contact_yes_quick_order(
         await callback.answer("❌ Контакт не найден", show_alert=True)
         return
 
-    # Сохраняем подтвержденный контакт
-    await state.update_data(customer_contact=contact)
+    # Снимаем индикатор загрузки на кнопке до запросов к БД и Telegram
+    await callback.answer()
 
-    await callback.message.delete()
+    # Сохраняем подтвержденный контакт
+    data = await state.update_data(customer_contact=contact)
 
-    # Переходим к вопросу про бонусы
-    await show_bonus_question_quick_order(callback.message, session, state, user)
-    await callback.answer()
+    # Переходим к вопросу про бонусы - в том же сообщении
+    await show_bonus_question_quick_order(callback.message, session, state, user, data, edit=True)
 
 
 @router.callback_query(F.data == "confirm_contact_no", QuickOrderStates.CONFIRM_CONTACT)
@@ -1322,15 +1281,7 @@ async def confirm_contact_no_quick_order(
         callback: CallbackQuery
         state: FSM контекст
     """
-    await callback.message.edit_text(
-        "✏️ <b>Ввод контакта</b>\n\n"
-        "Введите ваш контакт для связи:\n"
-        "• Телефон: +79001234567\n"
-        "• Username: @username\n"
-        "• Email: email@example.com\n\n"
-        "Или нажмите /cancel для отмены",
-        parse_mode="HTML",
-    )
+    await callback.message.edit_text(CONTACT_PROMPT_TEXT)
     await callback.answer()
 
 
@@ -1339,6 +1290,8 @@ async def show_bonus_question_quick_order(
     session: AsyncSession,
     state: FSMContext,
     user: User,
+    data: dict[str, Any],
+    edit: bool = False,
 ) -> None:
     """Показать вопрос об использовании бонусов для быстрого заказа.
 
@@ -1347,42 +1300,32 @@ async def show_bonus_question_quick_order(
         session: Сессия БД
         state: FSM контекст
         user: Пользователь
+        data: Актуальные данные FSM (результат последнего update_data)
+        edit: Отредактировать сообщение бота вместо отправки нового
     """
     # Проверяем баланс бонусов
     if user.bonus_balance <= 0:
         # Нет бонусов - сразу к подтверждению
-        await show_quick_order_confirmation(message, session, state)
+        await show_quick_order_confirmation(message, state, data, edit=edit)
         return
 
-    # Получаем настройки бонусов
-    from src.database.models.bot_settings import BotSettings
-    from src.services.product_service import ProductService
-
-    bot_settings = await BotSettings.get_settings(session)
+    # Получаем настройки бонусов (из кэша)
+    bot_settings = await SettingsCache.get_bot_settings(session)
 
-    data = await state.get_data()
-    product_id = data.get("product_id")
+    # Цена товара сохранена в FSM при старте заказа - повторно не загружаем
     quantity = data.get("quantity", 1)
-
-    # Получаем товар для расчета цены
-    product_service = ProductService(session)
-    product = await product_service.get_product(product_id)
-
-    if not product:
-        await show_quick_order_confirmation(message, session, state)
-        return
-
-    from decimal import Decimal
-
-    total_price = float(product.price * quantity)
+    total_price = Decimal(data.get("product_price_raw", "0")) * quantity
 
     # Рассчитываем максимальную сумму к оплате бонусами
-    max_bonus_amount = Decimal(str(total_price)) * (bot_settings.bonus_max_payment_percent / Decimal("100"))
-    actual_bonus_amount = min(user.bonus_balance, max_bonus_amount)
+    max_bonus_amount = total_price * (bot_settings.bonus_max_payment_percent / Decimal("100"))
+    # Округляем вниз до копеек: списывается ровно та сумма, что показана
+    actual_bonus_amount = min(user.bonus_balance, max_bonus_amount).quantize(
+        Decimal("0.01"), rounding=ROUND_DOWN
+    )
 
     if actual_bonus_amount <= 0:
         # Не можем использовать бонусы
-        await show_quick_order_confirmation(message, session, state)
+        await show_quick_order_confirmation(message, state, data, edit=edit)
         return
 
     text = (
@@ -1392,121 +1335,88 @@ async def show_bonus_question_quick_order(
         f"Использовать бонусы?"
     )
 
-    # Сохраняем доступную сумму бонусов (конвертируем Decimal в float для JSON)
-    await state.update_data(available_bonus_amount=float(actual_bonus_amount), total_price=total_price)
-
-    from aiogram.types import InlineKeyboardButton
-    from aiogram.utils.keyboard import InlineKeyboardBuilder
-
-    builder = InlineKeyboardBuilder()
-    builder.row(
-        InlineKeyboardButton(
-            text=f"✅ Да, использовать {actual_bonus_amount:.2f} ₽",
-            callback_data="quick_use_bonuses_yes",
-        )
-    )
-    builder.row(
-        InlineKeyboardButton(
-            text="❌ Нет, оплачу полностью",
-            callback_data="quick_use_bonuses_no",
-        )
-    )
+    # Сохраняем доступную сумму бонусов (Decimal строкой - для JSON без потери точности)
+    await state.update_data(available_bonus_amount=str(actual_bonus_amount))
 
-    await message.answer(
-        text=text,
-        reply_markup=builder.as_markup(),
-        parse_mode="HTML",
+    keyboard = get_use_bonuses_keyboard(
+        actual_bonus_amount, "quick_use_bonuses_yes", "quick_use_bonuses_no"
     )
+    if edit:
+        await message.edit_text(text=text, reply_markup=keyboard)
+    else:
+        await message.answer(text=text, reply_markup=keyboard)
 
     await state.set_state(QuickOrderStates.USE_BONUSES)
 
 
 async def show_quick_order_confirmation(
     message: Message,
-    session: AsyncSession,
     state: FSMContext,
+    data: dict[str, Any],
+    edit: bool = False,
 ) -> None:
     """Показать экран подтверждения быстрого заказа.
 
     Args:
         message: Message
-        session: Сессия БД
         state: FSM контекст
+        data: Актуальные данные FSM (результат последнего update_data)
+        edit: Отредактировать сообщение бота вместо отправки нового
     """
-    data = await state.get_data()
-
     product_name = data.get("product_name", "Товар")
     product_price = data.get("product_price", "—")
     size = data.get("size", "—")
     quantity = data.get("quantity", 1)
     color = data.get("color")
     contact = data.get("customer_contact", "—")
-    product_id = data.get("product_id")
-
-    # Получаем товар для расчета итоговой цены
-    from src.services.product_service import ProductService
-
-    product_service = ProductService(session)
-    product = await product_service.get_product(product_id)
 
-    total_price = product.price * quantity if product else 0
+    # Сумма посчитана и отформатирована при старте заказа
+    total_price_str = data.get("total_price_str", "—")
 
     # Получаем информацию о бонусах
     use_bonuses = data.get("use_bonuses", False)
-    bonus_amount = data.get("bonus_amount", 0)
+    bonus_amount = Decimal(data.get("bonus_amount", "0"))
 
-    text = (
+    parts = [
         "✅ <b>Подтверждение заказа</b>\n\n"
         "Проверьте данные заказа:\n\n"
         f"📦 Товар: {product_name}\n"
         f"💰 Цена: {product_price}\n"
-    )
+    ]
 
     if color:
-        text += f"🎨 Цвет: {color}\n"
+        parts.append(f"🎨 Цвет: {color}\n")
 
-    text += (
-        f"📏 Размер: {size.upper()}\n"
+    parts.append(
+        f"📏 Размер: {size}\n"
         f"🔢 Количество: {quantity} шт.\n"
         f"━━━━━━━━━━━━━━━━\n"
-        f"💰 Сумма: {total_price:,.2f} ₽\n"
+        f"💰 Сумма: {total_price_str}\n"
     )
 
     if use_bonuses and bonus_amount > 0:
-        final_price = float(total_price) - bonus_amount
-        text += f"🎁 Бонусы: -{bonus_amount:.2f} ₽\n"
-        text += f"💳 <b>К оплате: {final_price:.2f} ₽</b>\n"
+        # Цена хранится в FSM строкой - считаем в Decimal без погрешности float
+        final_price = (
+            Decimal(data.get("product_price_raw", "0")) * quantity
+            - bonus_amount
+        )
+        parts.append(
+            f"🎁 Бонусы: -{format_price(bonus_amount)}\n"
+            f"💳 <b>К оплате: {format_price(final_price)}</b>\n"
+        )
     else:
-        text += f"💳 <b>К оплате: {total_price:,.2f} ₽</b>\n"
+        parts.append(f"💳 <b>К оплате: {total_price_str}</b>\n")
 
-    text += (
+    parts.append(
         f"📞 Контакт: {contact}\n\n"
         "Все верно?"
     )
+    text = "".join(parts)
 
-    # Создаем клавиатуру подтверждения
-    from aiogram.types import InlineKeyboardButton
-    from aiogram.utils.keyboard import InlineKeyboardBuilder
-
-    builder = InlineKeyboardBuilder()
-    builder.row(
-        InlineKeyboardButton(
-            text="✅ Подтвердить заказ",
-            callback_data="quick_order_confirm",
-        )
-    )
-    builder.row(
-        InlineKeyboardButton(
-            text="❌ Отменить",
-            callback_data="quick_order_cancel",
-        )
-    )
-
-    await message.answer(
-        text=text,
-        reply_markup=builder.as_markup(),
-        parse_mode="HTML",
-    )
+    if edit:
+        await message.edit_text(text=text, reply_markup=QUICK_ORDER_CONFIRM_KEYBOARD)
+    else:
+        await message.answer(text=text, reply_markup=QUICK_ORDER_CONFIRM_KEYBOARD)
 
     await state.set_state(QuickOrderStates.CONFIRM)
 
@@ -1514,50 +1424,47 @@ async def show_quick_order_confirmation(
 @router.callback_query(QuickOrderStates.USE_BONUSES, F.data == "quick_use_bonuses_yes")
 async def process_use_bonuses_yes_quick_order(
     callback: CallbackQuery,
-    session: AsyncSession,
     state: FSMContext,
 ) -> None:
     """Обработка выбора использования бонусов для быстрого заказа.
 
     Args:
         callback: CallbackQuery
-        session: Сессия БД
         state: FSM контекст
     """
-    data = await state.get_data()
-    available_bonus_amount = data.get("available_bonus_amount", 0)
-
-    # Сохраняем решение использовать бонусы
-    await state.update_data(use_bonuses=True, bonus_amount=available_bonus_amount)
+    # Снимаем индикатор загрузки на кнопке до работы с FSM и Telegram
+    await callback.answer()
 
-    await callback.message.delete()
+    # Данные уже прочитаны - записываем их целиком, без повторного чтения
+    # внутри update_data
+    data = await state.get_data()
+    data["use_bonuses"] = True
+    data["bonus_amount"] = data.get("available_bonus_amount", "0")
+    await state.set_data(data)
 
-    message = callback.message
-    await show_quick_order_confirmation(message, session, state)
-    await callback.answer()
+    # Экран подтверждения показываем в том же сообщении
+    await show_quick_order_confirmation(callback.message, state, data, edit=True)
 
 
 @router.callback_query(QuickOrderStates.USE_BONUSES, F.data == "quick_use_bonuses_no")
 async def process_use_bonuses_no_quick_order(
     callback: CallbackQuery,
-    session: AsyncSession,
     state: FSMContext,
 ) -> None:
     """Обработка отказа от использования бонусов для быстрого заказа.
 
     Args:
         callback: CallbackQuery
-        session: Сессия БД
         state: FSM контекст
     """
-    # Сохраняем решение НЕ использовать бонусы
-    await state.update_data(use_bonuses=False, bonus_amount=0)
+    # Снимаем индикатор загрузки на кнопке до работы с FSM и Telegram
+    await callback.answer()
 
-    await callback.message.delete()
+    # Сохраняем решение НЕ использовать бонусы
+    data = await state.update_data(use_bonuses=False, bonus_amount="0")
 
-    message = callback.message
-    await show_quick_order_confirmation(message, session, state)
-    await callback.answer()
+    # Экран подтверждения показываем в том же сообщении
+    await show_quick_order_confirmation(callback.message, state, data, edit=True)
 
 
 @router.callback_query(QuickOrderStates.CONFIRM, F.data == "quick_order_confirm")
@@ -1575,102 +1482,121 @@ async def confirm_and_create_quick_order(
         state: FSM контекст
         user: Пользователь
     """
-    data = await state.get_data()
-
-    product_id = data.get("product_id")
-    size = data.get("size")
-    color = data.get("color")
-    quantity = data.get("quantity", 1)
-    contact = data.get("customer_contact")
-
-    if not all([product_id, size, contact]):
-        await callback.answer("❌ Ошибка данных заказа", show_alert=True)
-        await state.clear()
+    # Повторное нажатие, пока заказ ещё создаётся, не должно создать второй
+    if user.id in ORDERS_IN_PROGRESS:
+        await callback.answer("⏳ Заказ уже обрабатывается…")
         return
 
-    # Создаем заказ
-    order_service = OrderService(session)
-
+    ORDERS_IN_PROGRESS.add(user.id)
     try:
-        order = await order_service.create_order(
-            user_id=user.id,
-            product_id=product_id,
-            size=size,
-            customer_contact=contact,
-            color=color,
-            quantity=quantity,
-        )
+        data = await state.get_data()
 
-        # Списываем бонусы если пользователь выбрал их использовать
-        use_bonuses = data.get("use_bonuses", False)
-        bonus_amount = data.get("bonus_amount", 0)
-
-        if use_bonuses and bonus_amount > 0:
-            # Обновляем баланс бонусов
-            user.bonus_balance -= Decimal(str(bonus_amount))
-            # Устанавливаем скидку в заказе
-            order.bonus_discount = Decimal(str(bonus_amount))
-            # Добавляем заметку к заказу о списании бонусов
-            if order.admin_notes:
-                order.admin_notes += f"\n\nСписано бонусов: {bonus_amount:.2f} ₽"
-            else:
-                order.admin_notes = f"Списано бонусов: {bonus_amount:.2f} ₽"
+        product_id = data.get("product_id")
+        size = data.get("size")
+        contact = data.get("customer_contact")
 
-            logger.info(
-                "Bonuses deducted for quick order",
-                user_id=user.id,
-                order_id=order.id,
-                bonus_amount=bonus_amount,
-            )
+        if not (product_id and size and contact):
+            await callback.answer("❌ Ошибка данных заказа", show_alert=True)
+            await state.clear()
+            return
 
-        await session.commit()
+        color = data.get("color")
+        quantity = data.get("quantity", 1)
+        bonus_amount = Decimal(data.get("bonus_amount", "0"))
+        use_bonuses = data.get("use_bonuses", False) and bonus_amount > 0
 
-        # Получаем настройки для альтернативного контакта
-        from src.database.models.bot_settings import BotSettings
-        bot_settings = await BotSettings.get_settings(session)
-        alternative_contact = bot_settings.alternative_contact_username
+        # Создаем заказ
+        order_service = OrderService(session)
 
-        # Уведомляем пользователя
-        await NotificationService.notify_user_order_created(callback.bot, order, alternative_contact)
-
-        # Уведомляем админов
-        await NotificationService.notify_admins_new_order(callback.bot, order)
-
-        text = (
-            f"✅ <b>Заказ оформлен!</b>\n\n"
-            f"📋 Номер заказа: <code>#{order.id}</code>\n\n"
-            f"Мы свяжемся с вами в ближайшее время.\n"
-            f"Следите за статусом в разделе 'Мои заказы'."
-        )
+        try:
+            # Скидку и заметку о списании бонусов записываем сразу при
+            # создании заказа, а не отдельным UPDATE после него
+            order = await order_service.create_order(
+                user_id=user.id,
+                product_id=product_id,
+                size=size,
+                customer_contact=contact,
+                color=color,
+                quantity=quantity,
+                bonus_discount=bonus_amount if use_bonuses else Decimal("0"),
+                admin_notes=f"Списано бонусов: {bonus_amount:.2f} ₽" if use_bonuses else None,
+            )
 
-        await callback.message.edit_text(
-            text=text,
-            reply_markup=get_order_completed_keyboard(),
-            parse_mode="HTML",
-        )
+            # Списываем бонусы если пользователь выбрал их использовать
+            if use_bonuses:
+                user.bonus_balance -= bonus_amount
+
+                logger.info(
+                    "Bonuses deducted for quick order",
+                    user_id=user.id,
+                    order_id=order.id,
+                    bonus_amount=float(bonus_amount),
+                )
+
+            # Настройки для альтернативного контакта (из кэша) читаем до
+            # коммита: после него сессия не должна снова брать соединение
+            # из пула на время запросов к Telegram
+            bot_settings = await SettingsCache.get_bot_settings(session)
+            await session.commit()
+
+            alternative_contact = bot_settings.alternative_contact_username
+
+            text = (
+                f"✅ <b>Заказ оформлен!</b>\n\n"
+                f"📋 Номер заказа: <code>#{order.id}</code>\n\n"
+                f"Мы свяжемся с вами в ближайшее время.\n"
+                f"Следите за статусом в разделе 'Мои заказы'."
+            )
 
-        await state.clear()
-        await callback.answer("✅ Заказ создан!")
+            await state.clear()
 
-        logger.info(
-            "Quick order created",
-            user_id=user.id,
-            order_id=order.id,
-            product_id=product_id,
-        )
+            logger.info(
+                "Quick order created",
+                user_id=user.id,
+                order_id=order.id,
+                product_id=product_id,
+            )
 
-    except Exception as e:
-        logger.error(
-            "Failed to create quick order",
-            user_id=user.id,
-            error=str(e),
-            exc_info=True,
-        )
-        await callback.answer(
-            "❌ Ошибка создания заказа. Попробуйте позже.",
-            show_alert=True,
-        )
-        await state.clear()
+            # Заказ уже сохранён: уведомления и ответ пользователю независимы,
+            # отправляем их параллельно, ошибки логируем по отдельности
+            results = await asyncio.gather(
+                NotificationService.notify_user_order_created(
+                    callback.bot, order, alternative_contact
+                ),
+                NotificationService.notify_admins_new_order(callback.bot, order),
+                callback.message.edit_text(
+                    text=text,
+                    reply_markup=ORDER_COMPLETED_KEYBOARD,
+                ),
+                callback.answer("✅ Заказ создан!"),
+                return_exceptions=True,
+            )
+            steps = ("notify_user", "notify_admins", "edit_message", "answer")
+            for step, result in zip(steps, results):
+                if isinstance(result, Exception):
+                    logger.error(
+                        "Quick order post-create step failed",
+                        step=step,
+                        order_id=order.id,
+                        error=str(result),
+                    )
+
+        except Exception as e:
+            await session.rollback()
+            logger.error(
+                "Failed to create quick order",
+                user_id=user.id,
+                error_type=type(e).__name__,
+                error=str(e),
+                exc_info=ORDER_TRACEBACK_THROTTLE.allow(),
+            )
+            await callback.answer(
+                "❌ Ошибка создания заказа. Попробуйте позже.",
+                show_alert=True,
+            )
+            await state.clear()
+    finally:
+        ORDERS_IN_PROGRESS.discard(user.id)
 
 
 @router.callback_query(QuickOrderStates.CONFIRM, F.data == "quick_order_cancel")
@@ -1686,27 +1612,11 @@ async def cancel_from_confirmation_quick_order(
     """
     await state.clear()
 
-    from aiogram.types import InlineKeyboardButton
-    from aiogram.utils.keyboard import InlineKeyboardBuilder
-
-    builder = InlineKeyboardBuilder()
-    builder.row(
-        InlineKeyboardButton(text="📦 Вернуться в каталог", callback_data="catalog")
-    )
-    builder.row(
-        InlineKeyboardButton(text="🛒 Корзина", callback_data="cart_view")
-    )
-
-    text = (
-        "❌ <b>Заказ отменён</b>\n\n"
-        "Вы можете продолжить покупки."
+    await asyncio.gather(
+        callback.message.edit_text(
+            text=QUICK_ORDER_CANCELLED_TEXT,
+            reply_markup=QUICK_ORDER_CANCELLED_KEYBOARD,
+        ),
+        callback.answer(),
     )
-
-    await callback.message.edit_text(
-        text=text,
-        reply_markup=builder.as_markup(),
-        parse_mode="HTML",
-    )
-
-    await callback.answer()
-    logger.info("Quick order cancelled at confirmation", user_id=callback.from_user.id)
+    logger.debug("Quick order cancelled at confirmation", user_id=callback.from_user.id)
@@ -4,7 +4,8 @@ import math
 
 from aiogram import F, Router
 from aiogram.fsm.context import FSMContext
-from aiogram.types import CallbackQuery, Message
+from aiogram.types import CallbackQuery, InlineKeyboardButton, InputMediaPhoto, Message
+from aiogram.utils.keyboard import InlineKeyboardBuilder
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.bot.keyboards.main_menu import (
@@ -17,7 +18,8 @@ from src.core.constants import UserRole
 from src.core.logging import get_logger
 from src.database.models.user import User
 from src.database.repositories.category import CategoryRepository
-from src.services.product_service import ProductService
+from src.services.catalog_cache import ProductCard, ProductCardCache
+from src.services.product_service import CategoryPage, ProductService
 from src.utils.navigation import edit_message_with_navigation, NavigationStack
 
 logger = get_logger(__name__)
@@ -26,6 +28,13 @@ router = Router(name="user_catalog")
 
 PRODUCTS_PER_PAGE = 5  # Товаров на странице
 
+# Клавиатура пустой категории не зависит от данных, собираем её один раз
+EMPTY_CATEGORY_KEYBOARD = (
+    InlineKeyboardBuilder()
+    .row(InlineKeyboardButton(text="◀️ К категориям", callback_data="catalog"))
+    .as_markup()
+)
+
 
 @router.callback_query(F.data == "noop")
 async def noop_handler(callback: CallbackQuery) -> None:
@@ -64,9 +73,6 @@ async def back_to_menu(callback: CallbackQuery, state: FSMContext, user: User) -
 
 async def build_catalog_keyboard(categories: list):
     """Построить клавиатуру каталога с категориями."""
-    from aiogram.types import InlineKeyboardButton
-    from aiogram.utils.keyboard import InlineKeyboardBuilder
-
     builder = InlineKeyboardBuilder()
 
     for category in categories:
@@ -91,9 +97,6 @@ async def build_product_detail_keyboard(
     total_products: int,
 ):
     """Построить клавиатуру для просмотра товара."""
-    from aiogram.types import InlineKeyboardButton
-    from aiogram.utils.keyboard import InlineKeyboardBuilder
-
     builder = InlineKeyboardBuilder()
 
     # Кнопка заказа
@@ -228,46 +231,37 @@ async def show_category_products(
     """
     category_id = int(callback.data.split(":")[1])
 
-    category_repo = CategoryRepository(session)
-    category = await category_repo.get(category_id)
+    # Первый товар категории и число товаров - без загрузки всего списка
+    product_service = ProductService(session)
+    page = await product_service.get_category_page(category_id, 0)
 
-    if not category:
-        await callback.answer("❌ Категория не найдена", show_alert=True)
-        return
+    if not page.total:
+        # Категория нужна только для заглушки пустой категории
+        category_repo = CategoryRepository(session)
+        category = await category_repo.get(category_id)
 
-    # Получаем товары категории
-    product_service = ProductService(session)
-    products = await product_service.get_products(
-        category_id=category_id,
-        is_active=True,
-    )
+        if not category:
+            await callback.answer("❌ Категория не найдена", show_alert=True)
+            return
 
-    if not products:
         text = f"📭 <b>{category.name}</b>\n\n"
         text += "━━━━━━━━━━━━━━━━━━━━\n"
         text += "В этой категории пока нет товаров.\n"
         text += "━━━━━━━━━━━━━━━━━━━━\n\n"
         text += "💡 <i>Загляните в другие категории!</i>"
 
-        keyboard_builder = __import__('aiogram.utils.keyboard', fromlist=['InlineKeyboardBuilder']).InlineKeyboardBuilder()
-        keyboard_builder.row(
-            __import__('aiogram.types', fromlist=['InlineKeyboardButton']).InlineKeyboardButton(
-                text="◀️ К категориям",
-                callback_data="catalog",
-            )
-        )
-        keyboard = keyboard_builder.as_markup()
-
         await edit_message_with_navigation(
             callback=callback,
             state=state,
             text=text,
-            markup=keyboard,
+            markup=EMPTY_CATEGORY_KEYBOARD,
         )
         return
 
-    # Показываем первый товар
-    await show_product_detail(callback, session, state, category_id=category_id, product_index=0)
+    # Показываем первый товар, уже загруженный выше
+    await show_product_detail(
+        callback, session, state, category_id=category_id, product_index=0, page=page
+    )
 
 
 @router.callback_query(F.data.startswith("catalog_product:"))
@@ -277,6 +271,7 @@ async def show_product_detail(
     state: FSMContext,
     category_id: int | None = None,
     product_index: int | None = None,
+    page: CategoryPage | None = None,
 ) -> None:
     """Показать детали товара с фото.
 
@@ -286,6 +281,7 @@ async def show_product_detail(
         state: FSM контекст
         category_id: ID категории (если не передан, берется из callback.data)
         product_index: Индекс товара (если не передан, берется из callback.data)
+        page: Уже загруженный товар категории (если не передан, загружается)
     """
     # Если параметры не переданы, парсим из callback.data
     if category_id is None or product_index is None:
@@ -293,68 +289,74 @@ async def show_product_detail(
         category_id = int(parts[1])
         product_index = int(parts[2])
 
-    # Получаем товары категории
-    product_service = ProductService(session)
-    products = await product_service.get_products(
-        category_id=category_id,
-        is_active=True,
-    )
+    # Готовая карточка из кэша: при листании каталога БД не нужна
+    card = ProductCardCache.get(category_id, product_index)
 
-    if not products or product_index >= len(products):
-        await callback.answer("❌ Товар не найден", show_alert=True)
-        return
+    if card is None:
+        # Загружаем только товар на нужной позиции, а не всю категорию
+        if page is None:
+            product_service = ProductService(session)
+            page = await product_service.get_category_page(category_id, product_index)
+
+        product = page.product
+        if not product:
+            await callback.answer("❌ Товар не найден", show_alert=True)
+            return
+
+        # Формируем красивое описание товара
+        text = f"✨ <b>{product.name}</b> ✨\n\n"
 
-    product = products[product_index]
+        text += "━━━━━━━━━━━━━━━━━━━━\n"
+        text += f"💰 <b>Цена:</b> {product.formatted_price}\n"
 
-    # Формируем красивое описание товара
-    text = f"✨ <b>{product.name}</b> ✨\n\n"
+        if product.sizes_list:
+            sizes_display = " • ".join([f"<code>{s}</code>" for s in product.sizes_list])
+            text += f"📏 <b>Размеры:</b> {sizes_display}\n"
 
-    text += "━━━━━━━━━━━━━━━━━━━━\n"
-    text += f"💰 <b>Цена:</b> {product.formatted_price}\n"
+        if product.colors_list:
+            colors_display = " • ".join([f"<i>{c}</i>" for c in product.colors_list])
+            text += f"🎨 <b>Цвета:</b> {colors_display}\n"
 
-    if product.sizes_list:
-        sizes_display = " • ".join([f"<code>{s}</code>" for s in product.sizes_list])
-        text += f"📏 <b>Размеры:</b> {sizes_display}\n"
+        if product.fit:
+            text += f"👔 <b>Крой:</b> {product.fit}\n"
 
-    if product.colors_list:
-        colors_display = " • ".join([f"<i>{c}</i>" for c in product.colors_list])
-        text += f"🎨 <b>Цвета:</b> {colors_display}\n"
+        text += "━━━━━━━━━━━━━━━━━━━━\n"
 
-    if product.fit:
-        text += f"👔 <b>Крой:</b> {product.fit}\n"
+        if product.description:
+            text += f"\n📝 {product.description}\n"
 
-    text += "━━━━━━━━━━━━━━━━━━━━\n"
+        text += f"\n📁 <i>Категория: {product.category.name if product.category else '—'}</i>"
 
-    if product.description:
-        text += f"\n📝 {product.description}\n"
+        # Клавиатура с навигацией
+        keyboard = await build_product_detail_keyboard(
+            product_id=product.id,
+            category_id=category_id,
+            current_index=product_index,
+            total_products=page.total,
+        )
 
-    text += f"\n📁 <i>Категория: {product.category.name if product.category else '—'}</i>"
+        card = ProductCard(product.id, product.photo_file_id, text, keyboard)
+        ProductCardCache.set(category_id, product_index, card)
 
-    # Клавиатура с навигацией
-    keyboard = await build_product_detail_keyboard(
-        product_id=product.id,
-        category_id=category_id,
-        current_index=product_index,
-        total_products=len(products),
-    )
+    text, keyboard = card.text, card.keyboard
 
     # Если есть фото, отправляем/обновляем с фото
-    if product.photo_file_id:
+    if card.photo_file_id:
         # Сохраняем в историю навигации
         await NavigationStack.push(
             state=state,
             text=text,
             markup=keyboard,
-            photo_file_id=product.photo_file_id,
+            photo_file_id=card.photo_file_id,
             callback_data=callback.data,
-            product_id=product.id,
+            product_id=card.product_id,
         )
 
         try:
             # Пробуем отредактировать медиа
             await callback.message.edit_media(
-                media=__import__('aiogram.types', fromlist=['InputMediaPhoto']).InputMediaPhoto(
-                    media=product.photo_file_id,
+                media=InputMediaPhoto(
+                    media=card.photo_file_id,
                     caption=text,
                     parse_mode="HTML",
                 ),
@@ -365,7 +367,7 @@ async def show_product_detail(
             # Если не получилось отредактировать, удаляем и отправляем новое
             await callback.message.delete()
             await callback.message.answer_photo(
-                photo=product.photo_file_id,
+                photo=card.photo_file_id,
                 caption=text,
                 reply_markup=keyboard,
                 parse_mode="HTML",
@@ -383,6 +385,6 @@ async def show_product_detail(
     logger.info(
         "Product viewed",
         user_id=callback.from_user.id,
-        product_id=product.id,
+        product_id=card.product_id,
         product_index=product_index,
     )
@@ -4,10 +4,12 @@ from aiogram import F, Router
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
-from aiogram.types import CallbackQuery, Message, ReplyKeyboardRemove
+from aiogram.types import CallbackQuery, InlineKeyboardButton, Message, ReplyKeyboardRemove
 from aiogram.exceptions import TelegramBadRequest
+from aiogram.utils.keyboard import InlineKeyboardBuilder
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.bot.keyboards.cart import get_add_to_cart_keyboard
 from src.bot.keyboards.orders import (
     get_color_selection_keyboard,
     get_size_selection_keyboard,
@@ -20,14 +22,15 @@ from src.core.logging import get_logger
 from src.database.models.user import User
 from src.services.order_service import OrderService
 from src.services.product_service import ProductService
+from src.services.settings_cache import SettingsCache
 from src.services.notification_service import NotificationService
 from src.utils.navigation import NavigationStack
+from src.utils.validators import validate_contact
 
 logger = get_logger(__name__)
 
 router = Router(name="order_dialog")
 
-
 class OrderStates(StatesGroup):
     """Состояния оформления заказа."""
 
@@ -284,8 +287,6 @@ async def process_quantity_selection(
         callback: CallbackQuery
         state: FSM контекст
     """
-    from src.bot.keyboards.cart import get_add_to_cart_keyboard
-
     parts = callback.data.split(":")
     product_id = int(parts[1])
     size = parts[2]
@@ -423,13 +424,11 @@ async def process_manual_contact(
         message: Message с контактом
         state: FSM контекст
     """
-    contact = message.text.strip()
-
-    if len(contact) < 5:
-        await message.answer(
-            "❌ Контакт слишком короткий. Введите корректный контакт.",
-            parse_mode="HTML",
-        )
+    # Валидация контакта (длина и формат) - до записи в FSM
+    try:
+        contact, _ = validate_contact(message.text)
+    except ValueError as e:
+        await message.answer(str(e), parse_mode="HTML")
         return
 
     # Сохраняем контакт
@@ -534,8 +533,7 @@ async def confirm_and_create_order(
         await session.commit()
 
         # Получаем настройки платежей для альтернативного контакта
-        from src.database.models.payment_settings import PaymentSettings
-        payment_settings = await PaymentSettings.get_current_settings(session)
+        payment_settings = await SettingsCache.get_payment_settings(session)
         alternative_contact = payment_settings.alternative_contact_username if payment_settings else None
 
         # Уведомляем пользователя
@@ -599,9 +597,6 @@ async def cancel_from_confirmation(
     )
 
     # Используем клавиатуру с вариантами действий
-    from aiogram.types import InlineKeyboardButton
-    from aiogram.utils.keyboard import InlineKeyboardBuilder
-
     builder = InlineKeyboardBuilder()
     builder.row(
         InlineKeyboardButton(text="📦 Каталог", callback_data="catalog")
@@ -1,9 +1,52 @@
 """Клавиатуры для работы с корзиной."""
 
+from decimal import Decimal
+
+from aiogram.filters.callback_data import CallbackData
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
-from src.database.models.cart import CartItem
+from src.services.cart_service import CartLine
+
+
+class CartAddCb(CallbackData, prefix="cart_add"):
+    """Callback data для добавления товара в корзину."""
+
+    product_id: int
+    size: str
+    quantity: int
+    color: str | None = None
+
+
+class QuickOrderCb(CallbackData, prefix="quick_order"):
+    """Callback data для быстрого заказа товара без корзины."""
+
+    product_id: int
+    size: str
+    quantity: int
+    color: str | None = None
+
+
+class CartItemCb(CallbackData, prefix="cart_item"):
+    """Callback data для просмотра товара в корзине."""
+
+    item_id: int
+
+
+class CartQtyCb(CallbackData, prefix="cart_qty"):
+    """Callback data для изменения количества товара в корзине.
+
+    Действия: plus, minus.
+    """
+
+    item_id: int
+    action: str
+
+
+class CartRemoveCb(CallbackData, prefix="cart_remove"):
+    """Callback data для удаления товара из корзины."""
+
+    item_id: int
 
 
 def get_add_to_cart_keyboard(
@@ -20,32 +63,24 @@ def get_add_to_cart_keyboard(
     Returns:
         Inline клавиатура
     """
-    builder = InlineKeyboardBuilder()
-
     # Формируем callback_data с учетом цвета
-    add_cart_data = f"cart_add:{product_id}:{size}:{quantity}"
-    quick_order_data = f"quick_order:{product_id}:{size}:{quantity}"
-    if color:
-        add_cart_data += f":{color}"
-        quick_order_data += f":{color}"
-
-    # Два логичных варианта: добавить в корзину или заказать сразу
-    builder.row(
-        InlineKeyboardButton(
-            text="🛒 Добавить в корзину",
-            callback_data=add_cart_data,
-        )
-    )
-
-    builder.row(
-        InlineKeyboardButton(
-            text="✅ Заказать сейчас",
-            callback_data=quick_order_data,
-        )
+    add_cart_data = CartAddCb(
+        product_id=product_id, size=size, quantity=quantity, color=color
+    ).pack()
+    quick_order_data = QuickOrderCb(
+        product_id=product_id, size=size, quantity=quantity, color=color
+    ).pack()
+
+    # Два логичных варианта: добавить в корзину или заказать сразу.
+    # Разметка собирается напрямую, без InlineKeyboardBuilder: клавиатура
+    # строится на каждый выбор товара
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [InlineKeyboardButton(text="🛒 Добавить в корзину", callback_data=add_cart_data)],
+            [InlineKeyboardButton(text="✅ Заказать сейчас", callback_data=quick_order_data)],
+        ]
     )
 
-    return builder.as_markup()
-
 
 def get_cart_added_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура после добавления товара в корзину.
@@ -72,11 +107,11 @@ def get_cart_added_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
-def get_cart_view_keyboard(cart_items: list[CartItem]) -> InlineKeyboardMarkup:
+def get_cart_view_keyboard(cart_items: list[CartLine]) -> InlineKeyboardMarkup:
     """Клавиатура просмотра корзины.
 
     Args:
-        cart_items: Товары в корзине
+        cart_items: Строки корзины
 
     Returns:
         Inline клавиатура
@@ -88,7 +123,7 @@ def get_cart_view_keyboard(cart_items: list[CartItem]) -> InlineKeyboardMarkup:
         builder.row(
             InlineKeyboardButton(
                 text=f"{item.display_name} - {item.quantity} шт.",
-                callback_data=f"cart_item:{item.id}",
+                callback_data=CartItemCb(item_id=item.id).pack(),
             )
         )
 
@@ -144,7 +179,7 @@ def get_cart_item_keyboard(cart_item_id: int, current_quantity: int) -> InlineKe
         row_buttons.append(
             InlineKeyboardButton(
                 text="➖",
-                callback_data=f"cart_qty:{cart_item_id}:minus",
+                callback_data=CartQtyCb(item_id=cart_item_id, action="minus").pack(),
             )
         )
 
@@ -161,7 +196,7 @@ def get_cart_item_keyboard(cart_item_id: int, current_quantity: int) -> InlineKe
         row_buttons.append(
             InlineKeyboardButton(
                 text="➕",
-                callback_data=f"cart_qty:{cart_item_id}:plus",
+                callback_data=CartQtyCb(item_id=cart_item_id, action="plus").pack(),
             )
         )
 
@@ -171,7 +206,7 @@ def get_cart_item_keyboard(cart_item_id: int, current_quantity: int) -> InlineKe
     builder.row(
         InlineKeyboardButton(
             text="🗑 Удалить из корзины",
-            callback_data=f"cart_remove:{cart_item_id}",
+            callback_data=CartRemoveCb(item_id=cart_item_id).pack(),
         )
     )
 
@@ -206,3 +241,29 @@ def get_cart_clear_confirm_keyboard() -> InlineKeyboardMarkup:
     )
 
     return builder.as_markup()
+
+
+def get_use_bonuses_keyboard(
+    bonus_amount: Decimal, yes_callback: str, no_callback: str
+) -> InlineKeyboardMarkup:
+    """Клавиатура выбора оплаты бонусами.
+
+    Args:
+        bonus_amount: Сумма, которую можно оплатить бонусами
+        yes_callback: Callback data для согласия
+        no_callback: Callback data для отказа
+
+    Returns:
+        Inline клавиатура
+    """
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [
+                InlineKeyboardButton(
+                    text=f"✅ Да, использовать {bonus_amount:.2f} ₽",
+                    callback_data=yes_callback,
+                )
+            ],
+            [InlineKeyboardButton(text="❌ Нет, оплачу полностью", callback_data=no_callback)],
+        ]
+    )
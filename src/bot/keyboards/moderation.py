@@ -1,9 +1,22 @@
 """Клавиатуры для модерации."""
 
+from aiogram.filters.callback_data import CallbackData
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
 
+class SpamPatternCallback(CallbackData, prefix="spam"):
+    """Callback data для управления спам-паттернами.
+
+    Действия: list, page, view, toggle, delete, delete_confirm, add, type.
+    """
+
+    action: str
+    pattern_id: int = 0
+    pattern_type: str | None = None
+    page: int = 0
+
+
 def get_moderation_keyboard(moderated_message_id: int) -> InlineKeyboardMarkup:
     """Клавиатура для модерации сообщения.
 
@@ -67,7 +80,9 @@ def get_spam_pattern_keyboard(pattern_id: int, is_active: bool) -> InlineKeyboar
     builder.row(
         InlineKeyboardButton(
             text=toggle_text,
-            callback_data=f"spam_toggle:{pattern_id}",
+            callback_data=SpamPatternCallback(
+                action="toggle", pattern_id=pattern_id
+            ).pack(),
         )
     )
 
@@ -75,12 +90,16 @@ def get_spam_pattern_keyboard(pattern_id: int, is_active: bool) -> InlineKeyboar
     builder.row(
         InlineKeyboardButton(
             text="🗑 Удалить паттерн",
-            callback_data=f"spam_delete:{pattern_id}",
+            callback_data=SpamPatternCallback(
+                action="delete", pattern_id=pattern_id
+            ).pack(),
         )
     )
 
     builder.row(
-        InlineKeyboardButton(text="◀️ Назад", callback_data="spam_list")
+        InlineKeyboardButton(
+            text="◀️ Назад", callback_data=SpamPatternCallback(action="list").pack()
+        )
     )
 
     return builder.as_markup()
@@ -114,7 +133,7 @@ def get_spam_patterns_list_keyboard(
         builder.row(
             InlineKeyboardButton(
                 text=f"{status} {type_emoji} {display_text}",
-                callback_data=f"spam_view:{pattern_id}",
+                callback_data=SpamPatternCallback(action="view", pattern_id=pattern_id).pack(),
             )
         )
 
@@ -122,7 +141,7 @@ def get_spam_patterns_list_keyboard(
     builder.row(
         InlineKeyboardButton(
             text="➕ Добавить паттерн",
-            callback_data="spam_add",
+            callback_data=SpamPatternCallback(action="add").pack(),
         )
     )
 
@@ -130,14 +149,23 @@ def get_spam_patterns_list_keyboard(
     nav_buttons = []
     if page > 0:
         nav_buttons.append(
-            InlineKeyboardButton(text="◀️ Назад", callback_data=f"spam_page:{page-1}")
+            InlineKeyboardButton(
+                text="◀️ Назад",
+                callback_data=SpamPatternCallback(action="page", page=page - 1).pack(),
+            )
         )
     nav_buttons.append(
-        InlineKeyboardButton(text="🔄 Обновить", callback_data=f"spam_page:{page}")
+        InlineKeyboardButton(
+            text="🔄 Обновить",
+            callback_data=SpamPatternCallback(action="page", page=page).pack(),
+        )
     )
     if len(patterns) >= 10:  # Если показаны все 10, может быть ещё страница
         nav_buttons.append(
-            InlineKeyboardButton(text="▶️ Вперед", callback_data=f"spam_page:{page+1}")
+            InlineKeyboardButton(
+                text="▶️ Вперед",
+                callback_data=SpamPatternCallback(action="page", page=page + 1).pack(),
+            )
         )
 
     if nav_buttons:
@@ -193,26 +221,28 @@ def get_spam_type_keyboard() -> InlineKeyboardMarkup:
     builder.row(
         InlineKeyboardButton(
             text="🔤 Ключевое слово",
-            callback_data="spam_type:keyword",
+            callback_data=SpamPatternCallback(action="type", pattern_type="keyword").pack(),
         )
     )
 
     builder.row(
         InlineKeyboardButton(
             text="🔧 Регулярное выражение",
-            callback_data="spam_type:regex",
+            callback_data=SpamPatternCallback(action="type", pattern_type="regex").pack(),
         )
     )
 
     builder.row(
         InlineKeyboardButton(
             text="🔗 URL паттерн",
-            callback_data="spam_type:url",
+            callback_data=SpamPatternCallback(action="type", pattern_type="url").pack(),
         )
     )
 
     builder.row(
-        InlineKeyboardButton(text="◀️ Отмена", callback_data="spam_list")
+        InlineKeyboardButton(
+            text="◀️ Отмена", callback_data=SpamPatternCallback(action="list").pack()
+        )
     )
 
     return builder.as_markup()
@@ -232,11 +262,13 @@ def get_confirm_delete_keyboard(pattern_id: int) -> InlineKeyboardMarkup:
     builder.row(
         InlineKeyboardButton(
             text="✅ Да, удалить",
-            callback_data=f"spam_delete_confirm:{pattern_id}",
+            callback_data=SpamPatternCallback(
+                action="delete_confirm", pattern_id=pattern_id
+            ).pack(),
         ),
         InlineKeyboardButton(
             text="❌ Отмена",
-            callback_data=f"spam_view:{pattern_id}",
+            callback_data=SpamPatternCallback(action="view", pattern_id=pattern_id).pack(),
         ),
     )
 
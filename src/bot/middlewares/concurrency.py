@@ -0,0 +1,69 @@
+"""Middleware для ограничения параллельности тяжёлых обработчиков."""
+
+import asyncio
+from typing import Any, Awaitable, Callable
+
+from aiogram import BaseMiddleware
+from aiogram.types import Chat, TelegramObject
+
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class HeavyTaskMiddleware(BaseMiddleware):
+    """Middleware для обработчиков с долгими агрегациями (статистика, мониторинг).
+
+    Апдейты и так обрабатываются в отдельных задачах (handle_as_tasks),
+    поэтому тяжёлый обработчик не блокирует пользовательские апдейты.
+    Middleware ограничивает число одновременных тяжёлых обработчиков,
+    чтобы они не занимали весь пул соединений БД, и сохраняет порядок
+    обработки внутри одного чата.
+    """
+
+    def __init__(self, limit: int = 2) -> None:
+        """Инициализация middleware.
+
+        Args:
+            limit: Максимальное число одновременно выполняемых обработчиков
+        """
+        self._semaphore = asyncio.Semaphore(limit)
+        # chat_id -> (блокировка чата, число ожидающих и выполняющихся обработчиков)
+        self._chat_locks: dict[int, tuple[asyncio.Lock, int]] = {}
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        """Выполнить обработчик с учётом лимита и очереди чата.
+
+        Args:
+            handler: Следующий обработчик
+            event: Событие от Telegram
+            data: Данные для передачи в обработчик
+
+        Returns:
+            Результат выполнения обработчика
+        """
+        chat: Chat | None = data.get("event_chat")
+        if not chat:
+            async with self._semaphore:
+                return await handler(event, data)
+
+        lock, users = self._chat_locks.get(chat.id, (asyncio.Lock(), 0))
+        self._chat_locks[chat.id] = (lock, users + 1)
+        try:
+            async with lock:
+                if self._semaphore.locked():
+                    logger.debug("Heavy handler queued", chat_id=chat.id)
+                async with self._semaphore:
+                    return await handler(event, data)
+        finally:
+            # Удаляем блокировку чата, когда её больше никто не использует
+            lock, users = self._chat_locks[chat.id]
+            if users == 1:
+                del self._chat_locks[chat.id]
+            else:
+                self._chat_locks[chat.id] = (lock, users - 1)
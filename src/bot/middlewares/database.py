@@ -10,7 +10,15 @@ from src.database.repositories import OrderRepository, ProductRepository, UserRe
 
 
 class DatabaseMiddleware(BaseMiddleware):
-    """Middleware для добавления репозиториев в контекст обработчиков."""
+    """Middleware для добавления репозиториев в контекст обработчиков.
+
+    Открывает сессию на время обработки апдейта и фиксирует её одним
+    коммитом после успешного обработчика (при ошибке - откат), поэтому
+    сервисам достаточно flush(). Обработчики, которые после изменения
+    обращаются к Telegram API, фиксируют сессию сами до этих запросов:
+    ошибка Telegram не откатывает изменение, а соединение и блокировки
+    строк не удерживаются на время HTTP-запросов.
+    """
 
     async def __call__(
         self,
@@ -36,8 +44,16 @@ class DatabaseMiddleware(BaseMiddleware):
             data["order_repo"] = OrderRepository(session)
 
             try:
-                return await handler(event, data)
+                result = await handler(event, data)
             except Exception as e:
                 # Откат транзакции при ошибке
                 await session.rollback()
                 raise e
+
+            # Один коммит на апдейт; если обработчик перехватил ошибку БД,
+            # транзакция уже неактивна и её остаётся только откатить
+            if session.is_active:
+                await session.commit()
+            else:
+                await session.rollback()
+            return result
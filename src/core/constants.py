@@ -225,6 +225,7 @@ class Limits:
     # Пользователь
     MAX_NAME_LENGTH = 100
     MAX_PHONE_LENGTH = 20
+    MAX_CONTACT_LENGTH = 128  # Контакт для связи (телефон, username, email)
     MAX_ADDRESS_LENGTH = 500
     MAX_COMMENT_LENGTH = 500
 
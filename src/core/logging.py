@@ -2,6 +2,7 @@
 
 import logging
 import sys
+import time
 from pathlib import Path
 from typing import Any
 
@@ -46,6 +47,8 @@ def setup_logging() -> None:
     # Настройка structlog
     structlog.configure(
         processors=[
+            # Отбрасываем записи ниже уровня логгера до остальных процессоров
+            structlog.stdlib.filter_by_level,
             *shared_processors,
             structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
@@ -95,3 +98,34 @@ def setup_logging() -> None:
 def get_logger(name: str) -> structlog.BoundLogger:
     """Получить logger с указанным именем."""
     return structlog.get_logger(name)
+
+
+class TracebackThrottle:
+    """Ограничение частоты записи полных traceback в лог.
+
+    Форматирование traceback выполняется в потоке event loop и заметно
+    нагружает его, если ошибка повторяется на каждом апдейте (например,
+    при недоступной БД). Throttle разрешает traceback не чаще одного раза
+    за интервал, остальные записи содержат только поля ошибки.
+    """
+
+    def __init__(self, interval: float = 1.0) -> None:
+        """Инициализация throttle.
+
+        Args:
+            interval: Минимальный интервал между traceback (секунды)
+        """
+        self._interval = interval
+        self._last_emitted = float("-inf")
+
+    def allow(self) -> bool:
+        """Можно ли сейчас записать traceback.
+
+        Returns:
+            True, если с прошлого traceback прошло не меньше интервала
+        """
+        now = time.monotonic()
+        if now - self._last_emitted < self._interval:
+            return False
+        self._last_emitted = now
+        return True
@@ -19,7 +19,7 @@ class BonusTransaction(Base, TimestampMixin):
 
     __tablename__ = "bonus_transactions"
     __table_args__ = (
-        Index("ix_bonus_transactions_user_id", "user_id"),
+        Index("ix_bonus_transactions_user_id_created_at", "user_id", "created_at", "id"),
         Index("ix_bonus_transactions_transaction_type", "transaction_type"),
         Index("ix_bonus_transactions_created_at", "created_at"),
         {"comment": "История транзакций бонусов"},
@@ -1,5 +1,6 @@
 """Модели корзины покупок."""
 
+from decimal import Decimal
 from typing import TYPE_CHECKING
 
 from sqlalchemy import BigInteger, ForeignKey, Index, Integer, String
@@ -105,6 +106,16 @@ class CartItem(Base, TimestampMixin):
     cart: Mapped["Cart"] = relationship("Cart", back_populates="items")
     product: Mapped["Product"] = relationship("Product", lazy="selectin")
 
+    @property
+    def total_price(self) -> Decimal:
+        """Общая стоимость позиции (цена * количество)."""
+        return self.product.price * self.quantity
+
+    @property
+    def formatted_total_price(self) -> str:
+        """Форматированная стоимость позиции с валютой."""
+        return f"{self.total_price:,.2f} ₽"
+
     @property
     def display_name(self) -> str:
         """Полное название товара для отображения."""
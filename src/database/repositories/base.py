@@ -1,6 +1,6 @@
 """Базовый класс репозитория для работы с базой данных."""
 
-from typing import Any, Generic, Type, TypeVar
+from typing import Any, Generic, Self, Type, TypeVar
 
 from sqlalchemy import delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -23,6 +23,27 @@ class BaseRepository(Generic[ModelType]):
         self.model = model
         self.session = session
 
+    @classmethod
+    def for_session(cls, session: AsyncSession) -> Self:
+        """Получить репозиторий, привязанный к сессии.
+
+        Экземпляр создаётся один раз на сессию и хранится в session.info,
+        поэтому обработчики и сервисы в рамках одного апдейта используют
+        один и тот же репозиторий. Только для наследников с конструктором
+        вида ``__init__(self, session)``.
+
+        Args:
+            session: Async сессия базы данных
+
+        Returns:
+            Репозиторий для сессии
+        """
+        repo = session.info.get(cls)
+        if repo is None:
+            repo = cls(session)  # type: ignore[call-arg]
+            session.info[cls] = repo
+        return repo
+
     async def get(self, id: Any) -> ModelType | None:
         """Получить запись по ID.
 
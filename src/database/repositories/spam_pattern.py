@@ -24,6 +24,27 @@ class SpamPatternRepository(BaseRepository[SpamPattern]):
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def stream_active_patterns(self) -> list[tuple[int, str, str, bool]]:
+        """Получить активные паттерны в виде кортежей без создания ORM-объектов.
+
+        Строки читаются серверным курсором порциями по 100 штук.
+
+        Returns:
+            Список кортежей (id, pattern, pattern_type, is_active)
+        """
+        stmt = select(
+            SpamPattern.id,
+            SpamPattern.pattern,
+            SpamPattern.pattern_type,
+            SpamPattern.is_active,
+        ).where(SpamPattern.is_active == True)
+        result = await self.session.stream(stmt.execution_options(yield_per=100))
+
+        patterns: list[tuple[int, str, str, bool]] = []
+        async for partition in result.partitions(100):
+            patterns.extend(tuple(row) for row in partition)
+        return patterns
+
     async def get_by_type(self, pattern_type: str) -> list[SpamPattern]:
         """Получить паттерны по типу.
 
@@ -4,8 +4,10 @@ import asyncio
 import sys
 from typing import Any
 
+import orjson
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
+from aiogram.client.session.aiohttp import AiohttpSession
 from aiogram.enums import ParseMode
 from aiogram.fsm.storage.redis import RedisStorage
 
@@ -127,9 +129,13 @@ async def main() -> None:
         log_level=settings.log_level,
     )
 
-    # Создание бота
+    # Создание бота (запросы к Bot API сериализуются через orjson)
     bot = Bot(
         token=settings.bot_token,
+        session=AiohttpSession(
+            json_loads=orjson.loads,
+            json_dumps=lambda obj: orjson.dumps(obj).decode(),
+        ),
         default=DefaultBotProperties(
             parse_mode=ParseMode.HTML,
         ),
@@ -166,6 +172,7 @@ async def main() -> None:
             bot,
             allowed_updates=dp.resolve_used_update_types(),
             drop_pending_updates=True,  # Пропускаем накопившиеся обновления
+            handle_as_tasks=True,  # Каждый апдейт в отдельной задаче, без блокировки polling
         )
     except Exception as e:
         logger.error("Fatal error", error=str(e), exc_info=True)
@@ -1,9 +1,11 @@
 """Сервис для работы с бонусами."""
 
+from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import select
+from sqlalchemy import select, true, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, lazyload
 
 from src.core.logging import get_logger
 from src.database.models.bot_settings import BotSettings
@@ -295,27 +297,81 @@ class BonusService:
         return transaction
 
     async def get_user_transactions(
-        self, user_id: int, limit: int = 50, offset: int = 0
+        self,
+        user_id: int,
+        limit: int = 50,
+        offset: int = 0,
+        before: tuple[datetime, int] | None = None,
     ) -> list[BonusTransaction]:
         """Получить историю транзакций пользователя.
 
+        Для постраничного просмотра передавайте before - (created_at, id)
+        последней показанной транзакции: выборка продолжится с неё по индексу
+        (user_id, created_at, id) без пропуска строк через OFFSET.
+        Связи транзакций не подгружаются.
+
         Args:
             user_id: ID пользователя
             limit: Максимальное количество
             offset: Смещение
+            before: Курсор (created_at, id) - вернуть транзакции старше него
 
         Returns:
             Список транзакций
         """
+        query = select(BonusTransaction).where(BonusTransaction.user_id == user_id)
+
+        if before is not None:
+            query = query.where(
+                tuple_(BonusTransaction.created_at, BonusTransaction.id) < tuple_(*before)
+            )
+
         result = await self.session.execute(
-            select(BonusTransaction)
-            .where(BonusTransaction.user_id == user_id)
-            .order_by(BonusTransaction.created_at.desc())
+            query.order_by(BonusTransaction.created_at.desc(), BonusTransaction.id.desc())
             .limit(limit)
             .offset(offset)
+            .options(lazyload("*"))
         )
         return list(result.scalars().all())
 
+    async def get_balance_and_recent(
+        self, user_id: int, limit: int = 5
+    ) -> tuple[Decimal, list[BonusTransaction]]:
+        """Получить баланс и последние транзакции пользователя одним запросом.
+
+        Последние транзакции выбираются подзапросом и присоединяются
+        к строке пользователя через LEFT JOIN, поэтому баланс возвращается
+        даже при пустой истории. Связи транзакций не подгружаются.
+
+        Args:
+            user_id: ID пользователя
+            limit: Количество последних транзакций
+
+        Returns:
+            Кортеж (баланс бонусов, список транзакций)
+        """
+        recent = (
+            select(BonusTransaction)
+            .where(BonusTransaction.user_id == user_id)
+            .order_by(BonusTransaction.created_at.desc(), BonusTransaction.id.desc())
+            .limit(limit)
+            .subquery()
+        )
+        recent_transaction = aliased(BonusTransaction, recent)
+
+        result = await self.session.execute(
+            select(User.bonus_balance, recent_transaction)
+            .outerjoin(recent, true())
+            .where(User.id == user_id)
+            .order_by(recent.c.created_at.desc(), recent.c.id.desc())
+            .options(lazyload("*"))
+        )
+        rows = result.all()
+
+        balance = rows[0][0] if rows else None
+        transactions = [transaction for _, transaction in rows if transaction is not None]
+        return balance or Decimal("0"), transactions
+
     async def calculate_max_bonus_discount(self, order_amount: Decimal) -> Decimal:
         """Рассчитать максимальную скидку бонусами для заказа.
 
@@ -1,17 +1,55 @@
 """Сервис для работы с корзиной покупок."""
 
-from sqlalchemy import select
+import time
+from decimal import Decimal
+from typing import ClassVar, NamedTuple
+
+from sqlalchemy import delete, event, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
 from src.core.logging import get_logger
 from src.database.models.cart import Cart, CartItem
+from src.database.models.product import Product
 
 logger = get_logger(__name__)
 
+# Время жизни и размер кэша строк корзины
+CART_LINES_TTL = 300.0
+CART_LINES_MAX_SIZE = 4096
+
+
+class CartSummary(NamedTuple):
+    """Товары корзины вместе с итогами."""
+
+    items: list[CartItem]
+    total_price: Decimal
+    total_quantity: int
+
+
+class QuantityChange(NamedTuple):
+    """Результат изменения количества товара в корзине."""
+
+    item: CartItem | None
+    removed_id: int | None
+
+
+class CartLine(NamedTuple):
+    """Строка корзины для отображения, не привязанная к сессии БД."""
+
+    id: int
+    display_name: str
+    quantity: int
+    formatted_price: str
+    total_price: Decimal
+
 
 class CartService:
     """Сервис для управления корзиной покупок."""
 
+    # user_id -> (время загрузки, строки корзины)
+    _lines: ClassVar[dict[int, tuple[float, list[CartLine]]]] = {}
+
     def __init__(self, session: AsyncSession):
         """Инициализация сервиса.
 
@@ -80,6 +118,8 @@ class CartService:
         )
         existing_item = result.scalar_one_or_none()
 
+        self._invalidate_after_commit(user_id)
+
         if existing_item:
             # Обновляем количество
             existing_item.quantity += quantity
@@ -114,7 +154,7 @@ class CartService:
         )
         return cart_item
 
-    async def remove_item(self, user_id: int, cart_item_id: int) -> bool:
+    async def remove_item(self, user_id: int, cart_item_id: int) -> int | None:
         """Удалить товар из корзины.
 
         Args:
@@ -122,30 +162,23 @@ class CartService:
             cart_item_id: ID товара в корзине
 
         Returns:
-            True если удалено успешно
+            ID удалённого товара или None, если он не найден
         """
-        cart = await self.get_or_create_cart(user_id)
-
-        result = await self.session.execute(
-            select(CartItem).where(
-                CartItem.id == cart_item_id,
-                CartItem.cart_id == cart.id,
-            )
-        )
-        cart_item = result.scalar_one_or_none()
+        cart_item = await self.get_cart_item(user_id, cart_item_id)
 
         if not cart_item:
-            return False
+            return None
 
         await self.session.delete(cart_item)
         await self.session.flush()
+        self._invalidate_after_commit(user_id)
 
         logger.info(
             "Cart item removed",
             user_id=user_id,
             cart_item_id=cart_item_id,
         )
-        return True
+        return cart_item_id
 
     async def update_quantity(
         self, user_id: int, cart_item_id: int, quantity: int
@@ -165,21 +198,14 @@ class CartService:
             await self.remove_item(user_id, cart_item_id)
             return None
 
-        cart = await self.get_or_create_cart(user_id)
-
-        result = await self.session.execute(
-            select(CartItem).where(
-                CartItem.id == cart_item_id,
-                CartItem.cart_id == cart.id,
-            )
-        )
-        cart_item = result.scalar_one_or_none()
+        cart_item = await self.get_cart_item(user_id, cart_item_id)
 
         if not cart_item:
             return None
 
         cart_item.quantity = quantity
         await self.session.flush()
+        self._invalidate_after_commit(user_id)
         await self.session.refresh(cart_item)
 
         logger.info(
@@ -190,6 +216,55 @@ class CartService:
         )
         return cart_item
 
+    async def adjust_quantity(
+        self, user_id: int, cart_item_id: int, delta: int
+    ) -> QuantityChange:
+        """Атомарно изменить количество товара в корзине на delta.
+
+        Количество меняется одним UPDATE ... RETURNING без предварительного
+        чтения, поэтому одновременные нажатия не затирают друг друга.
+
+        Args:
+            user_id: ID пользователя
+            cart_item_id: ID товара в корзине
+            delta: Изменение количества (например, +1 или -1)
+
+        Returns:
+            Обновленный товар (None, если товар не найден или удален)
+            и ID товара, удалённого из-за нулевого количества
+        """
+        user_cart_ids = select(Cart.id).where(Cart.user_id == user_id)
+        result = await self.session.execute(
+            update(CartItem)
+            .where(CartItem.id == cart_item_id, CartItem.cart_id.in_(user_cart_ids))
+            .values(quantity=func.greatest(CartItem.quantity + delta, 0))
+            .returning(CartItem.quantity)
+        )
+        quantity = result.scalar_one_or_none()
+
+        if quantity is None:
+            return QuantityChange(None, None)
+
+        self._invalidate_after_commit(user_id)
+
+        if quantity < 1:
+            # Количество дошло до нуля - удаляем товар
+            await self.session.execute(delete(CartItem).where(CartItem.id == cart_item_id))
+            logger.info(
+                "Cart item removed",
+                user_id=user_id,
+                cart_item_id=cart_item_id,
+            )
+            return QuantityChange(None, cart_item_id)
+
+        logger.info(
+            "Cart item quantity updated",
+            user_id=user_id,
+            cart_item_id=cart_item_id,
+            new_quantity=quantity,
+        )
+        return QuantityChange(await self.get_cart_item(user_id, cart_item_id), None)
+
     async def clear_cart(self, user_id: int) -> bool:
         """Очистить корзину пользователя.
 
@@ -212,6 +287,7 @@ class CartService:
             await self.session.delete(item)
 
         await self.session.flush()
+        self._invalidate_after_commit(user_id)
 
         logger.info("Cart cleared", user_id=user_id, cart_id=cart.id)
         return True
@@ -230,6 +306,30 @@ class CartService:
         )
         return result.scalar_one_or_none()
 
+    async def get_cart_item(self, user_id: int, cart_item_id: int) -> CartItem | None:
+        """Получить один товар из корзины пользователя.
+
+        Товар загружается одним запросом вместе с данными продукта;
+        связи продукта (категория, отзывы) не подгружаются.
+
+        Args:
+            user_id: ID пользователя
+            cart_item_id: ID товара в корзине
+
+        Returns:
+            Товар в корзине или None, если он не найден в корзине пользователя
+        """
+        result = await self.session.execute(
+            select(CartItem)
+            .join(CartItem.cart)
+            .where(
+                CartItem.id == cart_item_id,
+                Cart.user_id == user_id,
+            )
+            .options(joinedload(CartItem.product).lazyload("*"))
+        )
+        return result.scalar_one_or_none()
+
     async def get_cart_items(self, user_id: int) -> list[CartItem]:
         """Получить все товары из корзины пользователя.
 
@@ -239,10 +339,123 @@ class CartService:
         Returns:
             Список товаров в корзине
         """
-        cart = await self.get_cart(user_id)
-        if not cart:
-            return []
-        return cart.items
+        # Товары и продукты загружаются одним запросом с JOIN. Для списка
+        # корзины нужны только название и цена - описание и JSON-поля
+        # товара (размеры, цвета, медиа) не загружаем
+        result = await self.session.execute(
+            select(CartItem)
+            .join(CartItem.cart)
+            .where(Cart.user_id == user_id)
+            .options(
+                joinedload(CartItem.product)
+                .load_only(Product.id, Product.name, Product.price)
+                .lazyload("*")
+            )
+            .order_by(CartItem.id)
+        )
+        return list(result.scalars().all())
+
+    async def get_cart_lines(
+        self, user_id: int, cached: bool = True, ttl: float = CART_LINES_TTL
+    ) -> list[CartLine]:
+        """Получить строки корзины для отображения с кэшированием.
+
+        Кэш сбрасывается при любом изменении корзины. Для оформления
+        заказа используется get_cart_items - он всегда читает БД.
+
+        Args:
+            user_id: ID пользователя
+            cached: Использовать кэш (False - сразу после изменения корзины
+                в текущей транзакции, чтобы не закэшировать незафиксированные данные)
+            ttl: Время жизни кэша в секундах
+
+        Returns:
+            Строки корзины
+        """
+        if cached:
+            lines = self.get_cached_lines(user_id, ttl)
+            if lines is not None:
+                return lines
+
+        lines = [
+            CartLine(
+                id=item.id,
+                display_name=item.display_name,
+                quantity=item.quantity,
+                formatted_price=item.product.formatted_price,
+                total_price=item.total_price,
+            )
+            for item in await self.get_cart_items(user_id)
+        ]
+
+        if cached:
+            cache = CartService._lines
+            cache.pop(user_id, None)
+            if len(cache) >= CART_LINES_MAX_SIZE:
+                # Вытесняем самую давнюю запись (словарь хранит порядок вставки)
+                del cache[next(iter(cache))]
+            cache[user_id] = (time.monotonic(), lines)
+        return lines
+
+    def get_cached_lines(
+        self, user_id: int, ttl: float = CART_LINES_TTL
+    ) -> list[CartLine] | None:
+        """Получить строки корзины только из кэша, без запроса к БД.
+
+        Args:
+            user_id: ID пользователя
+            ttl: Время жизни кэша в секундах
+
+        Returns:
+            Строки корзины или None, если их нет в кэше
+        """
+        entry = CartService._lines.get(user_id)
+        if entry and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+        return None
+
+    async def get_lines_after_removal(
+        self,
+        user_id: int,
+        lines_before: list[CartLine] | None,
+        removed_id: int | None,
+    ) -> list[CartLine]:
+        """Получить строки корзины после удаления товара.
+
+        Строки берутся из снимка корзины до удаления без удалённой строки;
+        запрос к БД выполняется, только если снимка не было в кэше.
+
+        Args:
+            user_id: ID пользователя
+            lines_before: Строки из кэша до удаления (get_cached_lines)
+            removed_id: ID удалённого товара (None - ничего не удалено)
+
+        Returns:
+            Строки корзины
+        """
+        if lines_before is None:
+            # Изменение могло быть ещё не зафиксировано - результат не кэшируем
+            return await self.get_cart_lines(user_id, cached=False)
+        return [line for line in lines_before if line.id != removed_id]
+
+    async def get_cart_summary(self, user_id: int) -> CartSummary:
+        """Получить товары корзины и посчитать итоги за один проход.
+
+        Args:
+            user_id: ID пользователя
+
+        Returns:
+            Товары корзины, общая сумма и общее количество единиц
+        """
+        items = await self.get_cart_items(user_id)
+
+        total_price = Decimal("0")
+        total_quantity = 0
+        for item in items:
+            total_price += item.total_price
+            total_quantity += item.quantity
+
+        return CartSummary(items, total_price, total_quantity)
 
     async def get_cart_total_items(self, user_id: int) -> int:
         """Получить общее количество товаров в корзине.
@@ -257,3 +470,32 @@ class CartService:
         if not cart:
             return 0
         return cart.total_items
+
+    def _invalidate_after_commit(self, user_id: int) -> None:
+        """Сбросить кэш строк корзины сейчас и после коммита транзакции.
+
+        Повторный сброс нужен, если параллельный апдейт пользователя успел
+        закэшировать корзину до фиксации изменений.
+
+        Args:
+            user_id: ID пользователя
+        """
+        CartService.invalidate(user_id)
+        event.listen(
+            self.session.sync_session,
+            "after_commit",
+            lambda _session: CartService.invalidate(user_id),
+            once=True,
+        )
+
+    @classmethod
+    def invalidate(cls, user_id: int | None = None) -> None:
+        """Сбросить кэш строк корзины.
+
+        Args:
+            user_id: ID пользователя (None - сбросить весь кэш)
+        """
+        if user_id is None:
+            cls._lines.clear()
+        else:
+            cls._lines.pop(user_id, None)
@@ -0,0 +1,73 @@
+"""Кэш готовых карточек товаров каталога."""
+
+import time
+from typing import ClassVar, NamedTuple
+
+from aiogram.types import InlineKeyboardMarkup
+
+# Время жизни и размер кэша карточек (секунды / записи)
+PRODUCT_CARD_TTL = 300.0
+PRODUCT_CARD_MAX_SIZE = 2048
+
+
+class ProductCard(NamedTuple):
+    """Готовая карточка товара на позиции в категории."""
+
+    product_id: int
+    photo_file_id: str | None
+    text: str
+    keyboard: InlineKeyboardMarkup
+
+
+class ProductCardCache:
+    """Кэш карточек товаров по (категория, позиция).
+
+    Текст и клавиатура карточки зависят только от товара, его позиции
+    и числа товаров в категории, поэтому листание каталога при попадании
+    в кэш не обращается к БД и не собирает карточку заново. Кэш
+    сбрасывается при любом изменении товаров (ProductService.invalidate).
+    """
+
+    # (category_id, index) -> (время сборки, карточка)
+    _cards: ClassVar[dict[tuple[int, int], tuple[float, ProductCard]]] = {}
+
+    @classmethod
+    def get(
+        cls, category_id: int, index: int, ttl: float = PRODUCT_CARD_TTL
+    ) -> ProductCard | None:
+        """Получить карточку товара.
+
+        Args:
+            category_id: ID категории
+            index: Позиция товара в категории
+            ttl: Время жизни кэша в секундах
+
+        Returns:
+            Карточка или None, если её нет в кэше
+        """
+        cached = cls._cards.get((category_id, index))
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        return None
+
+    @classmethod
+    def set(cls, category_id: int, index: int, card: ProductCard) -> None:
+        """Сохранить карточку товара.
+
+        Args:
+            category_id: ID категории
+            index: Позиция товара в категории
+            card: Карточка товара
+        """
+        cards = cls._cards
+        key = (category_id, index)
+        cards.pop(key, None)
+        if len(cards) >= PRODUCT_CARD_MAX_SIZE:
+            # Вытесняем самую давнюю запись (словарь хранит порядок вставки)
+            del cards[next(iter(cards))]
+        cards[key] = (time.monotonic(), card)
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Сбросить кэш (вызывается после изменения товаров или категорий)."""
+        cls._cards.clear()
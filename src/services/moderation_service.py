@@ -3,13 +3,12 @@
 import json
 import re
 from datetime import datetime
-from typing import NamedTuple
+from typing import ClassVar, NamedTuple
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.logging import get_logger
 from src.database.models.moderated_message import ModeratedMessage
-from src.database.models.spam_pattern import SpamPattern
 from src.database.repositories.moderated_message import ModeratedMessageRepository
 from src.database.repositories.spam_pattern import SpamPatternRepository
 from src.utils.text_analyzer import TextAnalyzer, calculate_text_similarity
@@ -27,6 +26,41 @@ class ModerationDecision(NamedTuple):
     status: str  # Статус: auto_approved, auto_rejected, pending
 
 
+class CompiledPatterns(NamedTuple):
+    """Активные паттерны, подготовленные для проверки текста."""
+
+    keywords: list[tuple[str, str]]  # (паттерн в нижнем регистре, исходный паттерн)
+    regexes: list[tuple[re.Pattern[str], str]]  # (скомпилированный regex, исходный паттерн)
+    urls: list[str]  # Подстроки для поиска в URL
+
+
+def compile_patterns(rows: list[tuple[int, str, str, bool]]) -> CompiledPatterns:
+    """Подготовить паттерны к проверке: regex компилируются один раз.
+
+    Args:
+        rows: Кортежи (id, pattern, pattern_type, is_active)
+
+    Returns:
+        Подготовленные паттерны
+    """
+    keywords: list[tuple[str, str]] = []
+    regexes: list[tuple[re.Pattern[str], str]] = []
+    urls: list[str] = []
+
+    for pattern_id, pattern, pattern_type, _ in rows:
+        if pattern_type == "keyword":
+            keywords.append((pattern.lower(), pattern))
+        elif pattern_type == "regex":
+            try:
+                regexes.append((re.compile(pattern, re.IGNORECASE), pattern))
+            except re.error as e:
+                logger.warning(f"Invalid regex pattern {pattern_id}: {e}")
+        elif pattern_type == "url":
+            urls.append(pattern)
+
+    return CompiledPatterns(keywords=keywords, regexes=regexes, urls=urls)
+
+
 class ModerationService:
     """Сервис для модерации сообщений."""
 
@@ -34,6 +68,10 @@ class ModerationService:
     HIGH_SPAM_THRESHOLD = 90  # Автоматическое удаление
     SUSPICIOUS_THRESHOLD = 50  # Отправка на ручную проверку
 
+    # Кеш активных паттернов общий для всех экземпляров сервиса,
+    # т.к. сервис создаётся заново в каждом обработчике
+    _patterns_cache: ClassVar[CompiledPatterns | None] = None
+
     def __init__(self, session: AsyncSession):
         """Инициализация сервиса.
 
@@ -42,23 +80,26 @@ class ModerationService:
         """
         self.session = session
         self.moderated_msg_repo = ModeratedMessageRepository(session)
-        self.spam_pattern_repo = SpamPatternRepository(session)
-        self._patterns_cache: list[SpamPattern] | None = None
+        self.spam_pattern_repo = SpamPatternRepository.for_session(session)
 
-    async def _get_patterns(self) -> list[SpamPattern]:
+    async def _get_patterns(self) -> CompiledPatterns:
         """Получить активные паттерны (с кешированием).
 
         Returns:
-            Список активных паттернов
+            Подготовленные активные паттерны
         """
-        if self._patterns_cache is None:
-            self._patterns_cache = await self.spam_pattern_repo.get_active_patterns()
-            logger.info(f"Loaded {len(self._patterns_cache)} spam patterns")
-        return self._patterns_cache
-
-    def invalidate_patterns_cache(self) -> None:
-        """Сбросить кеш паттернов."""
-        self._patterns_cache = None
+        patterns = ModerationService._patterns_cache
+        if patterns is None:
+            rows = await self.spam_pattern_repo.stream_active_patterns()
+            patterns = compile_patterns(rows)
+            ModerationService._patterns_cache = patterns
+            logger.info(f"Loaded {len(rows)} spam patterns")
+        return patterns
+
+    @classmethod
+    def invalidate_patterns_cache(cls) -> None:
+        """Сбросить кеш паттернов (без создания экземпляра сервиса)."""
+        cls._patterns_cache = None
 
     async def check_spam_patterns(self, text: str) -> tuple[int, list[str]]:
         """Проверить текст по паттернам из БД.
@@ -73,31 +114,27 @@ class ModerationService:
         score = 0
         matched = []
 
-        for pattern in patterns:
-            try:
-                if pattern.is_keyword:
-                    # Поиск ключевого слова (case-insensitive)
-                    if pattern.pattern.lower() in text.lower():
-                        score += 20
-                        matched.append(f"keyword:{pattern.pattern}")
-
-                elif pattern.is_regex:
-                    # Поиск по regex
-                    if re.search(pattern.pattern, text, re.IGNORECASE):
-                        score += 25
-                        matched.append(f"regex:{pattern.pattern[:30]}")
-
-                elif pattern.is_url:
-                    # Проверка URL паттернов
-                    urls = TextAnalyzer.extract_urls(text)
-                    for url in urls:
-                        if pattern.pattern in url:
-                            score += 30
-                            matched.append(f"url:{pattern.pattern}")
-
-            except re.error as e:
-                logger.warning(f"Invalid regex pattern {pattern.id}: {e}")
-                continue
+        if patterns.keywords:
+            # Поиск ключевых слов (case-insensitive)
+            text_lower = text.lower()
+            for keyword_lower, keyword in patterns.keywords:
+                if keyword_lower in text_lower:
+                    score += 20
+                    matched.append(f"keyword:{keyword}")
+
+        for regex, raw_pattern in patterns.regexes:
+            if regex.search(text):
+                score += 25
+                matched.append(f"regex:{raw_pattern[:30]}")
+
+        if patterns.urls:
+            # Проверка URL паттернов
+            urls = TextAnalyzer.extract_urls(text)
+            for url_pattern in patterns.urls:
+                for url in urls:
+                    if url_pattern in url:
+                        score += 30
+                        matched.append(f"url:{url_pattern}")
 
         return min(score, 100), matched
 
@@ -1,7 +1,7 @@
 """Сервис мониторинга и сбора метрик системы."""
 
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, NamedTuple
 
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -16,6 +16,116 @@ from src.database.models.user import User
 logger = get_logger(__name__)
 
 
+class UserStats(NamedTuple):
+    """Статистика пользователей."""
+
+    total: int
+    active_24h: int
+    active_7d: int
+    new_24h: int
+    new_7d: int
+    by_role: dict[str, int]
+    banned: int
+
+
+class OrderStats(NamedTuple):
+    """Статистика заказов."""
+
+    total: int
+    by_status: dict[str, int]
+    new_24h: int
+    new_7d: int
+    conversion_rate: float
+
+
+class ProductStats(NamedTuple):
+    """Статистика товаров."""
+
+    total: int
+    active: int
+    inactive: int
+    by_category: dict[int | None, int]
+    no_category: int
+
+
+class BroadcastStats(NamedTuple):
+    """Статистика рассылок."""
+
+    total: int
+    by_status: dict[str, int]
+    total_sent: int
+    total_success: int
+    total_failed: int
+    success_rate: float
+
+
+class ReviewStats(NamedTuple):
+    """Статистика отзывов."""
+
+    total: int
+    approved: int
+    rejected: int
+    pending: int
+
+
+class SystemStats(NamedTuple):
+    """Общая статистика системы."""
+
+    users: UserStats
+    orders: OrderStats
+    products: ProductStats
+    broadcasts: BroadcastStats
+    reviews: ReviewStats
+    timestamp: str
+
+
+class StatsPeriod(NamedTuple):
+    """Период статистики."""
+
+    start: str
+    end: str
+    days: int
+
+
+class UserPeriodStats(NamedTuple):
+    """Статистика пользователей за период."""
+
+    new: int
+    active: int
+
+
+class OrderPeriodStats(NamedTuple):
+    """Статистика заказов за период."""
+
+    new: int
+    completed: int
+    by_status: dict[str, int]
+
+
+class ProductPeriodStats(NamedTuple):
+    """Статистика товаров за период."""
+
+    new: int
+
+
+class BroadcastPeriodStats(NamedTuple):
+    """Статистика рассылок за период."""
+
+    new: int
+    sent: int
+    success: int
+
+
+class PeriodStats(NamedTuple):
+    """Статистика за период."""
+
+    period: StatsPeriod
+    users: UserPeriodStats
+    orders: OrderPeriodStats
+    products: ProductPeriodStats
+    broadcasts: BroadcastPeriodStats
+
+
 class MonitoringService:
     """Сервис для сбора метрик и мониторинга системы."""
 
@@ -27,22 +137,22 @@ class MonitoringService:
         """
         self.session = session
 
-    async def get_system_stats(self) -> dict[str, Any]:
+    async def get_system_stats(self) -> SystemStats:
         """Получить общую статистику системы.
 
         Returns:
-            Словарь со всей статистикой
+            Вся статистика системы
         """
         logger.info("Collecting system stats")
 
-        stats = {
-            "users": await self._get_user_stats(),
-            "orders": await self._get_order_stats(),
-            "products": await self._get_product_stats(),
-            "broadcasts": await self._get_broadcast_stats(),
-            "reviews": await self._get_review_stats(),
-            "timestamp": datetime.utcnow().isoformat(),
-        }
+        stats = SystemStats(
+            users=await self._get_user_stats(),
+            orders=await self._get_order_stats(),
+            products=await self._get_product_stats(),
+            broadcasts=await self._get_broadcast_stats(),
+            reviews=await self._get_review_stats(),
+            timestamp=datetime.utcnow().isoformat(),
+        )
 
         logger.info("System stats collected", total_sections=len(stats))
         return stats
@@ -51,7 +161,7 @@ class MonitoringService:
         self,
         start_date: datetime,
         end_date: datetime,
-    ) -> dict[str, Any]:
+    ) -> PeriodStats:
         """Получить статистику за период.
 
         Args:
@@ -59,7 +169,7 @@ class MonitoringService:
             end_date: Конец периода
 
         Returns:
-            Словарь со статистикой за период
+            Статистика за период
         """
         logger.info(
             "Collecting period stats",
@@ -67,21 +177,21 @@ class MonitoringService:
             end_date=end_date.isoformat(),
         )
 
-        stats = {
-            "period": {
-                "start": start_date.isoformat(),
-                "end": end_date.isoformat(),
-                "days": (end_date - start_date).days,
-            },
-            "users": await self._get_user_period_stats(start_date, end_date),
-            "orders": await self._get_order_period_stats(start_date, end_date),
-            "products": await self._get_product_period_stats(start_date, end_date),
-            "broadcasts": await self._get_broadcast_period_stats(start_date, end_date),
-        }
+        stats = PeriodStats(
+            period=StatsPeriod(
+                start=start_date.isoformat(),
+                end=end_date.isoformat(),
+                days=(end_date - start_date).days,
+            ),
+            users=await self._get_user_period_stats(start_date, end_date),
+            orders=await self._get_order_period_stats(start_date, end_date),
+            products=await self._get_product_period_stats(start_date, end_date),
+            broadcasts=await self._get_broadcast_period_stats(start_date, end_date),
+        )
 
         return stats
 
-    async def _get_user_stats(self) -> dict[str, Any]:
+    async def _get_user_stats(self) -> UserStats:
         """Получить статистику пользователей."""
         # Всего пользователей
         total = await self.session.scalar(select(func.count(User.id)))
@@ -119,17 +229,17 @@ class MonitoringService:
             select(func.count(User.id)).where(User.is_banned == True)
         )
 
-        return {
-            "total": total or 0,
-            "active_24h": active_24h or 0,
-            "active_7d": active_7d or 0,
-            "new_24h": new_24h or 0,
-            "new_7d": new_7d or 0,
-            "by_role": by_role,
-            "banned": banned or 0,
-        }
+        return UserStats(
+            total=total or 0,
+            active_24h=active_24h or 0,
+            active_7d=active_7d or 0,
+            new_24h=new_24h or 0,
+            new_7d=new_7d or 0,
+            by_role=by_role,
+            banned=banned or 0,
+        )
 
-    async def _get_order_stats(self) -> dict[str, Any]:
+    async def _get_order_stats(self) -> OrderStats:
         """Получить статистику заказов."""
         # Всего заказов
         total = await self.session.scalar(select(func.count(Order.id)))
@@ -156,15 +266,15 @@ class MonitoringService:
         completed = by_status.get("completed", 0)
         conversion_rate = (completed / total * 100) if total > 0 else 0
 
-        return {
-            "total": total or 0,
-            "by_status": by_status,
-            "new_24h": new_24h or 0,
-            "new_7d": new_7d or 0,
-            "conversion_rate": round(conversion_rate, 2),
-        }
+        return OrderStats(
+            total=total or 0,
+            by_status=by_status,
+            new_24h=new_24h or 0,
+            new_7d=new_7d or 0,
+            conversion_rate=round(conversion_rate, 2),
+        )
 
-    async def _get_product_stats(self) -> dict[str, Any]:
+    async def _get_product_stats(self) -> ProductStats:
         """Получить статистику товаров."""
         # Всего товаров
         total = await self.session.scalar(select(func.count(Product.id)))
@@ -187,15 +297,15 @@ class MonitoringService:
             select(func.count(Product.id)).where(Product.category_id == None)
         )
 
-        return {
-            "total": total or 0,
-            "active": active or 0,
-            "inactive": (total or 0) - (active or 0),
-            "by_category": by_category,
-            "no_category": no_category or 0,
-        }
+        return ProductStats(
+            total=total or 0,
+            active=active or 0,
+            inactive=(total or 0) - (active or 0),
+            by_category=by_category,
+            no_category=no_category or 0,
+        )
 
-    async def _get_broadcast_stats(self) -> dict[str, Any]:
+    async def _get_broadcast_stats(self) -> BroadcastStats:
         """Получить статистику рассылок."""
         # Всего рассылок
         total = await self.session.scalar(select(func.count(Broadcast.id)))
@@ -224,16 +334,16 @@ class MonitoringService:
             (total_success / total_sent * 100) if total_sent and total_sent > 0 else 0
         )
 
-        return {
-            "total": total or 0,
-            "by_status": by_status,
-            "total_sent": total_sent or 0,
-            "total_success": total_success or 0,
-            "total_failed": total_failed or 0,
-            "success_rate": round(success_rate, 2),
-        }
+        return BroadcastStats(
+            total=total or 0,
+            by_status=by_status,
+            total_sent=total_sent or 0,
+            total_success=total_success or 0,
+            total_failed=total_failed or 0,
+            success_rate=round(success_rate, 2),
+        )
 
-    async def _get_review_stats(self) -> dict[str, Any]:
+    async def _get_review_stats(self) -> ReviewStats:
         """Получить статистику отзывов."""
         # Всего отзывов
         total = await self.session.scalar(select(func.count(Review.id)))
@@ -253,16 +363,16 @@ class MonitoringService:
             select(func.count(Review.id)).where(Review.is_approved == None)
         )
 
-        return {
-            "total": total or 0,
-            "approved": approved or 0,
-            "rejected": rejected or 0,
-            "pending": pending or 0,
-        }
+        return ReviewStats(
+            total=total or 0,
+            approved=approved or 0,
+            rejected=rejected or 0,
+            pending=pending or 0,
+        )
 
     async def _get_user_period_stats(
         self, start_date: datetime, end_date: datetime
-    ) -> dict[str, Any]:
+    ) -> UserPeriodStats:
         """Получить статистику пользователей за период."""
         # Новые пользователи
         new_users = await self.session.scalar(
@@ -278,14 +388,14 @@ class MonitoringService:
             )
         )
 
-        return {
-            "new": new_users or 0,
-            "active": active_users or 0,
-        }
+        return UserPeriodStats(
+            new=new_users or 0,
+            active=active_users or 0,
+        )
 
     async def _get_order_period_stats(
         self, start_date: datetime, end_date: datetime
-    ) -> dict[str, Any]:
+    ) -> OrderPeriodStats:
         """Получить статистику заказов за период."""
         # Новые заказы
         new_orders = await self.session.scalar(
@@ -313,15 +423,15 @@ class MonitoringService:
         )
         by_status = {status: count for status, count in statuses}
 
-        return {
-            "new": new_orders or 0,
-            "completed": completed_orders or 0,
-            "by_status": by_status,
-        }
+        return OrderPeriodStats(
+            new=new_orders or 0,
+            completed=completed_orders or 0,
+            by_status=by_status,
+        )
 
     async def _get_product_period_stats(
         self, start_date: datetime, end_date: datetime
-    ) -> dict[str, Any]:
+    ) -> ProductPeriodStats:
         """Получить статистику товаров за период."""
         # Новые товары
         new_products = await self.session.scalar(
@@ -330,13 +440,13 @@ class MonitoringService:
             )
         )
 
-        return {
-            "new": new_products or 0,
-        }
+        return ProductPeriodStats(
+            new=new_products or 0,
+        )
 
     async def _get_broadcast_period_stats(
         self, start_date: datetime, end_date: datetime
-    ) -> dict[str, Any]:
+    ) -> BroadcastPeriodStats:
         """Получить статистику рассылок за период."""
         # Новые рассылки
         new_broadcasts = await self.session.scalar(
@@ -365,11 +475,11 @@ class MonitoringService:
             )
         )
 
-        return {
-            "new": new_broadcasts or 0,
-            "sent": sent or 0,
-            "success": success or 0,
-        }
+        return BroadcastPeriodStats(
+            new=new_broadcasts or 0,
+            sent=sent or 0,
+            success=success or 0,
+        )
 
     async def get_health_check(self) -> dict[str, Any]:
         """Проверка здоровья системы.
@@ -33,6 +33,8 @@ class OrderService:
         customer_contact: str,
         color: str | None = None,
         quantity: int = 1,
+        bonus_discount: Decimal = Decimal("0"),
+        admin_notes: str | None = None,
     ) -> Order:
         """Создать новый заказ с одним товаром (для быстрого заказа).
 
@@ -43,6 +45,8 @@ class OrderService:
             customer_contact: Контактные данные клиента
             color: Выбранный цвет (опционально)
             quantity: Количество товара (по умолчанию 1)
+            bonus_discount: Скидка по бонусам
+            admin_notes: Заметки администратора
 
         Returns:
             Созданный заказ
@@ -61,6 +65,8 @@ class OrderService:
             user_id=user_id,
             customer_contact=customer_contact,
             status="new",
+            bonus_discount=bonus_discount,
+            admin_notes=admin_notes,
         )
 
         self.session.add(order)
@@ -98,6 +104,8 @@ class OrderService:
         user_id: int,
         customer_contact: str,
         items: list[dict],
+        bonus_discount: Decimal = Decimal("0"),
+        admin_notes: str | None = None,
     ) -> Order:
         """Создать заказ с несколькими товарами (для заказа из корзины).
 
@@ -114,6 +122,8 @@ class OrderService:
                     },
                     ...
                 ]
+            bonus_discount: Скидка по бонусам
+            admin_notes: Заметки администратора
 
         Returns:
             Созданный заказ
@@ -124,39 +134,45 @@ class OrderService:
         if not items:
             raise ValueError("Items list cannot be empty")
 
+        # Название и цену всех товаров получаем одним запросом
+        product_ids = {item_data["product_id"] for item_data in items}
+        result = await self.session.execute(
+            select(Product.id, Product.name, Product.price).where(Product.id.in_(product_ids))
+        )
+        products = {row.id: row for row in result}
+
+        for product_id in product_ids:
+            if product_id not in products:
+                raise ValueError(f"Product with id {product_id} not found")
+
         # Создаем заказ
         order = Order(
             user_id=user_id,
             customer_contact=customer_contact,
             status="new",
+            bonus_discount=bonus_discount,
+            admin_notes=admin_notes,
         )
 
         self.session.add(order)
         await self.session.flush()
 
-        # Добавляем товары в заказ
-        for item_data in items:
-            # Получаем информацию о товаре
-            result = await self.session.execute(
-                select(Product).where(Product.id == item_data["product_id"])
-            )
-            product = result.scalar_one_or_none()
-
-            if not product:
-                raise ValueError(f"Product with id {item_data['product_id']} not found")
-
-            # Создаем товар в заказе
-            order_item = OrderItem(
-                order_id=order.id,
-                product_id=item_data["product_id"],
-                size=item_data["size"],
-                color=item_data.get("color"),
-                quantity=item_data["quantity"],
-                price_at_order=product.price,
-                product_name=product.name,
-            )
-
-            self.session.add(order_item)
+        # Добавляем товары в заказ - при flush они вставляются одним
+        # пакетным INSERT, а не отдельным запросом на каждый товар
+        self.session.add_all(
+            [
+                OrderItem(
+                    order_id=order.id,
+                    product_id=item_data["product_id"],
+                    size=item_data["size"],
+                    color=item_data.get("color"),
+                    quantity=item_data["quantity"],
+                    price_at_order=products[item_data["product_id"]].price,
+                    product_name=products[item_data["product_id"]].name,
+                )
+                for item_data in items
+            ]
+        )
 
         await self.session.flush()
         await self.session.refresh(order)
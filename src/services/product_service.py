@@ -1,11 +1,14 @@
 """Сервис для управления товарами."""
 
+import time
 from decimal import Decimal
-from typing import Any
+from typing import Any, ClassVar, NamedTuple
 
 from aiogram import Bot
 from aiogram.types import InputMediaPhoto, InputMediaVideo
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, lazyload
 
 from src.core.config import settings
 from src.core.logging import get_logger
@@ -13,13 +16,44 @@ from src.database.models.category import Category
 from src.database.models.product import Product
 from src.database.repositories.category import CategoryRepository
 from src.database.repositories.product import ProductRepository
+from src.services.cart_service import CartService
+from src.services.catalog_cache import ProductCardCache
+from src.utils.formatters import format_price
 
 logger = get_logger(__name__)
 
+# Время жизни и размер кэша кратких данных товаров
+PRODUCT_SNAPSHOT_TTL = 60.0
+PRODUCT_SNAPSHOT_MAX_SIZE = 1024
+
+# Время жизни кэша числа активных товаров в категориях
+CATEGORY_COUNT_TTL = 60.0
+
+
+class ProductSnapshot(NamedTuple):
+    """Краткие данные товара для оформления заказа, не привязанные к сессии БД."""
+
+    id: int
+    name: str
+    price: Decimal
+    formatted_price: str
+
+
+class CategoryPage(NamedTuple):
+    """Товар на позиции в категории и число активных товаров в ней."""
+
+    product: Product | None
+    total: int
+
 
 class ProductService:
     """Сервис для управления товарами."""
 
+    # product_id -> (время загрузки, краткие данные товара)
+    _snapshots: ClassVar[dict[int, tuple[float, ProductSnapshot]]] = {}
+    # category_id -> (время загрузки, число активных товаров)
+    _category_counts: ClassVar[dict[int, tuple[float, int]]] = {}
+
     def __init__(self, session: AsyncSession):
         """Инициализация сервиса.
 
@@ -95,6 +129,7 @@ class ProductService:
         )
 
         await self.session.commit()
+        ProductService.invalidate(product.id)
         await self.session.refresh(product)
 
         logger.info("Product created", product_id=product.id)
@@ -121,6 +156,9 @@ class ProductService:
         product = await self.product_repo.update(product_id, **kwargs)
         if product:
             await self.session.commit()
+            ProductService.invalidate(product_id)
+            # Название и цена товара показываются в закэшированных корзинах
+            CartService.invalidate()
             await self.session.refresh(product)
             logger.info("Product updated", product_id=product_id)
 
@@ -147,6 +185,8 @@ class ProductService:
             success = await self.product_repo.delete(product_id)
             if success:
                 await self.session.commit()
+                ProductService.invalidate(product_id)
+                CartService.invalidate()
             return success
 
     async def get_products(
@@ -189,6 +229,106 @@ class ProductService:
         """
         return await self.product_repo.get(product_id)
 
+    async def get_product_snapshot(
+        self, product_id: int, ttl: float = PRODUCT_SNAPSHOT_TTL
+    ) -> ProductSnapshot | None:
+        """Получить краткие данные товара (название и цену) с кэшированием.
+
+        В отличие от get_product не подгружает связи товара (категорию,
+        отзывы) и при попадании в кэш не обращается к БД.
+
+        Args:
+            product_id: ID товара
+            ttl: Время жизни кэша в секундах
+
+        Returns:
+            Краткие данные товара или None
+        """
+        cached = ProductService._snapshots.get(product_id)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        result = await self.session.execute(
+            select(Product).where(Product.id == product_id).options(lazyload("*"))
+        )
+        product = result.scalar_one_or_none()
+        if not product:
+            return None
+
+        snapshot = ProductSnapshot(
+            id=product.id,
+            name=product.name,
+            price=product.price,
+            formatted_price=format_price(product.price),
+        )
+
+        snapshots = ProductService._snapshots
+        snapshots.pop(product_id, None)
+        if len(snapshots) >= PRODUCT_SNAPSHOT_MAX_SIZE:
+            # Вытесняем самую давнюю запись (словарь хранит порядок вставки)
+            del snapshots[next(iter(snapshots))]
+        snapshots[product_id] = (time.monotonic(), snapshot)
+        return snapshot
+
+    async def get_category_page(
+        self, category_id: int, index: int, ttl: float = CATEGORY_COUNT_TTL
+    ) -> CategoryPage:
+        """Получить один активный товар категории по позиции.
+
+        Вместо загрузки всех товаров категории выбирается одна строка
+        (LIMIT 1 OFFSET index) вместе с категорией, а число товаров
+        берётся из кэша.
+
+        Args:
+            category_id: ID категории
+            index: Позиция товара в категории (с нуля)
+            ttl: Время жизни кэша числа товаров в секундах
+
+        Returns:
+            Товар (None, если позиции нет) и число активных товаров категории
+        """
+        in_category = (Product.category_id == category_id, Product.is_active == True)
+
+        cached = ProductService._category_counts.get(category_id)
+        if cached and time.monotonic() - cached[0] < ttl:
+            total = cached[1]
+        else:
+            total = await self.session.scalar(
+                select(func.count()).select_from(Product).where(*in_category)
+            )
+            ProductService._category_counts[category_id] = (time.monotonic(), total)
+
+        if not 0 <= index < total:
+            return CategoryPage(None, total)
+
+        # Категория нужна для подписи карточки - загружаем её тем же запросом;
+        # отзывы в карточке не показываются
+        result = await self.session.execute(
+            select(Product)
+            .where(*in_category)
+            .order_by(Product.id)
+            .offset(index)
+            .limit(1)
+            .options(joinedload(Product.category), lazyload(Product.reviews))
+        )
+        return CategoryPage(result.scalar_one_or_none(), total)
+
+    @classmethod
+    def invalidate(cls, product_id: int | None = None) -> None:
+        """Сбросить кэш кратких данных товаров, числа товаров и карточек каталога.
+
+        Args:
+            product_id: ID товара (None - сбросить весь кэш)
+        """
+        # Товар мог сменить категорию или активность - счётчики и готовые
+        # карточки каталога (позиции в категории) сбрасываем целиком
+        cls._category_counts.clear()
+        ProductCardCache.invalidate()
+        if product_id is None:
+            cls._snapshots.clear()
+        else:
+            cls._snapshots.pop(product_id, None)
+
     async def publish_to_channel(
         self, product_id: int, bot: Bot, channel_id: int
     ) -> int | None:
@@ -0,0 +1,137 @@
+"""Кэш настроек бота и платежей."""
+
+import asyncio
+import time
+from decimal import Decimal
+from typing import ClassVar, NamedTuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.logging import get_logger
+from src.database.models.bot_settings import BotSettings
+from src.database.models.payment_settings import PaymentSettings
+
+logger = get_logger(__name__)
+
+# Время жизни закэшированных настроек (секунды)
+SETTINGS_CACHE_TTL = 30.0
+
+
+class BotSettingsSnapshot(NamedTuple):
+    """Снимок настроек бота, не привязанный к сессии БД."""
+
+    bonus_purchase_percent: Decimal
+    bonus_max_payment_percent: Decimal
+    bonus_min_order_amount: Decimal
+    bonus_enabled: bool
+    payment_details: str | None
+    payment_instructions: str | None
+    alternative_contact_username: str | None
+    min_order_amount: Decimal
+    max_items_per_order: int
+    max_quantity_per_item: int
+    products_per_page: int
+    show_products_without_photos: bool
+
+
+class PaymentSettingsSnapshot(NamedTuple):
+    """Снимок настроек платежей, не привязанный к сессии БД."""
+
+    payment_details: str
+    payment_instructions: str | None
+    alternative_contact_username: str | None
+
+
+class SettingsCache:
+    """Кэш редко меняющихся настроек с ограниченным временем жизни.
+
+    Хранит не ORM-объекты, а снимки нужных полей, поэтому значения
+    можно использовать после закрытия сессии, в которой они загружены.
+    """
+
+    _bot_settings: ClassVar[tuple[float, BotSettingsSnapshot] | None] = None
+    _payment_settings: ClassVar[tuple[float, PaymentSettingsSnapshot | None] | None] = None
+    # Одновременные промахи ждут одну загрузку вместо параллельных запросов
+    _lock: ClassVar[asyncio.Lock] = asyncio.Lock()
+
+    @classmethod
+    async def get_bot_settings(
+        cls, session: AsyncSession, ttl: float = SETTINGS_CACHE_TTL
+    ) -> BotSettingsSnapshot:
+        """Получить настройки бота.
+
+        Args:
+            session: Сессия БД (используется только при промахе кэша)
+            ttl: Время жизни кэша в секундах
+
+        Returns:
+            Снимок настроек бота
+        """
+        cached = cls._bot_settings
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        async with cls._lock:
+            # Настройки могли загрузить, пока мы ждали блокировку
+            cached = cls._bot_settings
+            if cached and time.monotonic() - cached[0] < ttl:
+                return cached[1]
+
+            settings = await BotSettings.get_settings(session)
+            snapshot = BotSettingsSnapshot(
+                bonus_purchase_percent=settings.bonus_purchase_percent,
+                bonus_max_payment_percent=settings.bonus_max_payment_percent,
+                bonus_min_order_amount=settings.bonus_min_order_amount,
+                bonus_enabled=settings.bonus_enabled,
+                payment_details=settings.payment_details,
+                payment_instructions=settings.payment_instructions,
+                alternative_contact_username=settings.alternative_contact_username,
+                min_order_amount=settings.min_order_amount,
+                max_items_per_order=settings.max_items_per_order,
+                max_quantity_per_item=settings.max_quantity_per_item,
+                products_per_page=settings.products_per_page,
+                show_products_without_photos=settings.show_products_without_photos,
+            )
+            cls._bot_settings = (time.monotonic(), snapshot)
+            logger.debug("Bot settings cache refreshed")
+            return snapshot
+
+    @classmethod
+    async def get_payment_settings(
+        cls, session: AsyncSession, ttl: float = SETTINGS_CACHE_TTL
+    ) -> PaymentSettingsSnapshot | None:
+        """Получить настройки платежей.
+
+        Args:
+            session: Сессия БД (используется только при промахе кэша)
+            ttl: Время жизни кэша в секундах
+
+        Returns:
+            Снимок настроек платежей или None, если они не заданы
+        """
+        cached = cls._payment_settings
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        async with cls._lock:
+            cached = cls._payment_settings
+            if cached and time.monotonic() - cached[0] < ttl:
+                return cached[1]
+
+            settings = await PaymentSettings.get_current_settings(session)
+            snapshot = None
+            if settings:
+                snapshot = PaymentSettingsSnapshot(
+                    payment_details=settings.payment_details,
+                    payment_instructions=settings.payment_instructions,
+                    alternative_contact_username=settings.alternative_contact_username,
+                )
+            cls._payment_settings = (time.monotonic(), snapshot)
+            logger.debug("Payment settings cache refreshed")
+            return snapshot
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Сбросить кэш (вызывается после изменения настроек)."""
+        cls._bot_settings = None
+        cls._payment_settings = None
@@ -0,0 +1,52 @@
+"""Проверка пользовательского ввода."""
+
+import re
+
+from src.core.constants import Limits
+
+# Форматы контакта при ручном вводе: одна проверка, тип - по имени группы.
+# Телефон - 10-15 цифр; между цифрами допускаются пробелы (в т.ч. неразрывные),
+# дефисы и скобки: "+7 (900) 123-45-67"
+CONTACT_PATTERN = re.compile(
+    r"^(?:(?P<phone>\+?\d(?:[\s()-]*\d){9,14})"
+    r"|(?P<username>@[a-zA-Z0-9_]{5,32})"
+    r"|(?P<email>[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}))$"
+)
+CONTACT_TYPE_NAMES = {"phone": "телефон", "username": "username", "email": "email"}
+
+INVALID_CONTACT_TEXT = (
+    "❌ <b>Некорректный формат контакта</b>\n\n"
+    "Пожалуйста, введите контакт в одном из форматов:\n"
+    "• Телефон: +79001234567\n"
+    "• Username: @username\n"
+    "• Email: email@example.com"
+)
+
+
+def validate_contact(text: str) -> tuple[str, str]:
+    """Проверить контакт, введённый вручную.
+
+    Длина проверяется до strip() и регулярного выражения: длинный ввод
+    не может быть контактом.
+
+    Args:
+        text: Введённый текст
+
+    Returns:
+        Контакт без пробелов по краям и название его типа
+
+    Raises:
+        ValueError: Если ввод слишком длинный или формат не распознан
+            (текст ошибки готов для показа пользователю)
+    """
+    if len(text) > Limits.MAX_CONTACT_LENGTH:
+        raise ValueError(
+            f"❌ Слишком длинный контакт. Введите до {Limits.MAX_CONTACT_LENGTH} символов."
+        )
+
+    contact = text.strip()
+    match = CONTACT_PATTERN.match(contact)
+    if not match:
+        raise ValueError(INVALID_CONTACT_TEXT)
+
+    return contact, CONTACT_TYPE_NAMES[match.lastgroup]
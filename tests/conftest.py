@@ -0,0 +1,7 @@
+"""Общие настройки тестов."""
+
+import os
+
+# Настройки приложения требуют токен бота; модулям, которые импортируют
+# src.core.config (через логирование), достаточно фиктивного значения
+os.environ.setdefault("BOT_TOKEN", "123456:test-token")
@@ -0,0 +1,164 @@
+"""Тесты для кэша строк корзины."""
+
+from collections.abc import Iterator
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.services import cart_service as cart_module
+from src.services.cart_service import CartLine, CartService
+
+
+def make_item(item_id: int, quantity: int = 1) -> SimpleNamespace:
+    """Создать товар корзины с загруженным продуктом."""
+    price = Decimal("10.50")
+    return SimpleNamespace(
+        id=item_id,
+        display_name=f"Товар {item_id} [M]",
+        quantity=quantity,
+        product=SimpleNamespace(formatted_price="10.50 ₽"),
+        total_price=price * quantity,
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_cache() -> Iterator[None]:
+    """Сбросить кэш до и после каждого теста."""
+    CartService.invalidate()
+    yield
+    CartService.invalidate()
+
+
+@pytest.fixture
+def get_cart_items(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Подменить загрузку корзины из БД: у пользователя N - N товаров."""
+    mock = AsyncMock(side_effect=lambda user_id: [make_item(i) for i in range(1, user_id + 1)])
+    monkeypatch.setattr(CartService, "get_cart_items", mock)
+    return mock
+
+
+@pytest.fixture
+def service() -> CartService:
+    """Сервис с сессией без подключения к БД."""
+    return CartService(AsyncSession())
+
+
+class TestGetCartLines:
+    """Тесты для чтения строк корзины с кэшем."""
+
+    async def test_snapshot_fields(self, service: CartService, get_cart_items: AsyncMock) -> None:
+        """Тест: строка корзины содержит данные для отображения."""
+        lines = await service.get_cart_lines(1)
+        assert lines == [CartLine(1, "Товар 1 [M]", 1, "10.50 ₽", Decimal("10.50"))]
+
+    async def test_cached_within_ttl(self, service: CartService, get_cart_items: AsyncMock) -> None:
+        """Тест: повторное чтение в пределах TTL не обращается к БД."""
+        first = await service.get_cart_lines(2)
+        second = await service.get_cart_lines(2)
+
+        assert first is second
+        assert get_cart_items.await_count == 1
+
+    async def test_reload_after_ttl(self, service: CartService, get_cart_items: AsyncMock) -> None:
+        """Тест: после истечения TTL корзина загружается заново."""
+        await service.get_cart_lines(2)
+        await service.get_cart_lines(2, ttl=0)
+
+        assert get_cart_items.await_count == 2
+        assert service.get_cached_lines(2, ttl=0) is None
+
+    async def test_uncached_read_not_stored(
+        self, service: CartService, get_cart_items: AsyncMock
+    ) -> None:
+        """Тест: чтение с cached=False не попадает в кэш."""
+        await service.get_cart_lines(1, cached=False)
+        assert service.get_cached_lines(1) is None
+
+    async def test_size_bound_evicts_oldest(
+        self, service: CartService, get_cart_items: AsyncMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Тест: при переполнении вытесняется самая давняя запись."""
+        monkeypatch.setattr(cart_module, "CART_LINES_MAX_SIZE", 2)
+
+        await service.get_cart_lines(1)
+        await service.get_cart_lines(2)
+        # Перезагрузка пользователя 1 делает его самой свежей записью
+        await service.get_cart_lines(1, ttl=0)
+        await service.get_cart_lines(3)
+
+        assert set(CartService._lines) == {1, 3}
+
+
+class TestInvalidation:
+    """Тесты для сброса кэша строк корзины."""
+
+    async def test_invalidate_user(self, service: CartService, get_cart_items: AsyncMock) -> None:
+        """Тест: сброс одного пользователя не затрагивает других."""
+        await service.get_cart_lines(1)
+        await service.get_cart_lines(2)
+
+        CartService.invalidate(1)
+
+        assert service.get_cached_lines(1) is None
+        assert service.get_cached_lines(2) is not None
+
+    async def test_invalidate_all(self, service: CartService, get_cart_items: AsyncMock) -> None:
+        """Тест: invalidate() без аргументов сбрасывает весь кэш."""
+        await service.get_cart_lines(1)
+        await service.get_cart_lines(2)
+
+        CartService.invalidate()
+
+        assert CartService._lines == {}
+
+    async def test_invalidated_again_after_commit(
+        self, service: CartService, get_cart_items: AsyncMock
+    ) -> None:
+        """Тест: кэш, заполненный до фиксации изменения, сбрасывается после коммита."""
+        await service.get_cart_lines(1)
+
+        service._invalidate_after_commit(1)
+        assert service.get_cached_lines(1) is None
+
+        # Параллельный апдейт успел закэшировать корзину до коммита
+        await service.get_cart_lines(1)
+        assert service.get_cached_lines(1) is not None
+
+        await service.session.commit()
+        assert service.get_cached_lines(1) is None
+
+    async def test_after_commit_hook_fires_once(
+        self, service: CartService, get_cart_items: AsyncMock
+    ) -> None:
+        """Тест: обработчик коммита срабатывает только для своей транзакции."""
+        service._invalidate_after_commit(1)
+        await service.session.commit()
+
+        await service.get_cart_lines(1)
+        await service.session.commit()
+
+        assert service.get_cached_lines(1) is not None
+
+
+class TestLinesAfterRemoval:
+    """Тесты для строк корзины после удаления товара."""
+
+    async def test_from_snapshot(self, service: CartService, get_cart_items: AsyncMock) -> None:
+        """Тест: при наличии снимка удалённая строка убирается без запроса."""
+        lines_before = await service.get_cart_lines(3)
+
+        lines = await service.get_lines_after_removal(3, lines_before, 2)
+
+        assert [line.id for line in lines] == [1, 3]
+        assert get_cart_items.await_count == 1
+
+    async def test_without_snapshot(self, service: CartService, get_cart_items: AsyncMock) -> None:
+        """Тест: без снимка корзина загружается и не кэшируется."""
+        lines = await service.get_lines_after_removal(2, None, 1)
+
+        assert [line.id for line in lines] == [1, 2]
+        assert get_cart_items.await_count == 1
+        assert service.get_cached_lines(2) is None
@@ -0,0 +1,101 @@
+"""Тесты для фиксации изменений корзины в обработчиках."""
+
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.methods import EditMessageText
+
+from src.bot.handlers.user.cart import remove_cart_item, update_cart_item_quantity
+from src.bot.keyboards.cart import CartQtyCb, CartRemoveCb
+from src.bot.middlewares import database as database_module
+from src.bot.middlewares.database import DatabaseMiddleware
+from src.services.cart_service import CartService, QuantityChange
+
+
+class FakeSession:
+    """Сессия без БД: изменения после flush() видны снаружи только после commit()."""
+
+    def __init__(self) -> None:
+        self.pending: list[str] = []
+        self.persisted: list[str] = []
+        self.is_active = True
+
+    async def __aenter__(self) -> "FakeSession":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+    async def commit(self) -> None:
+        self.persisted.extend(self.pending)
+        self.pending.clear()
+
+    async def rollback(self) -> None:
+        self.pending.clear()
+
+
+@pytest.fixture
+def session(monkeypatch: pytest.MonkeyPatch) -> FakeSession:
+    """Подменить фабрику сессий в DatabaseMiddleware."""
+    fake = FakeSession()
+    monkeypatch.setattr(database_module, "async_session_maker", lambda: fake)
+    return fake
+
+
+@pytest.fixture(autouse=True)
+def cart_service(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Подменить изменения корзины: сервис только делает flush()."""
+
+    async def remove_item(self: CartService, user_id: int, cart_item_id: int) -> int:
+        self.session.pending.append(f"remove {cart_item_id}")
+        return cart_item_id
+
+    async def adjust_quantity(
+        self: CartService, user_id: int, cart_item_id: int, delta: int
+    ) -> QuantityChange:
+        self.session.pending.append(f"adjust {cart_item_id} {delta:+d}")
+        return QuantityChange(None, cart_item_id)
+
+    monkeypatch.setattr(CartService, "remove_item", remove_item)
+    monkeypatch.setattr(CartService, "adjust_quantity", adjust_quantity)
+    monkeypatch.setattr(CartService, "get_lines_after_removal", AsyncMock(return_value=[]))
+
+
+def make_callback() -> MagicMock:
+    """Создать callback, сообщение которого нельзя отредактировать."""
+    callback = MagicMock()
+    callback.answer = AsyncMock()
+    callback.message.edit_text = AsyncMock(
+        side_effect=TelegramBadRequest(
+            method=EditMessageText(text=""), message="message can't be edited"
+        )
+    )
+    return callback
+
+
+class TestCartCommitBeforeTelegram:
+    """Тесты: ошибка Telegram после изменения корзины не откатывает его."""
+
+    @pytest.mark.parametrize(
+        ("handler", "callback_data", "change"),
+        [
+            (remove_cart_item, CartRemoveCb(item_id=5), "remove 5"),
+            (update_cart_item_quantity, CartQtyCb(item_id=5, action="minus"), "adjust 5 -1"),
+        ],
+    )
+    async def test_change_persisted_when_edit_fails(
+        self, session: FakeSession, handler: Any, callback_data: Any, change: str
+    ) -> None:
+        """Тест: при ошибке edit_text изменение корзины уже зафиксировано."""
+        user = SimpleNamespace(id=1)
+
+        async def call_handler(event: MagicMock, data: dict[str, Any]) -> None:
+            await handler(event, callback_data, data["session"], user)
+
+        with pytest.raises(TelegramBadRequest):
+            await DatabaseMiddleware()(call_handler, make_callback(), {})
+
+        assert session.persisted == [change]
@@ -0,0 +1,98 @@
+"""Тесты для кэша карточек товаров каталога."""
+
+from collections.abc import Iterator
+
+import pytest
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
+
+from src.services import catalog_cache as catalog_module
+from src.services.catalog_cache import ProductCard, ProductCardCache
+from src.services.product_service import ProductService
+
+
+def make_card(product_id: int) -> ProductCard:
+    """Создать карточку товара."""
+    keyboard = InlineKeyboardMarkup(
+        inline_keyboard=[
+            [InlineKeyboardButton(text="🛒 Заказать", callback_data=f"order_start:{product_id}")]
+        ]
+    )
+    return ProductCard(product_id, None, f"✨ <b>Товар {product_id}</b> ✨", keyboard)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache() -> Iterator[None]:
+    """Сбросить кэш до и после каждого теста."""
+    ProductCardCache.invalidate()
+    yield
+    ProductCardCache.invalidate()
+
+
+class TestProductCardCache:
+    """Тесты для чтения и записи карточек."""
+
+    def test_miss(self) -> None:
+        """Тест: отсутствующая карточка - None."""
+        assert ProductCardCache.get(1, 0) is None
+
+    def test_set_and_get(self) -> None:
+        """Тест: карточка читается по (категория, позиция)."""
+        card = make_card(10)
+        ProductCardCache.set(1, 0, card)
+
+        assert ProductCardCache.get(1, 0) is card
+        assert ProductCardCache.get(1, 1) is None
+        assert ProductCardCache.get(2, 0) is None
+
+    def test_expired_after_ttl(self) -> None:
+        """Тест: по истечении TTL карточка не возвращается."""
+        ProductCardCache.set(1, 0, make_card(10))
+
+        assert ProductCardCache.get(1, 0, ttl=0) is None
+
+    def test_set_replaces(self) -> None:
+        """Тест: повторная запись заменяет карточку."""
+        ProductCardCache.set(1, 0, make_card(10))
+        card = make_card(11)
+        ProductCardCache.set(1, 0, card)
+
+        assert ProductCardCache.get(1, 0) is card
+
+    def test_size_bound_evicts_oldest(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Тест: при переполнении вытесняется самая давняя запись."""
+        monkeypatch.setattr(catalog_module, "PRODUCT_CARD_MAX_SIZE", 2)
+
+        ProductCardCache.set(1, 0, make_card(10))
+        ProductCardCache.set(1, 1, make_card(11))
+        # Перезапись делает позицию 0 самой свежей записью
+        ProductCardCache.set(1, 0, make_card(10))
+        ProductCardCache.set(1, 2, make_card(12))
+
+        assert ProductCardCache.get(1, 1) is None
+        assert ProductCardCache.get(1, 0) is not None
+        assert ProductCardCache.get(1, 2) is not None
+
+
+class TestInvalidation:
+    """Тесты для сброса кэша карточек."""
+
+    def test_invalidate(self) -> None:
+        """Тест: invalidate() сбрасывает все карточки."""
+        ProductCardCache.set(1, 0, make_card(10))
+        ProductCardCache.set(2, 0, make_card(20))
+
+        ProductCardCache.invalidate()
+
+        assert ProductCardCache.get(1, 0) is None
+        assert ProductCardCache.get(2, 0) is None
+
+    @pytest.mark.parametrize("product_id", [None, 10])
+    def test_product_service_invalidate_clears_cards(self, product_id: int | None) -> None:
+        """Тест: изменение любого товара сбрасывает все карточки каталога."""
+        ProductCardCache.set(1, 0, make_card(10))
+        ProductCardCache.set(2, 0, make_card(20))
+
+        ProductService.invalidate(product_id)
+
+        assert ProductCardCache.get(1, 0) is None
+        assert ProductCardCache.get(2, 0) is None
@@ -0,0 +1,70 @@
+"""Тесты для модуля logging."""
+
+import pytest
+from structlog.testing import capture_logs
+
+from src.core import logging as app_logging
+from src.core.logging import TracebackThrottle, get_logger
+
+
+class FakeClock:
+    """Управляемая замена time.monotonic."""
+
+    def __init__(self) -> None:
+        """Инициализация часов."""
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        """Текущее время."""
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Подменить часы модуля логирования."""
+    fake = FakeClock()
+    monkeypatch.setattr(app_logging.time, "monotonic", fake)
+    return fake
+
+
+class TestTracebackThrottle:
+    """Тесты для ограничения частоты traceback."""
+
+    def test_first_occurrence_allowed(self, clock: FakeClock) -> None:
+        """Тест: первая ошибка пишется с traceback."""
+        throttle = TracebackThrottle(interval=1.0)
+        assert throttle.allow() is True
+
+    def test_repeats_inside_window_suppressed(self, clock: FakeClock) -> None:
+        """Тест: повторы внутри интервала пишутся без traceback."""
+        throttle = TracebackThrottle(interval=1.0)
+        throttle.allow()
+
+        clock.now += 0.5
+        assert throttle.allow() is False
+        clock.now += 0.4
+        assert throttle.allow() is False
+
+    def test_resumes_after_window(self, clock: FakeClock) -> None:
+        """Тест: после интервала traceback снова разрешён, окно начинается заново."""
+        throttle = TracebackThrottle(interval=1.0)
+        throttle.allow()
+
+        clock.now += 1.0
+        assert throttle.allow() is True
+        clock.now += 0.5
+        assert throttle.allow() is False
+
+    def test_exc_info_in_log_records(self, clock: FakeClock) -> None:
+        """Тест: в логе traceback есть только у первой записи в окне."""
+        throttle = TracebackThrottle(interval=1.0)
+        logger = get_logger(__name__)
+
+        with capture_logs() as records:
+            for _ in range(3):
+                try:
+                    raise RuntimeError("db down")
+                except RuntimeError as e:
+                    logger.error("Failed", error=str(e), exc_info=throttle.allow())
+
+        assert [record["exc_info"] for record in records] == [True, False, False]
@@ -0,0 +1,117 @@
+"""Тесты для подготовки паттернов модерации."""
+
+import re
+from collections import Counter
+from collections.abc import Iterator
+from unittest.mock import MagicMock
+
+import pytest
+from structlog.testing import capture_logs
+
+from src.services.moderation_service import ModerationService, compile_patterns
+from src.utils.text_analyzer import TextAnalyzer
+
+ROWS = [
+    (1, "Казино", "keyword", True),
+    (2, r"заработ\w+ от \d+", "regex", True),
+    (3, "bit.ly", "url", True),
+    (4, "([unclosed", "regex", True),
+    (5, "ставки", "keyword", True),
+    (6, r"\bt\.me/\w+", "regex", True),
+    (7, "t.me/joinchat", "url", True),
+]
+
+TEXTS = [
+    "Лучшее КАЗИНО и ставки! Пиши в t.me/casino_bot",
+    "Заработок от 5000 в день: https://bit.ly/abc",
+    "Вступай https://t.me/joinchat/xyz и http://bit.ly/1",
+    "Обычное сообщение про размеры футболки",
+    "",
+]
+
+
+def legacy_check(rows: list[tuple[int, str, str, bool]], text: str) -> tuple[int, list[str]]:
+    """Прежняя проверка: re.search по каждому паттерну на каждое сообщение."""
+    score = 0
+    matched = []
+    for _, pattern, pattern_type, _ in rows:
+        try:
+            if pattern_type == "keyword":
+                if pattern.lower() in text.lower():
+                    score += 20
+                    matched.append(f"keyword:{pattern}")
+            elif pattern_type == "regex":
+                if re.search(pattern, text, re.IGNORECASE):
+                    score += 25
+                    matched.append(f"regex:{pattern[:30]}")
+            elif pattern_type == "url":
+                for url in TextAnalyzer.extract_urls(text):
+                    if pattern in url:
+                        score += 30
+                        matched.append(f"url:{pattern}")
+        except re.error:
+            continue
+    return min(score, 100), matched
+
+
+@pytest.fixture
+def service() -> Iterator[ModerationService]:
+    """Сервис с заранее подготовленными паттернами (без БД)."""
+    ModerationService._patterns_cache = compile_patterns(ROWS)
+    yield ModerationService(MagicMock())
+    ModerationService.invalidate_patterns_cache()
+
+
+class TestCompilePatterns:
+    """Тесты для compile_patterns."""
+
+    def test_keywords_lowercased(self) -> None:
+        """Тест: ключевые слова приводятся к нижнему регистру, исходник сохраняется."""
+        patterns = compile_patterns(ROWS)
+        assert patterns.keywords == [("казино", "Казино"), ("ставки", "ставки")]
+
+    def test_regexes_compiled_case_insensitive(self) -> None:
+        """Тест: regex компилируются один раз и без учёта регистра."""
+        patterns = compile_patterns(ROWS)
+        assert [raw for _, raw in patterns.regexes] == [r"заработ\w+ от \d+", r"\bt\.me/\w+"]
+        assert all(regex.flags & re.IGNORECASE for regex, _ in patterns.regexes)
+
+    def test_invalid_regex_skipped_and_logged(self) -> None:
+        """Тест: некорректный regex пропускается с предупреждением в логе."""
+        with capture_logs() as records:
+            patterns = compile_patterns(ROWS)
+
+        assert "([unclosed" not in [raw for _, raw in patterns.regexes]
+        assert len(records) == 1
+        assert records[0]["log_level"] == "warning"
+        assert records[0]["event"].startswith("Invalid regex pattern 4:")
+
+    def test_urls(self) -> None:
+        """Тест: URL-паттерны сохраняются как подстроки."""
+        patterns = compile_patterns(ROWS)
+        assert patterns.urls == ["bit.ly", "t.me/joinchat"]
+
+
+class TestCheckSpamPatterns:
+    """Тесты совпадения результатов с прежней проверкой."""
+
+    @pytest.mark.parametrize("text", TEXTS)
+    async def test_matches_legacy_check(self, service: ModerationService, text: str) -> None:
+        """Тест: оценка и причины совпадают с прежним циклом re.search.
+
+        Причины теперь сгруппированы по типу паттерна, поэтому
+        сравниваются без учёта порядка.
+        """
+        score, matched = await service.check_spam_patterns(text)
+        legacy_score, legacy_matched = legacy_check(ROWS, text)
+
+        assert score == legacy_score
+        assert Counter(matched) == Counter(legacy_matched)
+
+    async def test_url_matching(self, service: ModerationService) -> None:
+        """Тест: URL-паттерн срабатывает на каждый подходящий URL в тексте."""
+        score, matched = await service.check_spam_patterns(
+            "https://bit.ly/a и https://bit.ly/b"
+        )
+        assert matched == ["url:bit.ly", "url:bit.ly"]
+        assert score == 60
@@ -0,0 +1,75 @@
+"""Тесты для кэша настроек."""
+
+from collections.abc import Iterator
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.database.models.bot_settings import BotSettings
+from src.services.settings_cache import SettingsCache
+
+
+def make_bot_settings(percent: str = "5") -> SimpleNamespace:
+    """Создать объект с полями настроек бота."""
+    return SimpleNamespace(
+        bonus_purchase_percent=Decimal(percent),
+        bonus_max_payment_percent=Decimal("50"),
+        bonus_min_order_amount=Decimal("0"),
+        bonus_enabled=True,
+        payment_details=None,
+        payment_instructions=None,
+        alternative_contact_username="@support",
+        min_order_amount=Decimal("0"),
+        max_items_per_order=10,
+        max_quantity_per_item=5,
+        products_per_page=5,
+        show_products_without_photos=True,
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_cache() -> Iterator[None]:
+    """Сбросить кэш до и после каждого теста."""
+    SettingsCache.invalidate()
+    yield
+    SettingsCache.invalidate()
+
+
+@pytest.fixture
+def get_settings(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Подменить загрузку настроек из БД."""
+    mock = AsyncMock(side_effect=[make_bot_settings("5"), make_bot_settings("7")])
+    monkeypatch.setattr(BotSettings, "get_settings", mock)
+    return mock
+
+
+class TestSettingsCache:
+    """Тесты для кэша настроек бота."""
+
+    async def test_cached_within_ttl(self, get_settings: AsyncMock) -> None:
+        """Тест: повторный запрос в пределах TTL не обращается к БД."""
+        first = await SettingsCache.get_bot_settings(None)
+        second = await SettingsCache.get_bot_settings(None)
+
+        assert first is second
+        assert first.bonus_purchase_percent == Decimal("5")
+        assert get_settings.await_count == 1
+
+    async def test_reload_after_ttl(self, get_settings: AsyncMock) -> None:
+        """Тест: после истечения TTL настройки загружаются заново."""
+        await SettingsCache.get_bot_settings(None)
+        reloaded = await SettingsCache.get_bot_settings(None, ttl=0)
+
+        assert reloaded.bonus_purchase_percent == Decimal("7")
+        assert get_settings.await_count == 2
+
+    async def test_invalidate(self, get_settings: AsyncMock) -> None:
+        """Тест: после invalidate() настройки загружаются заново."""
+        await SettingsCache.get_bot_settings(None)
+        SettingsCache.invalidate()
+        reloaded = await SettingsCache.get_bot_settings(None)
+
+        assert reloaded.bonus_purchase_percent == Decimal("7")
+        assert get_settings.await_count == 2
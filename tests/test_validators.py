@@ -0,0 +1,51 @@
+"""Тесты для модуля validators."""
+
+import pytest
+
+from src.core.constants import Limits
+from src.utils.validators import INVALID_CONTACT_TEXT, validate_contact
+
+
+class TestValidateContact:
+    """Тесты для проверки контакта, введённого вручную."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "+79001234567",
+            "89001234567",
+            "+7 900 123-45-67",
+            "+7 (900) 123-45-67",
+            "+7 900 123 45 67",
+        ],
+    )
+    def test_phone(self, text: str) -> None:
+        """Тест распознавания телефона с разделителями."""
+        assert validate_contact(text) == (text, "телефон")
+
+    def test_username(self) -> None:
+        """Тест распознавания username."""
+        assert validate_contact("@user_name") == ("@user_name", "username")
+
+    def test_email(self) -> None:
+        """Тест распознавания email."""
+        assert validate_contact("a-b.c@mail.ru") == ("a-b.c@mail.ru", "email")
+
+    def test_strips_whitespace(self) -> None:
+        """Тест обрезки пробелов по краям."""
+        assert validate_contact("  +79001234567 \n") == ("+79001234567", "телефон")
+
+    @pytest.mark.parametrize(
+        "text",
+        ["123456789", "+7900123456789012", "(900)1234567", "@abc", "hello", "mail@host"],
+    )
+    def test_invalid_format(self, text: str) -> None:
+        """Тест отклонения некорректного формата."""
+        with pytest.raises(ValueError) as exc_info:
+            validate_contact(text)
+        assert str(exc_info.value) == INVALID_CONTACT_TEXT
+
+    def test_too_long(self) -> None:
+        """Тест отклонения слишком длинного ввода до проверки формата."""
+        with pytest.raises(ValueError, match="Слишком длинный контакт"):
+            validate_contact("1" * (Limits.MAX_CONTACT_LENGTH + 1))